@@ -0,0 +1,285 @@
+"""
+Cache dataset JSON + index pencarian untuk viewer.py.
+
+Setiap file di-parse sekali lalu disimpan bersama index-nya; keduanya dibuang
+otomatis begitu mtime/size file berubah. Index per file:
+- inverted token map (token -> set row) untuk pencarian bebas dan per field,
+  dengan list token terurut untuk prefix match ("jungle" -> "jungler");
+- array terurut per field angka/tanggal/nama untuk filter range (bisect),
+  sort dan top-N tanpa men-scan semua record.
+
+Query lintas file memakai heapq.merge atas array terurut setiap file.
+"""
+import heapq
+import json
+import os
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
+from srt_engine.dates import DEFAULT_DATE, parse_date
+from srt_engine.normalize import get_field
+
+TEXT_FIELDS = ("name", "full_name", "team", "roles", "heros", "nation", "nation_code", "category")
+NUMBER_FIELDS = ("followers_count", "following_count", "posts_count", "views_count", "videos_count")
+DATE_FIELD = "date"
+SORT_FIELDS = ("name", DATE_FIELD) + NUMBER_FIELDS
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# path -> entry {mtime_ns, size, data, columns, index}
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def tokenize(value):
+    if isinstance(value, list):
+        value = " ".join(str(v) for v in value)
+    return _TOKEN_RE.findall(str(value).lower()) if value else []
+
+
+def _columns(data):
+    """Urutan kolom: gabungan key semua record sesuai urutan kemunculan."""
+    columns = {}
+    if isinstance(data, list):
+        for row in data:
+            if isinstance(row, dict):
+                columns.update(dict.fromkeys(row))
+    return list(columns)
+
+
+def load_dataset(file_path):
+    """Return entry cache untuk file_path; file hanya di-parse ulang jika mtime/size berubah."""
+    stat = os.stat(file_path)
+    with _cache_lock:
+        entry = _cache.get(file_path)
+    if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+        return entry
+    with open(file_path, "rb") as f:
+        data = json.loads(f.read())
+    entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "data": data, "columns": _columns(data), "index": None}
+    with _cache_lock:
+        _cache[file_path] = entry
+    return entry
+
+
+def get_index(entry):
+    """DatasetIndex untuk entry cache (dibangun saat pertama kali dibutuhkan)."""
+    index = entry["index"]
+    if index is None:
+        index = entry["index"] = DatasetIndex(entry["data"])
+    return index
+
+
+def _date_value(record):
+    parsed = parse_date(get_field(record, DATE_FIELD))
+    return None if parsed == DEFAULT_DATE else (parsed - DEFAULT_DATE).total_seconds()
+
+
+def date_param(value):
+    """String tanggal dari query ("2022", "2022-06-01") -> nilai yang sama dengan index."""
+    if re.fullmatch(r"\d{4}", value.strip()):
+        value = f"{value.strip()}-01-01"
+    parsed = parse_date(value)
+    if parsed == DEFAULT_DATE:
+        raise ValueError(f"Tanggal tidak dikenal: {value}")
+    return (parsed - DEFAULT_DATE).total_seconds()
+
+
+class DatasetIndex:
+    def __init__(self, data):
+        rows = data if isinstance(data, list) else []
+        # Hanya record dict yang diindex; row id = posisi di file asli
+        self.row_ids = [row_id for row_id, record in enumerate(rows) if isinstance(record, dict)]
+        self.size = len(self.row_ids)
+        self.tokens = {}
+        self.field_tokens = {field: {} for field in TEXT_FIELDS}
+        # field -> (keys terurut, row id sesuai urutan keys); record tanpa nilai tidak masuk
+        self.sorted = {}
+        values = {field: [] for field in SORT_FIELDS}
+        for row_id in self.row_ids:
+            record = rows[row_id]
+            for field in TEXT_FIELDS:
+                field_map = self.field_tokens[field]
+                for token in tokenize(get_field(record, field)):
+                    field_map.setdefault(token, set()).add(row_id)
+                    self.tokens.setdefault(token, set()).add(row_id)
+            name = get_field(record, "name") or get_field(record, "full_name")
+            if name:
+                values["name"].append((str(name).lower(), row_id))
+            date_value = _date_value(record)
+            if date_value is not None:
+                values[DATE_FIELD].append((date_value, row_id))
+            for field in NUMBER_FIELDS:
+                number = get_field(record, field, None)
+                if isinstance(number, (int, float)) and not isinstance(number, bool):
+                    values[field].append((number, row_id))
+        for field, pairs in values.items():
+            pairs.sort()
+            self.sorted[field] = ([key for key, _ in pairs], [row_id for _, row_id in pairs])
+        self.token_list = sorted(self.tokens)
+        self.field_token_lists = {field: sorted(tokens) for field, tokens in self.field_tokens.items()}
+
+    def _prefix_ids(self, token_map, token_list, prefix):
+        ids = set()
+        for i in range(bisect_left(token_list, prefix), len(token_list)):
+            token = token_list[i]
+            if not token.startswith(prefix):
+                break
+            ids |= token_map[token]
+        return ids
+
+    def match_text(self, text, field=None):
+        """Row id yang memuat semua token text (prefix match), di semua field atau satu field."""
+        if field is None:
+            token_map, token_list = self.tokens, self.token_list
+        else:
+            token_map, token_list = self.field_tokens[field], self.field_token_lists[field]
+        result = None
+        for token in tokenize(text):
+            ids = self._prefix_ids(token_map, token_list, token)
+            result = ids if result is None else result & ids
+            if not result:
+                return set()
+        return result
+
+    def match_range(self, field, low=None, high=None):
+        keys, ids = self.sorted[field]
+        start = 0 if low is None else bisect_left(keys, low)
+        stop = len(keys) if high is None else bisect_right(keys, high)
+        return set(ids[start:stop])
+
+    def ordered(self, candidates, field, descending=False):
+        """
+        Generator (key, row_id) untuk candidates (None = semua) urut menurut field;
+        key yang sama selalu urut row id naik (juga saat descending, sesuai sort key
+        di _file_stream untuk heapq.merge). Record tanpa nilai field menyusul di
+        akhir, urut row id.
+        """
+        keys, ids = self.sorted[field]
+        positions = _descending_positions(keys) if descending else range(len(keys))
+        seen = set()
+        for i in positions:
+            row_id = ids[i]
+            if candidates is None or row_id in candidates:
+                seen.add(row_id)
+                yield keys[i], row_id
+        rest = self.row_ids if candidates is None else sorted(candidates)
+        for row_id in rest:
+            if row_id not in seen:
+                yield None, row_id
+
+
+def _descending_positions(keys):
+    """Posisi keys (terurut naik) dari key terbesar; dalam satu run key yang sama tetap maju."""
+    end = len(keys)
+    while end > 0:
+        start = bisect_left(keys, keys[end - 1], 0, end)
+        yield from range(start, end)
+        end = start
+
+
+def parse_query(params):
+    """
+    Query string -> dict query. Parameter:
+        q=teks bebas (semua token harus ada, prefix match)
+        <field>=teks untuk field di TEXT_FIELDS (mis. team=rrq, roles=jungle)
+        min_<field>/max_<field> untuk field angka, date_after/date_before untuk tanggal
+        sort=<field> atau sort=-<field> (menurun), limit, offset
+    """
+    query = {"q": params.get("q", ""), "text": {}, "ranges": {}, "sort": None, "descending": False}
+    for field in TEXT_FIELDS:
+        if params.get(field):
+            query["text"][field] = params[field]
+    for field in NUMBER_FIELDS:
+        low, high = params.get(f"min_{field}"), params.get(f"max_{field}")
+        if low or high:
+            query["ranges"][field] = (float(low) if low else None, float(high) if high else None)
+    after, before = params.get("date_after"), params.get("date_before")
+    if after or before:
+        query["ranges"][DATE_FIELD] = (date_param(after) if after else None, date_param(before) if before else None)
+    sort = params.get("sort", "")
+    if sort:
+        query["descending"] = sort.startswith("-")
+        query["sort"] = sort.lstrip("-")
+        if query["sort"] not in SORT_FIELDS:
+            raise ValueError(f"Sort tidak dikenal: {query['sort']} (pilihan: {', '.join(SORT_FIELDS)})")
+    query["limit"] = max(0, min(int(params.get("limit", 50)), 1000))
+    query["offset"] = max(0, int(params.get("offset", 0)))
+    return query
+
+
+def _candidates(index, query):
+    result = None
+    if query["q"]:
+        result = index.match_text(query["q"])
+    for field, text in query["text"].items():
+        ids = index.match_text(text, field)
+        result = ids if result is None else result & ids
+    for field, (low, high) in query["ranges"].items():
+        ids = index.match_range(field, low, high)
+        result = ids if result is None else result & ids
+    return result
+
+
+def _file_stream(file_name, index, candidates, query):
+    """Generator (sort_key, row_id) untuk satu file; sort_key bisa dibandingkan lintas file."""
+    field = query["sort"]
+    if field is None:
+        rows = index.row_ids if candidates is None else sorted(candidates)
+        for row_id in rows:
+            yield (0, file_name, row_id), row_id
+        return
+    for key, row_id in index.ordered(candidates, field, query["descending"]):
+        if key is None:
+            sort_key = (1, 0, file_name, row_id)
+        else:
+            # Nilai dibalik untuk urutan menurun agar heapq.merge tetap ascending
+            sort_key = (0, (-key if isinstance(key, (int, float)) else _Reversed(key)) if query["descending"] else key,
+                        file_name, row_id)
+        yield sort_key, row_id
+
+
+class _Reversed:
+    """Pembungkus string untuk urutan menurun di heapq.merge."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return self.value > other.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def _tagged(stream, file_name, entry):
+    for key, row_id in stream:
+        yield key, file_name, entry, row_id
+
+
+def search(datasets, query):
+    """
+    datasets: list (nama_file, entry cache). Return (total, results) dengan results
+    berisi record asli + "_file" dan "_row", urut sesuai query dan dipotong limit/offset.
+    """
+    streams = []
+    total = 0
+    for file_name, entry in datasets:
+        if not isinstance(entry["data"], list):
+            continue
+        index = get_index(entry)
+        candidates = _candidates(index, query)
+        if candidates is not None and not candidates:
+            continue
+        total += index.size if candidates is None else len(candidates)
+        streams.append(_tagged(_file_stream(file_name, index, candidates, query), file_name, entry))
+    merged = heapq.merge(*streams, key=lambda item: item[0])
+    results = []
+    for _, file_name, entry, row_id in islice(merged, query["offset"], query["offset"] + query["limit"]):
+        record = entry["data"][row_id]
+        results.append({**record, "_file": file_name, "_row": row_id})
+    return total, results
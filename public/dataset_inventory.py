@@ -0,0 +1,285 @@
+"""
+Inventory dataset JSON (pengganti counting_field.py).
+
+Setiap file JSON di folder kategori di-parse paralel (thread/process pool) dan
+diringkas per field: berapa record yang punya key tersebut, berapa yang kosong
+(null/""/[]) dan berapa yang berisi placeholder "no data", plus alias mana yang
+dipakai dibanding FIELD_ALIASES dan key yang tidak dikenal. Hasil per file
+disimpan di manifest (mtime + size), jadi file yang tidak berubah tidak di-parse ulang.
+
+Contoh (jalankan dari folder public/):
+    python dataset_inventory.py
+    python dataset_inventory.py gaming youtube --json inventory.json --csv inventory.csv
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+from srt_engine.config import CACHE_FOLDER
+from srt_engine.normalize import FIELD_ALIASES
+from srt_engine.profiles import CATEGORY_PROFILES
+
+INVENTORY_MANIFEST = os.path.join(CACHE_FOLDER, "inventory.json")
+TEXT_REPORT = "counting_field.txt"
+# Naikkan jika isi statistik per file berubah agar manifest lama diabaikan
+INVENTORY_VERSION = 1
+
+ALIAS_TO_FIELD = {alias: field for field, aliases in FIELD_ALIASES.items() for alias in aliases}
+
+
+def list_dataset_files(folders):
+    """Semua *.json di folders (rekursif), urut per path."""
+    files = []
+    for folder in folders:
+        for root, dirs, names in os.walk(folder):
+            dirs.sort()
+            files.extend(os.path.join(root, name) for name in sorted(names) if name.endswith(".json"))
+    return files
+
+
+def _is_no_data(value):
+    if isinstance(value, str):
+        return value.strip().lower() == "no data"
+    if isinstance(value, list) and value:
+        return all(_is_no_data(item) for item in value)
+    return False
+
+
+def field_stats(data):
+    """Statistik satu dataset: jumlah item/record dan per key present/null/no_data."""
+    items = data if isinstance(data, list) else [data]
+    fields = {}
+    records = 0
+    for record in items:
+        if not isinstance(record, dict):
+            continue
+        records += 1
+        for key, value in record.items():
+            stats = fields.get(key)
+            if stats is None:
+                stats = fields[key] = {"present": 0, "null": 0, "no_data": 0}
+            stats["present"] += 1
+            if value is None or value == "" or value == []:
+                stats["null"] += 1
+            elif _is_no_data(value):
+                stats["no_data"] += 1
+    return {
+        "top_level": "list" if isinstance(data, list) else type(data).__name__,
+        "items": len(items),
+        "records": records,
+        "fields": fields,
+    }
+
+
+def scan_file(path):
+    """Parse satu file dan return entry inventory (error dicatat, tidak di-raise)."""
+    # mtime/size None = file hilang/tidak terbaca, jadi entry tidak pernah dianggap fresh
+    entry = {"path": path, "mtime_ns": None, "size": None, "version": INVENTORY_VERSION}
+    try:
+        stat = os.stat(path)
+        entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        with open(path, "rb") as f:
+            entry.update(field_stats(json.loads(f.read())), error=None)
+    except (OSError, ValueError) as e:
+        entry.update(top_level=None, items=0, records=0, fields={}, error=f"{type(e).__name__}: {e}")
+    return entry
+
+
+def load_manifest(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(path, entries):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entries, f, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _is_fresh(previous, path):
+    if not previous or previous.get("version") != INVENTORY_VERSION:
+        return False
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return False
+    return previous.get("mtime_ns") == stat.st_mtime_ns and previous.get("size") == stat.st_size
+
+
+def run_inventory(files, workers=None, executor="process", manifest_path=INVENTORY_MANIFEST, force=False):
+    """
+    Scan files; return (entries, parsed) dengan entries urut sesuai files dan
+    parsed = jumlah file yang benar-benar di-parse (sisanya dari manifest).
+    """
+    previous = {} if manifest_path is None else load_manifest(manifest_path)
+    entries = {}
+    todo = []
+    for path in files:
+        key = os.path.normpath(path)
+        if not force and _is_fresh(previous.get(key), path):
+            entries[key] = previous[key]
+        else:
+            todo.append(path)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(todo) <= 1:
+        scanned = [scan_file(path) for path in todo]
+    else:
+        # Import di sini: pool hanya dibutuhkan jika ada banyak file berubah
+        if executor == "thread":
+            from concurrent.futures import ThreadPoolExecutor as Executor
+        else:
+            from concurrent.futures import ProcessPoolExecutor as Executor
+        with Executor(max_workers=min(workers, len(todo))) as pool:
+            scanned = list(pool.map(scan_file, todo))
+    for entry in scanned:
+        entries[os.path.normpath(entry["path"])] = entry
+    if manifest_path is not None:
+        # File yang sudah tidak ada ikut terbuang dari manifest
+        save_manifest(manifest_path, {os.path.normpath(p): entries[os.path.normpath(p)] for p in files})
+    return [entries[os.path.normpath(path)] for path in files], len(todo)
+
+
+def summarize(entries):
+    """
+    Ringkasan lintas file: per key (frekuensi, rate kosong / "no data", jumlah file),
+    pemakaian alias per field kanonik dan key yang tidak ada di FIELD_ALIASES.
+    """
+    keys = {}
+    records = 0
+    for entry in entries:
+        records += entry["records"]
+        for key, stats in entry["fields"].items():
+            total = keys.get(key)
+            if total is None:
+                total = keys[key] = {"present": 0, "null": 0, "no_data": 0, "files": 0}
+            total["present"] += stats["present"]
+            total["null"] += stats["null"]
+            total["no_data"] += stats["no_data"]
+            total["files"] += 1
+    for key, total in keys.items():
+        total["field"] = ALIAS_TO_FIELD.get(key)
+        total["frequency"] = total["present"] / records if records else 0.0
+        total["null_rate"] = total["null"] / total["present"]
+        total["no_data_rate"] = total["no_data"] / total["present"]
+    aliases = {}
+    for field, names in FIELD_ALIASES.items():
+        aliases[field] = {name: keys[name]["present"] for name in names if name in keys}
+    return {
+        "files": len(entries),
+        "errors": sum(1 for entry in entries if entry["error"]),
+        "items": sum(entry["items"] for entry in entries),
+        "records": records,
+        "keys": dict(sorted(keys.items(), key=lambda item: (-item[1]["present"], item[0]))),
+        "aliases": aliases,
+        "unknown_keys": sorted(key for key in keys if key not in ALIAS_TO_FIELD),
+    }
+
+
+def write_text_report(entries, output_file=TEXT_REPORT):
+    """Format lama counting_field.txt: satu baris per file (jumlah item dan key unik)."""
+    with open(output_file, "w", encoding="utf-8") as f:
+        for entry in entries:
+            if entry["error"]:
+                f.write(f"{entry['path']}: error ({entry['error']})\n")
+            else:
+                f.write(f"{entry['path']}: {entry['items']} items, {len(entry['fields'])} fields\n")
+
+
+def write_json_report(entries, summary, output_file):
+    report = {"summary": summary, "files": entries}
+    if output_file == "-":
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+        return
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+CSV_COLUMNS = ["path", "key", "field", "records", "present", "null", "no_data", "frequency", "null_rate", "no_data_rate"]
+
+
+def write_csv_report(entries, output_file):
+    """Satu baris per (file, key)."""
+    f = sys.stdout if output_file == "-" else open(output_file, "w", encoding="utf-8", newline="")
+    try:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        for entry in entries:
+            for key, stats in sorted(entry["fields"].items()):
+                present = stats["present"]
+                writer.writerow([
+                    entry["path"], key, ALIAS_TO_FIELD.get(key, ""), entry["records"], present,
+                    stats["null"], stats["no_data"],
+                    f"{present / entry['records']:.4f}" if entry["records"] else "0",
+                    f"{stats['null'] / present:.4f}", f"{stats['no_data'] / present:.4f}",
+                ])
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+
+def print_inventory(entries, summary, parsed, elapsed):
+    for entry in entries:
+        if entry["error"]:
+            print(f"❌ {entry['path']}: {entry['error']}")
+    print(f"📦 {summary['files']} files ({parsed} parsed, {summary['files'] - parsed} unchanged), "
+          f"{summary['records']} records, {len(summary['keys'])} keys, {summary['errors']} errors in {elapsed:.2f}s")
+    print("🔑 Alias usage:")
+    for field, used in summary["aliases"].items():
+        if used:
+            print(f"   - {field}: " + ", ".join(f"{name} ({count})" for name, count in used.items()))
+    if summary["unknown_keys"]:
+        print(f"❔ Keys outside FIELD_ALIASES: {', '.join(summary['unknown_keys'])}")
+    noisy = [(key, stats) for key, stats in summary["keys"].items() if stats["null"] or stats["no_data"]]
+    if noisy:
+        print("🕳  Empty / \"no data\" rates:")
+        for key, stats in noisy:
+            print(f"   - {key}: {stats['null_rate']:.1%} empty, {stats['no_data_rate']:.1%} \"no data\" "
+                  f"({stats['present']} values)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Audit JSON dataset fields")
+    parser.add_argument("folders", nargs="*", help="Folders to scan recursively (default: every category folder)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Pool size; 1 runs sequentially")
+    parser.add_argument("--executor", choices=["process", "thread"], default="process", help="Pool type")
+    parser.add_argument("--manifest", default=INVENTORY_MANIFEST,
+                        help=f"mtime+size manifest of scanned files (default: {INVENTORY_MANIFEST})")
+    parser.add_argument("--force", action="store_true", help="Re-parse every file")
+    parser.add_argument("--json", metavar="FILE", help="Write the full report as JSON (- for stdout)")
+    parser.add_argument("--csv", metavar="FILE", help="Write per-file field stats as CSV (- for stdout)")
+    parser.add_argument("--txt", metavar="FILE", default=TEXT_REPORT, help=f"Per-file summary (default: {TEXT_REPORT})")
+    parser.add_argument("--quiet", action="store_true", help="Do not print the summary")
+    args = parser.parse_args(argv)
+
+    folders = [folder for folder in args.folders or CATEGORY_PROFILES if os.path.isdir(folder)]
+    for folder in args.folders:
+        if folder not in folders:
+            print(f"Folder {folder} tidak ditemukan.", file=sys.stderr)
+    started = time.perf_counter()
+    entries, parsed = run_inventory(
+        list_dataset_files(folders), args.workers, args.executor, args.manifest, args.force
+    )
+    summary = summarize(entries)
+    if args.txt:
+        write_text_report(entries, args.txt)
+    if args.json:
+        write_json_report(entries, summary, args.json)
+    if args.csv:
+        write_csv_report(entries, args.csv)
+    if not args.quiet and "-" not in (args.json, args.csv):
+        print_inventory(entries, summary, parsed, time.perf_counter() - started)
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
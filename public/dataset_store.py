@@ -0,0 +1,467 @@
+"""
+Dataset store kolumnar untuk semua kategori (public/<kategori>/*.json).
+
+Setiap file dibaca sekali lalu disimpan per kolom, bukan sebagai list dict:
+- angka (followers_count, views_count, videos_count, ...) sebagai array float64
+  NumPy, NaN untuk nilai kosong;
+- tanggal sebagai epoch milidetik (float64, NaN jika kosong/invalid) dengan
+  semantik new Date() yang sama seperti date_ms di render plan; setiap string
+  tanggal unik di-parse sekali;
+- name, full_name, team, nation, nation_code dan category sebagai kolom string
+  ter-intern: array code int32 + vocabulary yang dipakai bersama semua file,
+  jadi filter dan group by cukup membandingkan integer.
+
+Ranking, top-N, filter, humanize (format_number) dan agregasi lintas negara
+berjalan sebagai operasi array, tanpa loop Python per record. load_store dan CLI
+membuang duplikat secara default (DatasetStore.latest): ig-xx.json dan
+ig-xx_updated.json berisi akun yang sama, jadi tanpa itu total per negara dobel.
+Hanya file dengan versi _updated-nya yang digabung (row dari _updated yang
+dipakai); akun yang sama di file/negara lain tetap dihitung di file masing-masing.
+
+Contoh (jalankan dari folder public/):
+    python dataset_store.py top followers_count -n 10
+    python dataset_store.py top views_count --category youtube --by nation_code -n 3
+    python dataset_store.py countries followers_count --category instagram
+    python dataset_store.py top followers_count --keep-duplicates
+    python dataset_store.py countries views_count --how mean --by nation
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from srt_engine.dates import js_timestamp
+from srt_engine.engine import list_json_files
+from srt_engine.normalize import FIELD_ALIASES, clean_text, compile_plan
+from srt_engine.profiles import CATEGORY_PROFILES
+from srt_engine.schema import is_number
+
+STRING_FIELDS = ("name", "full_name", "team", "nation", "nation_code")
+COUNT_FIELDS = ("followers_count", "following_count", "posts_count", "views_count", "videos_count", "liked_count")
+DATE_FIELD = "date"
+# Kolom selain STRING_FIELDS yang bisa dipakai untuk filter/group by
+GROUP_FIELDS = STRING_FIELDS + ("category", "file")
+# ig-xx_updated.json menggantikan ig-xx.json (lihat DatasetStore.latest)
+UPDATED_SUFFIX = "_updated"
+AGGREGATIONS = ("sum", "mean", "max", "min", "count")
+
+# Sama dengan ambang format_number (srt_engine.profiles)
+_SCALES = np.array([1_000, 1_000_000, 1_000_000_000], dtype=np.float64)
+_SUFFIXES = np.array(["", "K", "M", "B"])
+
+
+def humanize(values):
+    """
+    format_number versi array: 1234 -> "1.2K", 5_600_000 -> "5.6M", NaN -> "".
+    Nilai bulat di bawah 1000 ditulis sebagai integer (count dari JSON selalu int).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    missing = np.isnan(values)
+    safe = np.where(missing, 0.0, values)
+    tier = np.searchsorted(_SCALES, safe, side="right")
+    scaled = safe / np.concatenate(([1.0], _SCALES))[tier]
+    small = tier == 0
+    whole = small & (safe == np.floor(safe))
+    text = np.where(small, np.char.mod("%s", safe), np.char.mod("%.1f", scaled))
+    text = np.where(whole, np.char.mod("%d", np.where(whole, safe, 0).astype(np.int64)), text)
+    text = np.char.add(text, _SUFFIXES[tier])
+    return np.where(missing, "", text)
+
+
+class Vocabulary:
+    """String unik -> code int32 (stabil, urut kemunculan); dipakai bersama semua kolom sejenis."""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def intern(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(sys.intern(value))
+        return code
+
+    def lookup(self, value):
+        """Code untuk value, -1 jika tidak ada di vocabulary."""
+        return self.codes.get(value, -1)
+
+
+class StringColumn:
+    """Kolom string ter-intern: codes int32 per row (-1 = kosong) + Vocabulary."""
+
+    def __init__(self, codes, vocabulary):
+        self.codes = codes
+        self.vocabulary = vocabulary
+
+    def __len__(self):
+        return len(self.codes)
+
+    def take(self, rows):
+        return StringColumn(self.codes[rows], self.vocabulary)
+
+    def isin(self, values):
+        """Mask row yang nilainya salah satu values."""
+        if isinstance(values, str):
+            values = [values]
+        wanted = [code for code in (self.vocabulary.lookup(v) for v in values) if code >= 0]
+        return np.isin(self.codes, np.array(wanted, dtype=np.int32))
+
+    def decode(self, rows=None):
+        codes = self.codes if rows is None else self.codes[rows]
+        values = self.vocabulary.values
+        return [values[code] if code >= 0 else "" for code in codes.tolist()]
+
+
+def _normalize_string(field, value):
+    text = clean_text(value)
+    return text.lower() if field == "nation_code" else text
+
+
+class _ColumnBuilder:
+    """Mengumpulkan kolom dari banyak file sebelum dijadikan array sekali."""
+
+    def __init__(self):
+        self.vocabularies = {field: Vocabulary() for field in STRING_FIELDS + ("category", DATE_FIELD)}
+        self.strings = {field: [] for field in STRING_FIELDS + ("category", DATE_FIELD)}
+        self.counts = {field: [] for field in COUNT_FIELDS}
+        self.files = []
+        self.file_ids = []
+        self.rows = []
+
+    def _intern_column(self, field, values):
+        """Intern satu kolom; clean_text hanya dijalankan sekali per string mentah unik."""
+        vocabulary = self.vocabularies[field]
+        seen = {}
+        codes = []
+        for value in values:
+            if not value or not isinstance(value, str):
+                codes.append(-1)
+                continue
+            code = seen.get(value)
+            if code is None:
+                text = value if field == DATE_FIELD else _normalize_string(field, value)
+                code = seen[value] = vocabulary.intern(text) if text else -1
+            codes.append(code)
+        return codes
+
+    def add_file(self, path, data, category):
+        items = [item for item in data if isinstance(item, dict)] if isinstance(data, list) else []
+        keys = set()
+        for item in items:
+            keys.update(item)
+        plan = compile_plan(frozenset(keys))
+        # Hanya record yang juga diterima normalizer (punya name/full_name)
+        rows = [i for i, item in enumerate(data if isinstance(data, list) else [])
+                if isinstance(item, dict) and plan.accepts(item)]
+        records = [data[i] for i in rows]
+        file_id = len(self.files)
+        self.files.append(path)
+        self.file_ids.extend([file_id] * len(records))
+        self.rows.extend(rows)
+        self.strings["category"].extend(self._intern_column("category", [category] * len(records)))
+        for field in STRING_FIELDS + (DATE_FIELD,):
+            sources = [alias for alias in FIELD_ALIASES.get(field, [field]) if alias in keys]
+            values = [next((record[s] for s in sources if record.get(s)), None) for record in records]
+            self.strings[field].extend(self._intern_column(field, values))
+        for field in COUNT_FIELDS:
+            sources = [alias for alias in FIELD_ALIASES.get(field, [field]) if alias in keys]
+            column = self.counts[field]
+            for record in records:
+                value = next((record[s] for s in sources if is_number(record.get(s))), None)
+                column.append(np.nan if value is None else value)
+        return len(records)
+
+    def build(self):
+        strings = {field: StringColumn(np.array(codes, dtype=np.int32), self.vocabularies[field])
+                   for field, codes in self.strings.items()}
+        dates = strings.pop(DATE_FIELD)
+        # Setiap string tanggal unik di-parse sekali, lalu disebar ke row lewat code
+        parsed = [js_timestamp(value) for value in dates.vocabulary.values]
+        timestamps = np.array([np.nan if t is None else t for t in parsed] + [np.nan], dtype=np.float64)
+        return DatasetStore(
+            files=list(self.files),
+            file_ids=np.array(self.file_ids, dtype=np.int32),
+            rows=np.array(self.rows, dtype=np.int32),
+            strings=strings,
+            counts={field: np.array(values, dtype=np.float64) for field, values in self.counts.items()},
+            date_ms=timestamps[dates.codes],
+        )
+
+
+class DatasetStore:
+    """
+    Kumpulan row dari satu atau banyak file dalam bentuk kolom. Row ke-i adalah
+    record ke rows[i] di files[file_ids[i]]. take()/filter() mengembalikan store
+    baru dengan vocabulary yang sama, jadi code tetap bisa dibandingkan.
+    """
+
+    def __init__(self, files, file_ids, rows, strings, counts, date_ms):
+        self.files = files
+        self.file_ids = file_ids
+        self.rows = rows
+        self.strings = strings
+        self.counts = counts
+        self.date_ms = date_ms
+
+    def __len__(self):
+        return len(self.rows)
+
+    # --- Akses kolom --------------------------------------------------------
+
+    def numeric(self, field):
+        """Array float64 untuk field angka atau "date" (epoch ms); NaN = kosong."""
+        if field == DATE_FIELD:
+            return self.date_ms
+        if field not in self.counts:
+            raise ValueError(f"Unknown numeric field '{field}' (available: {', '.join(COUNT_FIELDS + (DATE_FIELD,))})")
+        return self.counts[field]
+
+    def group_codes(self, field):
+        """(codes int per row, label per code) untuk field string, "category" atau "file"."""
+        if field == "file":
+            return self.file_ids, self.files
+        if field not in self.strings:
+            raise ValueError(f"Unknown group field '{field}' (available: {', '.join(GROUP_FIELDS)})")
+        column = self.strings[field]
+        return column.codes, column.vocabulary.values
+
+    def take(self, rows):
+        """Store baru berisi rows (array index atau mask boolean)."""
+        return DatasetStore(
+            files=self.files,
+            file_ids=self.file_ids[rows],
+            rows=self.rows[rows],
+            strings={field: column.take(rows) for field, column in self.strings.items()},
+            counts={field: values[rows] for field, values in self.counts.items()},
+            date_ms=self.date_ms[rows],
+        )
+
+    def records(self, rows=None, fields=("name", "nation_code", "followers_count")):
+        """List dict untuk ditampilkan (hanya dipakai untuk hasil akhir yang kecil)."""
+        rows = np.arange(len(self)) if rows is None else np.asarray(rows)
+        columns = {}
+        for field in fields:
+            if field in self.strings or field == "file":
+                codes, labels = self.group_codes(field)
+                columns[field] = [labels[code] if code >= 0 else "" for code in codes[rows].tolist()]
+            else:
+                values = self.numeric(field)[rows]
+                columns[field] = [None if np.isnan(v) else v for v in values.tolist()]
+        return [dict(zip(columns, values)) for values in zip(*columns.values())] if columns else []
+
+    # --- Filter -------------------------------------------------------------
+
+    def mask(self, ranges=None, **equals):
+        """
+        Mask boolean. equals: field=nilai atau list nilai untuk field string,
+        category atau file (path). ranges: {field: (low, high)} untuk angka/tanggal,
+        batas None = terbuka; row dengan nilai kosong tidak lolos.
+        """
+        result = np.ones(len(self), dtype=bool)
+        for field, wanted in equals.items():
+            if field == "file":
+                wanted = [wanted] if isinstance(wanted, str) else wanted
+                ids = [i for i, path in enumerate(self.files) if path in wanted]
+                result &= np.isin(self.file_ids, np.array(ids, dtype=np.int32))
+            elif field in self.strings:
+                result &= self.strings[field].isin(wanted)
+            else:
+                raise ValueError(f"Unknown filter field '{field}' (available: {', '.join(GROUP_FIELDS)})")
+        for field, (low, high) in (ranges or {}).items():
+            values = self.numeric(field)
+            result &= ~np.isnan(values)
+            if low is not None:
+                result &= values >= low
+            if high is not None:
+                result &= values <= high
+        return result
+
+    def filter(self, ranges=None, **equals):
+        return self.take(self.mask(ranges, **equals))
+
+    def latest(self, keys=("name",)):
+        """
+        Buang duplikat antara file dan versi _updated-nya (ig-bd.json dan
+        ig-bd_updated.json): per file + keys hanya row dari file _updated yang
+        dipertahankan (dalam satu file: row terakhir). Akun yang sama di file lain
+        (mis. youtube/india.json dan youtube/youtube-example.json) tidak disentuh.
+        """
+        if not len(self):
+            return self
+        twins, twin_ids, updated = {}, [], []
+        for path in self.files:
+            stem, ext = os.path.splitext(path)
+            base = stem[:-len(UPDATED_SUFFIX)] if stem.endswith(UPDATED_SUFFIX) else stem
+            twin_ids.append(twins.setdefault(base + ext, len(twins)))
+            updated.append(stem.endswith(UPDATED_SUFFIX))
+        twin_ids = np.array(twin_ids, dtype=np.int32)[self.file_ids]
+        # Row file _updated diletakkan setelah row file aslinya (sort stabil), lalu
+        # np.unique di array yang dibalik mengambil kemunculan terakhir per key
+        priority = np.argsort(np.array(updated, dtype=np.int8)[self.file_ids], kind="stable")
+        codes = np.stack([twin_ids] + [self.group_codes(key)[0] for key in keys], axis=1)[priority]
+        _, first = np.unique(codes[::-1], axis=0, return_index=True)
+        return self.take(np.sort(priority[len(self) - 1 - first]))
+
+    # --- Ranking ------------------------------------------------------------
+
+    def _ordered(self, field, by=None, descending=True):
+        """
+        Row dengan nilai field terurut per grup (tie: urutan row). Return
+        (order, posisi dalam grup, rank kompetisi "1224" dalam grup), semuanya 0-based
+        relatif terhadap order.
+        """
+        values = self.numeric(field)
+        groups = np.zeros(len(self), dtype=np.int32) if by is None else self.group_codes(by)[0]
+        keys = -values if descending else values
+        valid = np.flatnonzero(~np.isnan(values))
+        order = valid[np.lexsort((keys[valid], groups[valid]))]
+        if not len(order):
+            empty = np.zeros(0, dtype=np.int64)
+            return order, empty, empty
+        sorted_groups, sorted_keys = groups[order], keys[order]
+        position = np.arange(len(order))
+        new_group = np.concatenate(([True], sorted_groups[1:] != sorted_groups[:-1]))
+        new_value = new_group | np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+        group_start = np.maximum.accumulate(np.where(new_group, position, 0))
+        tie_start = np.maximum.accumulate(np.where(new_value, position, 0))
+        return order, position - group_start, tie_start - group_start
+
+    def rank(self, field, by=None, descending=True):
+        """Rank kompetisi per row (1 = terbesar jika descending), per grup by; 0 jika nilai kosong."""
+        order, _, ranks = self._ordered(field, by, descending)
+        result = np.zeros(len(self), dtype=np.int64)
+        result[order] = ranks + 1
+        return result
+
+    def top(self, field, n=10, by=None, descending=True):
+        """Index row top-n menurut field (per grup by), urut grup lalu peringkat."""
+        order, position, _ = self._ordered(field, by, descending)
+        return order[position < n]
+
+    # --- Agregasi -----------------------------------------------------------
+
+    def aggregate(self, field, by="nation_code", how="sum"):
+        """
+        Agregasi field per grup by dalam satu pass bincount/ufunc.at.
+        Row tanpa grup atau tanpa nilai diabaikan. Return (labels, values, counts)
+        urut dari nilai terbesar.
+        """
+        if how not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation '{how}' (available: {', '.join(AGGREGATIONS)})")
+        groups, labels = self.group_codes(by)
+        values = self.numeric(field)
+        valid = (groups >= 0) & ~np.isnan(values)
+        codes, values = groups[valid], values[valid]
+        counts = np.bincount(codes, minlength=len(labels))
+        if how in ("sum", "mean"):
+            result = np.bincount(codes, weights=values, minlength=len(labels))
+            if how == "mean":
+                result = result / np.maximum(counts, 1)
+        elif how == "count":
+            result = counts.astype(np.float64)
+        else:
+            result = np.full(len(labels), np.nan)
+            (np.fmax if how == "max" else np.fmin).at(result, codes, values)
+        present = np.flatnonzero(counts)
+        present = present[np.lexsort((present, -result[present]))]
+        return [labels[code] for code in present.tolist()], result[present], counts[present]
+
+
+def load_files(paths, categories=None):
+    """
+    DatasetStore dari list path JSON. categories: kategori per path (default nama
+    folder). File yang gagal dibaca dilewati dengan peringatan.
+    """
+    builder = _ColumnBuilder()
+    for i, path in enumerate(paths):
+        category = categories[i] if categories else os.path.basename(os.path.dirname(os.path.abspath(path)))
+        try:
+            with open(path, "rb") as f:
+                data = json.loads(f.read())
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Skip {path}: {e}")
+            continue
+        builder.add_file(path, data, category)
+    return builder.build()
+
+
+def load_store(categories=None, base_dir=".", latest=True):
+    """
+    DatasetStore untuk semua *.json di folder kategori (default semua CATEGORY_PROFILES).
+    latest=True menyisakan satu row per name antara file dan versi _updated-nya
+    (lihat DatasetStore.latest).
+    """
+    paths, labels = [], []
+    for category in categories or CATEGORY_PROFILES:
+        folder = os.path.join(base_dir, category)
+        if not os.path.isdir(folder):
+            continue
+        for name in list_json_files(folder):
+            paths.append(os.path.normpath(os.path.join(folder, name)))
+            labels.append(category)
+    store = load_files(paths, labels)
+    return store.latest() if latest else store
+
+
+def _print_top(store, args):
+    rows = store.top(args.field, args.n, by=args.by)
+    ranks = store.rank(args.field, by=args.by)[rows]
+    if args.field == DATE_FIELD:
+        shown = [time.strftime("%Y-%m-%d", time.gmtime(ms / 1000)) for ms in store.date_ms[rows].tolist()]
+    else:
+        shown = humanize(store.numeric(args.field)[rows])
+    fields = ("name", "nation_code", "category") + ((args.by,) if args.by else ())
+    for rank, value, record in zip(ranks, shown, store.records(rows, fields)):
+        group = f"[{record[args.by] or '-'}] " if args.by else ""
+        place = f"{record['category']}/{record['nation_code'] or '-'}"
+        print(f"{group}#{rank:<4} {record['name']:<32} {value:>10}  {place}")
+
+
+def _print_countries(store, args):
+    labels, values, counts = store.aggregate(args.field, by=args.by, how=args.how)
+    shown = humanize(values) if args.how != "count" else values.astype(np.int64).astype(str)
+    for label, value, count in list(zip(labels, shown, counts))[:args.n]:
+        print(f"🌍 {label:<24} {value:>8}  ({count} records)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank and aggregate every category dataset as NumPy columns")
+    parser.add_argument("command", choices=("top", "countries"), help="top: ranking, countries: aggregate per group")
+    parser.add_argument("field", help=f"Numeric field ({', '.join(COUNT_FIELDS + (DATE_FIELD,))})")
+    parser.add_argument("--category", action="append", help="Category folder (repeatable; default: all)")
+    parser.add_argument("--nation", action="append", help="Only rows with this nation_code (repeatable)")
+    parser.add_argument("--min", type=float, help="Only rows with field >= MIN")
+    parser.add_argument("--by", choices=GROUP_FIELDS,
+                        help="Group field (top: per group ranking, countries: default nation_code)")
+    parser.add_argument("--how", choices=AGGREGATIONS, default="sum", help="Aggregation for countries (default: sum)")
+    parser.add_argument("--keep-duplicates", action="store_true",
+                        help="Keep every row; by default one row per category+name is kept "
+                             "(later files such as *_updated.json win)")
+    parser.add_argument("-n", type=int, default=10, help="Rows to show (per group for top)")
+    args = parser.parse_args(argv)
+    if args.command == "countries" and args.by is None:
+        args.by = "nation_code"
+
+    started = time.perf_counter()
+    store = load_store(args.category, latest=not args.keep_duplicates)
+    loaded = time.perf_counter() - started
+    try:
+        equals = {"nation_code": [code.lower() for code in args.nation]} if args.nation else {}
+        ranges = {args.field: (args.min, None)} if args.min is not None else None
+        store = store.filter(ranges, **equals)
+        print(f"📦 {len(store)} records from {len(set(store.file_ids.tolist()))} files (loaded in {loaded:.2f}s)")
+        (_print_top if args.command == "top" else _print_countries)(store, args)
+    except ValueError as e:
+        parser.error(str(e))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
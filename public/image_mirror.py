@@ -0,0 +1,226 @@
+"""
+Mirror lokal foto profil (content-addressed) untuk dataset JSON.
+
+Setiap URL "image" di-download sekali ke public/avatars/<aa>/<sha256>.<ext>;
+nama file = hash isi gambar, jadi gambar yang identik (mis. avatar default atau
+user yang sama di beberapa negara) hanya disimpan sekali. Field "image" diganti
+path lokal ("/avatars/aa/....jpg", dibaca render lewat staticFile) dan URL
+aslinya disimpan di "image_url".
+
+avatars/index.json memetakan sumber -> file. Kunci sumber adalah URL tanpa
+parameter tanda tangan CDN Instagram (oe, oh, _nc_*, ...) dan tanpa host CDN,
+jadi URL yang hanya ditandatangani ulang tidak di-download lagi; begitu foto
+profil berganti (path berbeda) gambar baru diambil.
+
+Contoh (jalankan dari folder public/):
+    python image_mirror.py instagram/ig-*_updated.json
+    python image_mirror.py youtube/*.json --workers 16
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+MIRROR_FOLDER = "avatars"
+INDEX_FILE = os.path.join(MIRROR_FOLDER, "index.json")
+DEFAULT_WORKERS = 8
+FETCH_TIMEOUT = 15
+MAX_FETCH_BYTES = 10 * 1024 * 1024
+
+# Parameter yang berubah setiap kali URL ditandatangani ulang, bukan isi gambarnya
+VOLATILE_PARAMS = ("oe", "oh", "efg", "edm", "ccb", "ig_cache_key")
+VOLATILE_PREFIXES = ("_nc_",)
+CDN_HOSTS = ("cdninstagram.com", "fbcdn.net")
+
+CONTENT_TYPES = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
+
+
+class MirrorError(Exception):
+    pass
+
+
+def is_remote(url):
+    return isinstance(url, str) and url.startswith(("http://", "https://"))
+
+
+def source_key(url):
+    """Identitas sumber gambar: URL tanpa host CDN dan tanpa parameter tanda tangan."""
+    parts = urlsplit(url)
+    params = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in VOLATILE_PARAMS and not key.startswith(VOLATILE_PREFIXES)
+    ]
+    host = parts.hostname or ""
+    if host.endswith(CDN_HOSTS):
+        host = "cdn"
+    query = urlencode(sorted(params))
+    return f"{host}{parts.path}" + (f"?{query}" if query else "")
+
+
+def guess_extension(data, content_type=""):
+    """Ekstensi dari magic bytes, fallback ke Content-Type."""
+    if data.startswith(b"\xff\xd8\xff"):
+        return ".jpg"
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return ".png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return ".gif"
+    return CONTENT_TYPES.get(content_type.split(";", 1)[0].strip().lower(), ".img")
+
+
+def download(url):
+    """Return (bytes, content_type)."""
+    request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0 (render-mlbb image mirror)"})
+    try:
+        with urllib.request.urlopen(request, timeout=FETCH_TIMEOUT) as response:
+            data = response.read(MAX_FETCH_BYTES + 1)
+            content_type = response.headers.get("Content-Type", "")
+    except OSError as e:
+        raise MirrorError(f"Gagal download {url}: {e}") from e
+    if len(data) > MAX_FETCH_BYTES:
+        raise MirrorError(f"Gambar terlalu besar: {url}")
+    if not data:
+        raise MirrorError(f"Respons kosong: {url}")
+    return data, content_type
+
+
+def store(data, content_type="", folder=MIRROR_FOLDER):
+    """Simpan data di store content-addressed; return path relatif (tanpa "/" depan)."""
+    digest = hashlib.sha256(data).hexdigest()
+    relative = f"{folder}/{digest[:2]}/{digest}{guess_extension(data, content_type)}"
+    if not os.path.exists(relative):
+        os.makedirs(os.path.dirname(relative), exist_ok=True)
+        tmp_path = f"{relative}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, relative)
+    return relative, digest
+
+
+class Mirror:
+    """Index sumber -> file lokal (avatars/index.json) + download paralel."""
+
+    def __init__(self, index_path=INDEX_FILE, folder=MIRROR_FOLDER, fetch=download):
+        self.index_path = index_path
+        self.folder = folder
+        self.fetch = fetch
+        self.lock = threading.Lock()
+        self.stats = {"downloaded": 0, "cached": 0, "deduped": 0, "errors": 0}
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                self.sources = json.load(f).get("sources", {})
+        except (FileNotFoundError, ValueError):
+            self.sources = {}
+        self.digests = {entry["sha256"] for entry in self.sources.values()}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"sources": self.sources}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def cached(self, url):
+        """Path lokal ("/avatars/...") jika sumber url sudah ada di store, else None."""
+        entry = self.sources.get(source_key(url))
+        if entry and os.path.exists(entry["path"]):
+            return "/" + entry["path"]
+        return None
+
+    def mirror(self, url):
+        """Return path lokal untuk url; download hanya jika sumbernya belum pernah diambil."""
+        local = self.cached(url)
+        if local:
+            with self.lock:
+                self.stats["cached"] += 1
+            return local
+        data, content_type = self.fetch(url)
+        relative, digest = store(data, content_type, self.folder)
+        with self.lock:
+            # Isi sama dengan gambar lain yang sudah ada: tidak ada file baru
+            self.stats["deduped" if digest in self.digests else "downloaded"] += 1
+            self.digests.add(digest)
+            self.sources[source_key(url)] = {"sha256": digest, "path": relative, "fetched": int(time.time())}
+        return "/" + relative
+
+    def mirror_records(self, records, workers=DEFAULT_WORKERS, log=print):
+        """
+        Ganti "image" remote di records dengan path lokal (URL asli ke "image_url").
+        Record yang gagal di-download tetap memakai URL-nya.
+        """
+        todo = [record for record in records if isinstance(record, dict) and is_remote(record.get("image"))]
+
+        def work(record):
+            url = record["image"]
+            try:
+                local = self.mirror(url)
+            except MirrorError as e:
+                with self.lock:
+                    self.stats["errors"] += 1
+                log(f"❌ {record.get('name', url)}: {e}")
+                return
+            record["image_url"] = url
+            record["image"] = local
+
+        if workers <= 1 or len(todo) <= 1:
+            for record in todo:
+                work(record)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(work, todo))
+        return len(todo)
+
+
+def mirror_file(path, mirror, workers=DEFAULT_WORKERS, log=print):
+    """Mirror semua image di satu dataset dan tulis ulang file-nya (atomic) jika ada yang berubah."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        return 0
+    count = mirror.mirror_records(data, workers, log)
+    if count:
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Download dataset images into a local content-addressed store")
+    parser.add_argument("files", nargs="+", help="Dataset JSON files or globs (rewritten in place)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel downloads")
+    parser.add_argument("--index", default=INDEX_FILE, help=f"Source index (default: {INDEX_FILE})")
+    args = parser.parse_args(argv)
+
+    files = [path for pattern in args.files for path in (sorted(glob.glob(pattern)) or [pattern])]
+    mirror = Mirror(args.index)
+    started = time.perf_counter()
+    try:
+        for path in files:
+            count = mirror_file(path, mirror, args.workers)
+            print(f"🖼  {path}: {count} remote images")
+    finally:
+        mirror.save()
+    stats = mirror.stats
+    print(f"✅ {stats['downloaded']} downloaded, {stats['deduped']} deduped, {stats['cached']} already mirrored, "
+          f"{stats['errors']} errors in {time.perf_counter() - started:.1f}s")
+    return 1 if stats["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
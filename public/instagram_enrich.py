@@ -0,0 +1,329 @@
+"""
+Update foto profil Instagram (field "image") untuk semua instagram/ig-*.json
+(pengganti instagram/test.py, test_2.py, test_3.py).
+
+- Lookup dibagi ke pool session (lihat instagram_sessions.py): setiap session
+  punya worker (--workers) dan rate budget (--rate/--burst) sendiri, back-off
+  saat di-throttle, dan antreannya diambil alih session lain.
+- Setiap user yang selesai dicatat ke journal append-only, jadi kalau proses
+  mati di tengah jalan, run berikutnya melanjutkan dari user terakhir.
+- User yang URL gambarnya masih segar (parameter "oe" CDN belum expired)
+  tidak di-lookup lagi.
+- Gambar di-mirror ke store lokal (image_mirror.py): "image" jadi path lokal,
+  URL CDN-nya disimpan di "image_url" (dipakai untuk cek kesegaran).
+- Hasil ditulis ke instagram/ig-*_updated.json (atomic, per file).
+
+Session diambil dari --sessions FILE atau env IG_SESSIONIDS / IG_SESSIONID,
+tidak pernah dari source. Untuk test lokal tanpa jaringan pakai --stub FILE
+(JSON {"username": "url"}); --stub-limit meniru rate limit server per session.
+
+Contoh (jalankan dari folder public/):
+    IG_SESSIONIDS=sid1,sid2,sid3 python instagram_enrich.py
+    python instagram_enrich.py instagram/ig-id.json --sessions sessions.json --workers 2 --rate 1
+    python instagram_enrich.py --stub stub_profiles.json --journal /tmp/journal.jsonl
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from image_mirror import DEFAULT_WORKERS as MIRROR_WORKERS, Mirror
+from instagram_sessions import (
+    DEFAULT_BURST, DEFAULT_RATE, ProfileNotFound, SessionPool, StubBackend, Throttled, load_sessions,
+)
+from srt_engine.config import CACHE_FOLDER
+
+INSTAGRAM_FOLDER = "instagram"
+DEFAULT_PATTERN = os.path.join(INSTAGRAM_FOLDER, "ig-*.json")
+UPDATED_SUFFIX = "_updated.json"
+JOURNAL_FILE = os.path.join(CACHE_FOLDER, "instagram_journal.jsonl")
+
+DEFAULT_WORKERS = 2  # worker per session
+# Gambar dianggap segar jika CDN URL masih berlaku minimal selama ini
+DEFAULT_MIN_TTL = 24 * 3600
+
+
+# --- Lookup profil ----------------------------------------------------------
+
+def instaloader_lookup(sessionid=None, name=None):
+    """
+    Backend instaloader: return lookup username -> URL foto profil (satu
+    Instaloader per thread, name hanya dipakai StubBackend). Error instaloader dipetakan ke Throttled / ProfileNotFound.
+    """
+    import instaloader
+    from instaloader.exceptions import ConnectionException, ProfileNotExistsException, TooManyRequestsException
+
+    local = threading.local()
+
+    def lookup(username):
+        loader = getattr(local, "loader", None)
+        if loader is None:
+            loader = local.loader = instaloader.Instaloader(max_connection_attempts=1)
+            if sessionid:
+                loader.context._session.cookies.set("sessionid", sessionid)
+        try:
+            profile = instaloader.Profile.from_username(loader.context, username)
+        except TooManyRequestsException as e:
+            raise Throttled(str(e)) from e
+        except ProfileNotExistsException as e:
+            raise ProfileNotFound(str(e)) from e
+        except ConnectionException as e:
+            if "429" in str(e) or "wait a few minutes" in str(e).lower():
+                raise Throttled(str(e)) from e
+            raise
+        return str(profile.profile_pic_url)
+
+    return lookup
+
+
+# --- Kesegaran gambar -------------------------------------------------------
+
+def image_expiry(url):
+    """Epoch expired URL CDN Instagram (parameter hex "oe"), None jika tidak ada."""
+    try:
+        oe = parse_qs(urlsplit(url).query).get("oe")
+        return int(oe[0], 16) if oe else None
+    except ValueError:
+        return None
+
+
+def is_fresh(url, min_ttl=DEFAULT_MIN_TTL, now=None):
+    """
+    True jika image tidak perlu di-lookup: path lokal (bukan http), atau URL CDN
+    yang masih berlaku >= min_ttl detik. URL tanpa "oe" dianggap basi.
+    """
+    if not isinstance(url, str) or not url.strip() or url.strip().lower() == "no data":
+        return False
+    if not url.startswith(("http://", "https://")):
+        return True
+    expiry = image_expiry(url)
+    return expiry is not None and expiry - (time.time() if now is None else now) >= min_ttl
+
+
+# --- Journal ----------------------------------------------------------------
+
+class Journal:
+    """
+    Journal append-only (JSON Lines): satu baris per lookup
+    {"file", "name", "image"|"error", "ts"}. Baris terakhir per (file, name) yang menang.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self._file = None
+
+    def load(self):
+        """Return dict (file, name) -> image untuk lookup yang berhasil."""
+        done = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Baris terakhir bisa terpotong kalau proses mati saat menulis
+                        continue
+                    key = (entry.get("file"), entry.get("name"))
+                    if entry.get("image"):
+                        done[key] = entry["image"]
+                    else:
+                        done.pop(key, None)
+        except FileNotFoundError:
+            pass
+        return done
+
+    def append(self, file_key, name, image=None, error=None):
+        entry = {"file": file_key, "name": name, "ts": int(time.time())}
+        if error is None:
+            entry["image"] = image
+        else:
+            entry["error"] = error
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self.lock:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        with self.lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+# --- Dataset ----------------------------------------------------------------
+
+def list_sources(patterns=None):
+    """File ig-*.json sumber (tanpa *_updated.json), urut per nama."""
+    files = []
+    for pattern in patterns or [DEFAULT_PATTERN]:
+        for path in sorted(glob.glob(pattern)) or ([pattern] if os.path.isfile(pattern) else []):
+            if not path.endswith(UPDATED_SUFFIX) and path not in files:
+                files.append(path)
+    return files
+
+
+def updated_path(source):
+    return source[: -len(".json")] + UPDATED_SUFFIX
+
+
+def load_users(source):
+    """
+    Data sumber dengan image terakhir dari *_updated.json (jika ada), supaya
+    hasil run sebelumnya (termasuk mirror lokal) ikut dihitung saat cek kesegaran.
+    """
+    with open(source, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    try:
+        with open(updated_path(source), "r", encoding="utf-8") as f:
+            previous = {user.get("name"): user for user in json.load(f) if isinstance(user, dict)}
+    except (FileNotFoundError, ValueError):
+        previous = {}
+    for user in data:
+        old = previous.get(user.get("name")) if isinstance(user, dict) else None
+        if old and old.get("image"):
+            user["image"] = old["image"]
+            if old.get("image_url"):
+                user["image_url"] = old["image_url"]
+    return data
+
+
+def set_image(user, url):
+    """Image baru dari lookup; image_url lama dibuang (diisi lagi oleh mirror)."""
+    user["image"] = url
+    user.pop("image_url", None)
+
+
+def write_updated(source, data):
+    target = updated_path(source)
+    tmp_path = target + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, target)
+    return target
+
+
+# --- Runner -----------------------------------------------------------------
+
+def enrich(sources, pool, journal_path=JOURNAL_FILE, min_ttl=DEFAULT_MIN_TTL, dry_run=False, mirror=None,
+           log=print):
+    """
+    Update image semua user di sources lewat SessionPool, lalu (jika mirror
+    diberikan) download gambarnya ke store lokal. Return dict statistik
+    {users, fresh, resumed, updated, errors, files, sessions}.
+    """
+    journal = Journal(journal_path)
+    done = journal.load()
+    stats = {"users": 0, "fresh": 0, "resumed": 0, "updated": 0, "errors": 0, "files": [], "sessions": {}}
+    datasets = []
+    todo = {}
+    for source in sources:
+        data = load_users(source)
+        file_key = os.path.basename(source)
+        datasets.append((source, data))
+        for user in data:
+            name = user.get("name") if isinstance(user, dict) else None
+            if not name:
+                continue
+            stats["users"] += 1
+            journaled = done.get((file_key, name))
+            if journaled and is_fresh(journaled, min_ttl):
+                if journaled != user.get("image_url"):
+                    set_image(user, journaled)
+                stats["resumed"] += 1
+            elif is_fresh(user.get("image_url") or user.get("image"), min_ttl):
+                stats["fresh"] += 1
+            else:
+                todo[(file_key, name)] = user
+    log(f"🔎 {stats['users']} users in {len(sources)} files: {len(todo)} to look up, "
+        f"{stats['fresh']} fresh, {stats['resumed']} resumed from journal, {len(pool.sessions)} sessions")
+
+    lock = threading.Lock()
+
+    def on_result(key, image):
+        set_image(todo[key], image)
+        journal.append(key[0], key[1], image)
+        with lock:
+            stats["updated"] += 1
+        log(f"✅ Updated {key[1]}")
+
+    def on_error(key, message):
+        journal.append(key[0], key[1], error=message)
+        with lock:
+            stats["errors"] += 1
+        log(f"❌ Error {key[1]}: {message}")
+
+    if todo and not dry_run:
+        try:
+            # Yang sudah selesai aman di journal; kalau dihentikan, sisanya dilanjutkan run berikutnya
+            stats["sessions"] = pool.run(((key, key[1]) for key in todo), on_result, on_error)
+        finally:
+            journal.close()
+
+    if not dry_run:
+        for source, data in datasets:
+            if mirror is not None:
+                mirror.mirror_records(data, MIRROR_WORKERS, log)
+            stats["files"].append(write_updated(source, data))
+        if mirror is not None:
+            mirror.save()
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Update Instagram profile pictures in instagram/ig-*.json")
+    parser.add_argument("sources", nargs="*", help=f"Source files or globs (default: {DEFAULT_PATTERN})")
+    parser.add_argument("--sessions", metavar="FILE",
+                        help="JSON list of session ids or {name, sessionid, rate, burst} (default: env IG_SESSIONIDS / IG_SESSIONID)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent lookups per session")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="Lookups per second per session (0 = no limit)")
+    parser.add_argument("--burst", type=int, default=DEFAULT_BURST, help="Token bucket size per session")
+    parser.add_argument("--journal", default=JOURNAL_FILE, help=f"Append-only progress journal (default: {JOURNAL_FILE})")
+    parser.add_argument("--reset-journal", action="store_true", help="Ignore previous progress")
+    parser.add_argument("--min-ttl", type=float, default=DEFAULT_MIN_TTL / 3600,
+                        help="Hours an image URL must stay valid to be skipped")
+    parser.add_argument("--stub", metavar="FILE", help='Offline backend from JSON {"username": "url"}')
+    parser.add_argument("--stub-limit", type=int, help="Stub backend: throttle a session after N lookups per second")
+    parser.add_argument("--no-mirror", action="store_true", help="Keep CDN URLs instead of mirroring images locally")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be looked up")
+    args = parser.parse_args(argv)
+
+    sources = list_sources(args.sources)
+    if not sources:
+        print("Tidak ada file ig-*.json.", file=sys.stderr)
+        return 1
+    if args.reset_journal and os.path.exists(args.journal):
+        os.remove(args.journal)
+    sessions = load_sessions(args.sessions, rate=args.rate, burst=args.burst)
+    if args.stub:
+        backend = StubBackend(args.stub, limit=args.stub_limit)
+    else:
+        if not any(session.sessionid for session in sessions):
+            print("⚠️  Tidak ada session (IG_SESSIONIDS / --sessions), lookup berjalan tanpa login", file=sys.stderr)
+        backend = instaloader_lookup
+    pool = SessionPool(sessions, backend, workers_per_session=args.workers)
+
+    started = time.perf_counter()
+    mirror = None if args.no_mirror else Mirror()
+    stats = enrich(sources, pool, args.journal, min_ttl=args.min_ttl * 3600, dry_run=args.dry_run, mirror=mirror)
+    print(f"📸 {stats['updated']} updated, {stats['fresh']} fresh, {stats['resumed']} resumed, "
+          f"{stats['errors']} errors in {time.perf_counter() - started:.1f}s")
+    for name, session_stats in stats["sessions"].items():
+        print(f"   - {name}: {session_stats['ok']} ok, {session_stats['errors']} errors, "
+              f"{session_stats['throttled']} throttled" + (" (disabled)" if session_stats["disabled"] else ""))
+    for path in stats["files"]:
+        print(f"   - {path}")
+    if stats["errors"]:
+        print("   Jalankan lagi untuk mencoba ulang user yang error.")
+    return 1 if stats["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+"""
+Pool session Instagram untuk instagram_enrich.py.
+
+Session dibaca dari file config atau env (tidak pernah dari source):
+- --sessions FILE: JSON list, item berupa string sessionid atau
+  {"name": ..., "sessionid": ..., "rate": ..., "burst": ...};
+- env IG_SESSIONIDS (dipisah koma) atau IG_SESSIONID;
+- tanpa keduanya: satu session anonim.
+
+Username dibagi (shard) ke session berdasarkan hash nama. Setiap session punya
+token bucket sendiri (rate budget) dan worker sendiri; session yang kena throttle
+(backend raise Throttled) berhenti sementara dengan back-off eksponensial, dan
+antreannya diambil alih session lain yang sedang idle. Throughput total naik
+kira-kira sebanding jumlah session.
+"""
+import json
+import os
+import random
+import threading
+import time
+import zlib
+from collections import deque
+
+SESSIONS_ENV = "IG_SESSIONIDS"
+SESSION_ENV = "IG_SESSIONID"
+
+DEFAULT_RATE = 0.5   # lookup per detik per session
+DEFAULT_BURST = 2
+DEFAULT_BACKOFF = 30.0
+MAX_BACKOFF = 15 * 60.0
+# Session dimatikan setelah sekian kali throttle berturut-turut
+MAX_STRIKES = 5
+MAX_ATTEMPTS = 3
+
+
+class Throttled(Exception):
+    """Backend menolak karena rate limit (HTTP 429 / "Please wait a few minutes")."""
+
+
+class ProfileNotFound(Exception):
+    """Profil tidak ada; tidak perlu dicoba ulang."""
+
+
+class TokenBucket:
+    """Rate limiter thread-safe: rate token per detik, maksimal burst token tersimpan."""
+
+    def __init__(self, rate, burst=1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Ambil satu token, tunggu jika bucket kosong."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+class Session:
+    def __init__(self, name, sessionid=None, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.name = name
+        self.sessionid = sessionid
+        self.bucket = TokenBucket(rate, burst)
+        self.lookup = None
+        self.blocked_until = 0.0
+        self.strikes = 0
+        self.disabled = False
+        self.stats = {"ok": 0, "errors": 0, "throttled": 0}
+        # strikes/stats diubah dari beberapa worker thread sekaligus
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return f"Session({self.name!r})"
+
+    def throttle(self, base=DEFAULT_BACKOFF, cap=MAX_BACKOFF, max_strikes=MAX_STRIKES):
+        """Catat throttle dan return lama back-off (detik); session mati setelah max_strikes."""
+        with self.lock:
+            self.strikes += 1
+            self.stats["throttled"] += 1
+            if self.strikes > max_strikes:
+                self.disabled = True
+                return 0.0
+            delay = min(cap, base * 2 ** (self.strikes - 1)) * random.uniform(0.8, 1.2)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+            return delay
+
+    def succeeded(self):
+        """Lookup berhasil: hitung ok dan reset strikes."""
+        with self.lock:
+            self.strikes = 0
+            self.stats["ok"] += 1
+
+    def failed(self):
+        with self.lock:
+            self.stats["errors"] += 1
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.stats, disabled=self.disabled)
+
+
+def load_sessions(path=None, env=None, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+    """List Session dari file config, env IG_SESSIONIDS/IG_SESSIONID, atau satu session anonim."""
+    env = os.environ if env is None else env
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            items = json.load(f)
+    elif env.get(SESSIONS_ENV):
+        items = [item.strip() for item in env[SESSIONS_ENV].split(",") if item.strip()]
+    elif env.get(SESSION_ENV):
+        items = [env[SESSION_ENV]]
+    else:
+        items = [None]
+    sessions = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            item = {"sessionid": item}
+        sessions.append(Session(
+            item.get("name") or (f"session-{i + 1}" if item.get("sessionid")
+                                 else "anonymous" if len(items) == 1 else f"anonymous-{i + 1}"),
+            item.get("sessionid"), item.get("rate", rate), item.get("burst", burst),
+        ))
+    return sessions
+
+
+def shard_index(username, shards):
+    """Shard stabil (tidak tergantung PYTHONHASHSEED) untuk username."""
+    return zlib.crc32(username.lower().encode("utf-8")) % shards
+
+
+class SessionPool:
+    """
+    Scheduler lookup lintas session. backend(sessionid, name) -> lookup(username) -> url;
+    lookup boleh raise Throttled (dicoba di session lain setelah back-off) atau
+    ProfileNotFound (langsung gagal).
+    """
+
+    def __init__(self, sessions, backend, workers_per_session=1, max_attempts=MAX_ATTEMPTS,
+                 backoff=DEFAULT_BACKOFF, max_backoff=MAX_BACKOFF, max_strikes=MAX_STRIKES, log=print):
+        if not sessions:
+            raise ValueError("SessionPool butuh minimal satu session")
+        names = [session.name for session in sessions]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Nama session harus unik: {', '.join(names)}")
+        self.sessions = sessions
+        for session in sessions:
+            session.lookup = backend(session.sessionid, session.name)
+        self.workers_per_session = max(1, workers_per_session)
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_strikes = max_strikes
+        self.log = log
+        self.cond = threading.Condition()
+        self.stopped = False
+
+    def _take(self, session, shards, own):
+        """Item berikutnya: dari shard sendiri, kalau kosong curi dari shard terpanjang."""
+        if shards[own]:
+            return shards[own].popleft()
+        longest = max(range(len(shards)), key=lambda i: len(shards[i]))
+        if shards[longest]:
+            return shards[longest].pop()
+        return None
+
+    def _requeue(self, shards, item, avoid):
+        """Kembalikan item ke depan shard session lain yang masih aktif (atau shard avoid)."""
+        now = time.monotonic()
+        active = [i for i, s in enumerate(self.sessions)
+                  if i != avoid and not s.disabled and s.blocked_until <= now]
+        target = min(active, key=lambda i: len(shards[i])) if active else avoid
+        shards[target].appendleft(item)
+
+    def run(self, items, on_result, on_error):
+        """
+        items: iterable (key, username). on_result(key, url) / on_error(key, message)
+        dipanggil dari thread worker (satu per item). Return stats per session.
+        """
+        shards = [deque() for _ in self.sessions]
+        pending = 0
+        for key, username in items:
+            shards[shard_index(username, len(shards))].append([key, username, 0])
+            pending += 1
+        state = {"pending": pending}
+
+        def finish(item, url=None, error=None):
+            if error is None:
+                on_result(item[0], url)
+            else:
+                on_error(item[0], error)
+            with self.cond:
+                state["pending"] -= 1
+                self.cond.notify_all()
+
+        def worker(index):
+            session = self.sessions[index]
+            while True:
+                with self.cond:
+                    while True:
+                        if self.stopped or state["pending"] <= 0 or session.disabled:
+                            return
+                        wait = session.blocked_until - time.monotonic()
+                        if wait > 0:
+                            self.cond.wait(wait)
+                            continue
+                        item = self._take(session, shards, index)
+                        if item is not None:
+                            break
+                        # Antrean kosong tapi item lain masih diproses (bisa kembali karena throttle)
+                        self.cond.wait(1.0)
+                session.bucket.acquire()
+                try:
+                    url = session.lookup(item[1])
+                except Throttled as e:
+                    with self.cond:
+                        delay = session.throttle(self.backoff, self.max_backoff, self.max_strikes)
+                        self._requeue(shards, item, index)
+                        self.cond.notify_all()
+                    if session.disabled:
+                        self.log(f"⛔ {session.name} throttled more than {self.max_strikes}x, disabled ({e})")
+                    else:
+                        self.log(f"⏳ {session.name} throttled, backing off {delay:.1f}s ({e})")
+                    continue
+                except ProfileNotFound as e:
+                    session.failed()
+                    finish(item, error=f"{type(e).__name__}: {e}")
+                    continue
+                except Exception as e:
+                    item[2] += 1
+                    session.failed()
+                    if item[2] < self.max_attempts:
+                        with self.cond:
+                            self._requeue(shards, item, index)
+                            self.cond.notify_all()
+                    else:
+                        finish(item, error=f"{type(e).__name__}: {e}")
+                    continue
+                session.succeeded()
+                finish(item, url)
+
+        threads = [
+            threading.Thread(target=worker, args=(index,), name=f"ig-{session.name}", daemon=True)
+            for index, session in enumerate(self.sessions)
+            for _ in range(self.workers_per_session)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.5)
+        except KeyboardInterrupt:
+            with self.cond:
+                self.stopped = True
+                self.cond.notify_all()
+            raise
+        # Semua session mati karena throttle: sisa item dilaporkan gagal (dicoba lagi run berikutnya)
+        for shard in shards:
+            while shard:
+                on_error(shard.popleft()[0], "Throttled: all sessions disabled")
+        return {session.name: session.snapshot() for session in self.sessions}
+
+
+class StubBackend:
+    """
+    Backend palsu untuk test offline: profiles = dict {username: url} atau path JSON.
+    limit = jumlah lookup per window detik per session sebelum raise Throttled
+    (meniru rate limit server), delay = latency palsu per lookup. calls = jumlah
+    lookup per nama session.
+    """
+
+    def __init__(self, profiles, delay=0.0, limit=None, window=1.0):
+        if isinstance(profiles, str):
+            with open(profiles, "r", encoding="utf-8") as f:
+                profiles = json.load(f)
+        self.profiles = profiles
+        self.delay = delay
+        self.limit = limit
+        self.window = window
+        self.calls = {}
+
+    def __call__(self, sessionid, name=None):
+        recent = deque()
+        lock = threading.Lock()
+        name = name or sessionid
+        self.calls[name] = 0
+
+        def lookup(username):
+            with lock:
+                now = time.monotonic()
+                while recent and now - recent[0] > self.window:
+                    recent.popleft()
+                if self.limit is not None and len(recent) >= self.limit:
+                    raise Throttled("Please wait a few minutes before you try again.")
+                recent.append(now)
+                self.calls[name] += 1
+            if self.delay:
+                time.sleep(self.delay)
+            if username not in self.profiles:
+                raise ProfileNotFound(f"Profile {username} does not exist")
+            return self.profiles[username]
+
+        return lookup
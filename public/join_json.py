@@ -1,34 +1,272 @@
+"""
+Gabungkan beberapa file JSON (array of objects) menjadi satu file, dengan memori terbatas.
+
+- Input dari CLI (boleh glob), default: pool role MLBB di gaming/
+- Setiap input dibaca per item (ijson jika terpasang, jika tidak parser inkremental
+  bawaan), jadi file besar tidak pernah di-load utuh
+- Dedupe opsional lewat hash index dari field kunci (alias FIELD_ALIASES ikut dicek)
+- Sort opsional berdasarkan date/followers: setiap input di-sort per chunk ke file run
+  sementara lalu digabung dengan k-way merge (heapq.merge)
+- Output ditulis streaming (format sama dengan json.dump(..., indent=2)); "-" = stdout
+
+Contoh (jalankan dari folder public/):
+    python join_json.py
+    python join_json.py "gaming/mlbb_*.json" --exclude gaming/mlbb_all_role.json -o gaming/mlbb_all_role.json --key name
+    python join_json.py "instagram/ig-*_updated.json" --key name --sort followers -o global.json
+"""
+import argparse
+import glob
+import heapq
 import json
+import os
+import sys
+import tempfile
+
+from srt_engine.dates import DEFAULT_DATE, parse_date
+from srt_engine.normalize import clean_text, get_field
+
+# Daftar file JSON default yang digabung (pool semua role)
+DEFAULT_INPUTS = [
+    "gaming/mlbb_exp_laner.json",
+    "gaming/mlbb_gold_laner.json",
+    "gaming/mlbb_jungle.json",
+    "gaming/mlbb_mid_laner.json",
+    "gaming/mlbb_roam.json",
+]
+DEFAULT_OUTPUT = "gabungan.json"
+DEFAULT_CHUNK_SIZE = 10_000
+READ_SIZE = 1 << 16
+SORT_FIELDS = ("date", "followers")
+
+
+# Karakter yang boleh mengikuti item top-level array
+ITEM_END = " \t\r\n,]"
+
+
+class NotAListError(ValueError):
+    pass
+
+
+def _first_char(f):
+    """Karakter non-whitespace pertama (posisi file dikembalikan ke awal)."""
+    while True:
+        chunk = f.read(1024)
+        if not chunk:
+            return ""
+        stripped = chunk.lstrip()
+        if stripped:
+            f.seek(0)
+            return stripped[:1]
+
+
+def _iter_array(f):
+    """Parser inkremental top-level array: decode satu item per kali dari buffer kecil."""
+    decoder = json.JSONDecoder()
+    buf = f.read(READ_SIZE).lstrip()
+    pos = 1  # lewati "["
+    eof = False
+    read_size = READ_SIZE
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+        if pos < len(buf) and buf[pos] == "]":
+            return
+        if pos >= len(buf):
+            if eof:
+                raise json.JSONDecodeError("Unterminated array", buf, pos)
+            buf, pos = f.read(read_size), 0
+            eof = not buf
+            continue
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            item, end = None, None
+        # Angka tidak punya penutup: "1." atau "1e" di akhir buffer sudah ter-decode
+        # sebagai 1, jadi angka baru lengkap kalau diikuti pemisah item
+        cut_number = (end is not None and end < len(buf) and isinstance(item, (int, float))
+                      and buf[end] not in ITEM_END)
+        if end is None or ((end >= len(buf) or cut_number) and not eof):
+            # Item terpotong di batas buffer: baca lagi (ukuran baca digandakan untuk item besar)
+            more = f.read(read_size)
+            if not more:
+                if end is None:
+                    raise json.JSONDecodeError("Truncated item", buf, pos)
+                eof = True
+                continue
+            buf, pos = buf[pos:] + more, 0
+            read_size *= 2
+            continue
+        read_size = READ_SIZE
+        yield item
+        pos = end
+        if pos > READ_SIZE:
+            buf, pos = buf[pos:], 0
+
+
+def iter_items(filename):
+    """Generator item dari satu file JSON array; raise NotAListError jika isinya bukan list."""
+    with open(filename, "r", encoding="utf-8") as f:
+        if _first_char(f) != "[":
+            raise NotAListError(filename)
+        try:
+            import ijson
+        except ImportError:
+            yield from _iter_array(f)
+            return
+        f.seek(0)
+        yield from ijson.items(f, "item", use_float=True)
+
+
+def expand_inputs(patterns, excludes=()):
+    """Pattern glob -> list path (urutan sesuai pattern, duplikat dibuang)."""
+    excluded = {os.path.normpath(p) for pattern in excludes for p in glob.glob(pattern) or [pattern]}
+    files, seen = [], set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) or [pattern]  # path tidak ada tetap dilaporkan saat dibaca
+        for path in matches:
+            norm = os.path.normpath(path)
+            if norm not in seen and norm not in excluded:
+                seen.add(norm)
+                files.append(path)
+    return files
+
+
+def dedupe_key(item, key_fields):
+    """Tuple nilai field kunci (lowercase, sudah dibersihkan); None jika semua kosong."""
+    values = tuple(clean_text(get_field(item, field)).lower() for field in key_fields)
+    return values if any(values) else None
+
+
+def sort_key(item, field, descending):
+    """Key sort; item tanpa date/followers selalu di akhir."""
+    if field == "date":
+        parsed = parse_date(get_field(item, "date"))
+        value = None if parsed == DEFAULT_DATE else (parsed - DEFAULT_DATE).total_seconds()
+    else:
+        value = get_field(item, "followers_count", None)
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            value = None
+    if value is None:
+        return (1, 0)
+    return (0, -value if descending else value)
+
+
+def iter_inputs(files, key_fields=None, stats=None):
+    """Item dari semua file berurutan; dengan key_fields, item duplikat (kemunculan kedua dst.) dibuang."""
+    seen = set()
+    for filename in files:
+        count = 0
+        try:
+            for item in iter_items(filename):
+                if not isinstance(item, dict):
+                    continue
+                count += 1
+                if key_fields:
+                    key = dedupe_key(item, key_fields)
+                    if key is not None:
+                        if key in seen:
+                            stats["duplicates"] += 1
+                            continue
+                        seen.add(key)
+                yield item
+        except NotAListError:
+            print(f"Peringatan: Isi {filename} bukan list, dilewati.", file=sys.stderr)
+        except (OSError, ValueError) as e:
+            print(f"Gagal membaca {filename}: {e}", file=sys.stderr)
+        stats["files"] += 1
+        stats["read"] += count
+
+
+def _write_run(items, key, folder):
+    items.sort(key=key)
+    fd, path = tempfile.mkstemp(suffix=".jsonl", dir=folder)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(item, ensure_ascii=False) + "\n" for item in items)
+    return path
+
+
+def _iter_run(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def sorted_merge(items, key, chunk_size, folder):
+    """
+    External sort: item di-sort per chunk ke file run JSONL lalu digabung dengan
+    k-way merge, jadi memori hanya sebesar satu chunk + satu item per run.
+    """
+    runs, chunk = [], []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            runs.append(_write_run(chunk, key, folder))
+            chunk = []
+    if not runs:
+        # Semua muat di satu chunk: tidak perlu file run
+        chunk.sort(key=key)
+        yield from chunk
+        return
+    if chunk:
+        runs.append(_write_run(chunk, key, folder))
+    yield from heapq.merge(*(_iter_run(path) for path in runs), key=key)
+
+
+def write_json_array(items, out):
+    """Tulis item sebagai JSON array streaming; hasilnya sama dengan json.dump(list, f, indent=2)."""
+    count = 0
+    for item in items:
+        text = json.dumps(item, indent=2).replace("\n", "\n  ")
+        out.write(("[\n  " if count == 0 else ",\n  ") + text)
+        count += 1
+    out.write("\n]" if count else "[]")
+    return count
+
+
+def join_json(files, output_file=DEFAULT_OUTPUT, key_fields=None, sort_by=None, descending=True,
+              chunk_size=DEFAULT_CHUNK_SIZE):
+    """Gabungkan files ke output_file ("-" = stdout); return dict statistik."""
+    stats = {"files": 0, "read": 0, "duplicates": 0, "written": 0}
+    items = iter_inputs(files, key_fields, stats)
+    output_dir = os.path.dirname(os.path.abspath(output_file)) if output_file != "-" else None
+    with tempfile.TemporaryDirectory(prefix="join_json-") as run_folder:
+        if sort_by:
+            items = sorted_merge(items, lambda item: sort_key(item, sort_by, descending), chunk_size, run_folder)
+        if output_file == "-":
+            stats["written"] = write_json_array(items, sys.stdout)
+            sys.stdout.write("\n")
+        else:
+            # Tulis ke file sementara lalu rename: output boleh sama dengan salah satu input
+            fd, tmp_path = tempfile.mkstemp(suffix=".json", dir=output_dir)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    stats["written"] = write_json_array(items, f)
+                os.replace(tmp_path, output_file)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gabungkan file JSON array dengan memori terbatas")
+    parser.add_argument("inputs", nargs="*", default=DEFAULT_INPUTS, help="File atau pola glob input")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help=f"File output, - untuk stdout (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--exclude", nargs="+", default=[], help="File atau pola glob yang dilewati")
+    parser.add_argument("--key", nargs="+", metavar="FIELD", help="Dedupe berdasarkan field ini (contoh: --key name team)")
+    parser.add_argument("--sort", choices=SORT_FIELDS, help="Urutkan output (k-way merge, memori terbatas)")
+    parser.add_argument("--ascending", action="store_true", help="Urutan naik (default: terbaru/terbanyak dulu)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Jumlah item per run saat sorting")
+    args = parser.parse_args(argv)
+
+    files = expand_inputs(args.inputs, args.exclude)
+    stats = join_json(files, args.output, args.key, args.sort, not args.ascending, args.chunk_size)
+
+    log = sys.stderr if args.output == "-" else sys.stdout
+    print(f"\nGabungan selesai! Data tersimpan di '{args.output}'", file=log)
+    print(f"Jumlah total entri: {stats['written']} (dibaca {stats['read']} dari {stats['files']} file, "
+          f"{stats['duplicates']} duplikat dibuang)", file=log)
+
 
-# Daftar file JSON yang ingin digabung
-input_files = [
-    "data/mlbb_exp_laner.json", 
-    "data/mlbb_gold_laner.json", 
-    "data/mlbb_jungle.json", 
-    "data/mlbb_mid_laner.json", 
-    "data/mlbb_roam.json", 
-]  # Tambahkan file lain di sini
-
-output_file = "gabungan.json"
-
-# List untuk menampung semua data
-combined_data = []
-
-# Membaca setiap file dan menambahkannya ke combined_data
-for filename in input_files:
-    try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                combined_data.extend(data)
-            else:
-                print(f"Peringatan: Isi {filename} bukan list, dilewati.")
-    except Exception as e:
-        print(f"Gagal membaca {filename}: {e}")
-
-# Menyimpan hasil gabungan ke file baru
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(combined_data, f, indent=2)
-
-print(f"\nGabungan selesai! Data tersimpan di '{output_file}'")
-print(f"Jumlah total entri: {len(combined_data)}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Optimasi gambar public/player untuk kartu MLBB.
+
+Setiap player/*.png di-resize (contain, tidak di-upscale) ke ukuran area gambar
+di kartu yang memakainya, lalu disimpan sebagai WebP + PNG fallback (AVIF
+opsional) di player/optimized/. Dikerjakan paralel (process pool); gambar yang
+isinya tidak berubah (sha256 sama) dan setting yang sama dilewati.
+
+player/optimized/manifest.json memetakan path "image" seperti di
+public/gaming/*.json ("/player/AE_Bale.png") ke varian per kartu, plus daftar
+dataset yang memakai setiap gambar. CardPlayerMLBB dan CardTeamMLBB membaca
+manifest ini lewat src/utils/playerImage.ts (WebP, lalu PNG, lalu gambar asli).
+
+Contoh (jalankan dari folder public/):
+    python optimize_player.py
+    python optimize_player.py --cards player --formats webp,png,avif --workers 4
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+
+SOURCE_FOLDER = "player"
+OUTPUT_FOLDER = os.path.join(SOURCE_FOLDER, "optimized")
+MANIFEST_FILE = os.path.join(OUTPUT_FOLDER, "manifest.json")
+DATASET_PATTERN = os.path.join("gaming", "*.json")
+
+# Area gambar di kartu (px, sama dengan class Tailwind v4 di komponennya):
+# CardPlayerMLBB: w-150 h-150 -> 600x600
+# CardTeamMLBB: kartu w-[620px], area h-150 dengan padding 1.5em -> 572x552
+CARD_SIZES = {
+    "player": (600, 600),
+    "team": (572, 552),
+}
+FORMATS = ("webp", "png", "avif")
+DEFAULT_FORMATS = ("webp", "png")
+WEBP_QUALITY = 85
+# method 6 ~90x lebih lambat dari 4 untuk file ~3% lebih kecil
+WEBP_METHOD = 4
+AVIF_QUALITY = 60
+# PNG fallback dikuantisasi ke palet (FASTOCTREE mendukung alpha): ~4-5x lebih kecil
+# dari PNG truecolor, tanpa itu fallback malah lebih besar dari sumbernya
+PNG_COLORS = 256
+# Naikkan jika cara encode berubah agar semua varian dibuat ulang
+OPTIMIZER_VERSION = 1
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def settings_fingerprint(cards, formats):
+    return {
+        "version": OPTIMIZER_VERSION,
+        "sizes": {card: list(CARD_SIZES[card]) for card in cards},
+        "formats": list(formats),
+        "webp_quality": WEBP_QUALITY,
+        "webp_method": WEBP_METHOD,
+        "avif_quality": AVIF_QUALITY,
+        "png_colors": PNG_COLORS,
+    }
+
+
+def image_key(path):
+    """Path gambar seperti ditulis di dataset gaming: "/player/<file>"."""
+    return "/" + os.path.relpath(path).replace(os.sep, "/")
+
+
+def variant_path(source, card, fmt, output_folder=OUTPUT_FOLDER):
+    width, height = CARD_SIZES[card]
+    stem = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(output_folder, f"{stem}.{width}x{height}.{fmt}")
+
+
+def _save(image, target, fmt):
+    from PIL import Image
+
+    tmp_path = f"{target}.{os.getpid()}.tmp"
+    if fmt == "webp":
+        image.save(tmp_path, format="WEBP", quality=WEBP_QUALITY, method=WEBP_METHOD)
+    elif fmt == "avif":
+        image.save(tmp_path, format="AVIF", quality=AVIF_QUALITY)
+    else:
+        if PNG_COLORS:
+            image = image.quantize(PNG_COLORS, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.FLOYDSTEINBERG)
+        image.save(tmp_path, format="PNG", optimize=True)
+    os.replace(tmp_path, target)
+
+
+def optimize_image(task):
+    """
+    Worker: task = (source, sha256, cards, formats, output_folder).
+    Return entry manifest untuk satu gambar (error dicatat, tidak di-raise).
+    """
+    from PIL import Image, ImageOps
+
+    source, digest, cards, formats, output_folder = task
+    entry = {"sha256": digest, "variants": {}, "error": None}
+    try:
+        with Image.open(source) as image:
+            image.load()
+            entry["width"], entry["height"] = image.size
+            image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P", "PA") else "RGB")
+            encoded = {}
+            for card in cards:
+                box = CARD_SIZES[card]
+                # Hanya diperkecil: gambar kecil tetap ukuran aslinya
+                resized = ImageOps.contain(image, box) if image.width > box[0] or image.height > box[1] else image
+                if resized.size in encoded:
+                    # Ukuran hasil sama dengan kartu lain (mis. sumber lebih kecil dari keduanya)
+                    entry["variants"][card] = encoded[resized.size]
+                    continue
+                variant = {"width": resized.width, "height": resized.height}
+                for fmt in formats:
+                    target = variant_path(source, card, fmt, output_folder)
+                    _save(resized, target, fmt)
+                    variant[fmt] = image_key(target)
+                    variant[f"{fmt}_bytes"] = os.path.getsize(target)
+                entry["variants"][card] = encoded[resized.size] = variant
+    except OSError as e:
+        entry["error"] = f"{type(e).__name__}: {e}"
+    return entry
+
+
+def load_manifest(path=MANIFEST_FILE):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_manifest(manifest, path=MANIFEST_FILE):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def dataset_usage(pattern=DATASET_PATTERN):
+    """Dict image path -> list dataset yang memakainya."""
+    usage = {}
+    for path in sorted(glob.glob(pattern)):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        for record in data if isinstance(data, list) else []:
+            image = record.get("image") if isinstance(record, dict) else None
+            if isinstance(image, str) and not image.startswith(("http://", "https://")):
+                datasets = usage.setdefault("/" + image.lstrip("/"), [])
+                if path not in datasets:
+                    datasets.append(path)
+    return usage
+
+
+def _is_current(entry, digest, cards, formats):
+    if not entry or entry.get("error") or entry.get("sha256") != digest:
+        return False
+    for card in cards:
+        variant = entry.get("variants", {}).get(card)
+        if not variant:
+            return False
+        for fmt in formats:
+            if not variant.get(fmt) or not os.path.exists(variant[fmt].lstrip("/")):
+                return False
+    return True
+
+
+def optimize_folder(cards=tuple(CARD_SIZES), formats=DEFAULT_FORMATS, workers=None, force=False,
+                    source_folder=SOURCE_FOLDER, output_folder=OUTPUT_FOLDER, manifest_path=MANIFEST_FILE,
+                    dataset_pattern=DATASET_PATTERN):
+    """Optimasi semua PNG di source_folder; return (manifest, jumlah diproses, jumlah dilewati)."""
+    sources = sorted(glob.glob(os.path.join(source_folder, "*.png")))
+    previous = load_manifest(manifest_path)
+    settings = settings_fingerprint(cards, formats)
+    if previous.get("settings") != settings:
+        previous = {}
+    images = {}
+    todo = []
+    for source in sources:
+        key = image_key(source)
+        digest = file_hash(source)
+        entry = previous.get("images", {}).get(key)
+        if not force and _is_current(entry, digest, cards, formats):
+            images[key] = entry
+        else:
+            todo.append((source, digest, tuple(cards), tuple(formats), output_folder))
+    os.makedirs(output_folder, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(todo) <= 1:
+        results = [optimize_image(task) for task in todo]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+            results = list(pool.map(optimize_image, todo, chunksize=4))
+    for task, entry in zip(todo, results):
+        images[image_key(task[0])] = entry
+
+    usage = dataset_usage(dataset_pattern)
+    for key, entry in images.items():
+        entry["datasets"] = usage.get(key, [])
+    manifest = {
+        "settings": settings,
+        "images": dict(sorted(images.items())),
+        "missing": {key: datasets for key, datasets in sorted(usage.items())
+                    if key.startswith(f"/{source_folder}/") and key not in images},
+    }
+    save_manifest(manifest, manifest_path)
+    _prune(output_folder, images, manifest_path)
+    return manifest, len(todo), len(sources) - len(todo)
+
+
+def _prune(output_folder, images, manifest_path):
+    """Hapus varian yang tidak lagi ada di manifest (sumber dihapus / setting berubah)."""
+    keep = {os.path.normpath(manifest_path)}
+    for entry in images.values():
+        for variant in entry.get("variants", {}).values():
+            keep.update(os.path.normpath(path.lstrip("/")) for key, path in variant.items()
+                        if key in FORMATS)
+    for name in os.listdir(output_folder):
+        path = os.path.normpath(os.path.join(output_folder, name))
+        if path not in keep and os.path.isfile(path):
+            os.remove(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resize public/player images to card size as WebP + PNG")
+    parser.add_argument("--cards", default=",".join(CARD_SIZES),
+                        help=f"Card layouts to emit, comma separated ({', '.join(CARD_SIZES)})")
+    parser.add_argument("--formats", default=",".join(DEFAULT_FORMATS),
+                        help=f"Output formats, comma separated ({', '.join(FORMATS)})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Process pool size")
+    parser.add_argument("--force", action="store_true", help="Re-encode every image")
+    args = parser.parse_args(argv)
+
+    cards = [card.strip() for card in args.cards.split(",") if card.strip()]
+    formats = [fmt.strip().lower() for fmt in args.formats.split(",") if fmt.strip()]
+    unknown = [card for card in cards if card not in CARD_SIZES] + [fmt for fmt in formats if fmt not in FORMATS]
+    if unknown:
+        parser.error(f"Tidak dikenal: {', '.join(unknown)}")
+    try:
+        from PIL import features
+    except ImportError:
+        sys.exit("Pillow belum terpasang: pip install Pillow")
+    for fmt in formats:
+        if fmt in ("webp", "avif") and not features.check(fmt):
+            sys.exit(f"Pillow ini tidak mendukung {fmt.upper()}")
+
+    started = time.perf_counter()
+    manifest, processed, skipped = optimize_folder(cards, formats, args.workers, args.force)
+    errors = {key: entry["error"] for key, entry in manifest["images"].items() if entry.get("error")}
+    for key, error in errors.items():
+        print(f"❌ {key}: {error}")
+    source_bytes = sum(os.path.getsize(key.lstrip("/")) for key in manifest["images"] if os.path.exists(key.lstrip("/")))
+    for card in cards:
+        for fmt in formats:
+            total = sum(entry["variants"][card][f"{fmt}_bytes"] for entry in manifest["images"].values()
+                        if card in entry.get("variants", {}))
+            print(f"   - {card} {fmt}: {total / 1e6:.1f} MB (source {source_bytes / 1e6:.1f} MB)")
+    if manifest["missing"]:
+        print(f"⚠️  {len(manifest['missing'])} images referenced in gaming/*.json not found in {SOURCE_FOLDER}/")
+    print(f"✅ {processed} optimized, {skipped} unchanged, {len(errors)} errors in "
+          f"{time.perf_counter() - started:.1f}s -> {MANIFEST_FILE}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""
+Render video panjang secara paralel per potongan frame (pengganti "Bagian 1-4"
+manual di .github/workflows/main.yml).
+
+Total frame dihitung dari konstanta timing yang sama dengan script SRT
+(srt_engine.timeline.Timeline, mirror src/config.ts). Rentang frame dipotong di
+batas slot kartu (intro ikut potongan pertama, ending ikut potongan terakhir),
+setiap potongan dirender dengan `npx remotion render --frames=a-b` di worker
+pool terbatas dan dicoba ulang jika gagal, lalu digabung tanpa re-encode
+dengan ffmpeg concat demuxer (-c copy).
+
+Potongan yang sudah selesai disimpan di <output>.parts/ bersama plan.json,
+jadi kalau proses mati, run berikutnya hanya merender potongan yang belum ada.
+
+Contoh (jalankan dari folder public/):
+    python render_orchestrator.py --cards 100 --workers 4
+    python render_orchestrator.py --cards 100 --cards-per-chunk 10 --output ../out/video.mp4 --dry-run
+    python render_orchestrator.py --cards 43 -- --log=verbose --disable-dev-shm-usage
+    python render_orchestrator.py --plan render_plans/gaming/onic.json --output ../out/onic.mp4
+"""
+import argparse
+import json
+import math
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from srt_engine.plan import PlanError, load_plan
+from srt_engine.timeline import Timeline
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(BASE_DIR)
+CONFIG_TS = os.path.join(PROJECT_DIR, "src", "config.ts")
+DEFAULT_COMPOSITION = "DataListCard"
+DEFAULT_OUTPUT = os.path.join(PROJECT_DIR, "out", "video.mp4")
+REMOTION_CMD = ["npx", "remotion"]
+DEFAULT_RETRIES = 2
+RETRY_DELAY = 5.0
+# Naikkan jika format plan.json berubah agar potongan lama tidak dipakai
+PLAN_VERSION = 1
+
+
+class RenderError(Exception):
+    pass
+
+
+def config_cards_to_show(path=CONFIG_TS):
+    """CONFIG.cardsToShow dari src/config.ts (durationInFrames composition di Root.tsx)."""
+    with open(path, "r", encoding="utf-8") as f:
+        match = re.search(r"^\s*cardsToShow:\s*(\d+)", f.read(), re.MULTILINE)
+    if not match:
+        raise RenderError(f"cardsToShow tidak ditemukan di {path}")
+    return int(match.group(1))
+
+
+def plan_chunks(cards, timeline=None, cards_per_chunk=None, chunks=None):
+    """
+    List (start, end) frame inklusif untuk setiap potongan, dipotong di batas
+    slot kartu. Tentukan cards_per_chunk atau jumlah chunks (dibagi rata).
+    """
+    timeline = timeline or Timeline()
+    total = timeline.total_frames(cards)
+    if cards <= 0:
+        return [(0, total - 1)]
+    if cards_per_chunk is None:
+        cards_per_chunk = math.ceil(cards / max(1, min(chunks or 1, cards)))
+    cards_per_chunk = max(1, cards_per_chunk)
+    bounds = [0]
+    for first in range(cards_per_chunk, cards, cards_per_chunk):
+        bounds.append(timeline.card_slot(first)[0])
+    bounds.append(total)
+    return [(start, end - 1) for start, end in zip(bounds, bounds[1:])]
+
+
+def plan_props(path):
+    """(cards, props) untuk render dari render plan (render_plan.py); planPath relatif terhadap public/."""
+    try:
+        plan = load_plan(path)
+    except (OSError, ValueError) as e:
+        raise RenderError(f"Failed to load plan {path}: {e}") from e
+    except PlanError as e:
+        raise RenderError(str(e)) from e
+    cards = plan["cardsToShow"]
+    if Timeline().total_frames(cards) != plan["durationInFrames"]:
+        raise RenderError(f"{path}: durationInFrames {plan['durationInFrames']} does not match the timeline, "
+                          "regenerate the plan")
+    plan_path = os.path.relpath(os.path.abspath(path), BASE_DIR).replace(os.sep, "/")
+    return cards, {"planPath": plan_path}
+
+
+def ffmpeg_command():
+    """ffmpeg dari PATH, atau ffmpeg bawaan Remotion (npx remotion ffmpeg)."""
+    return [shutil.which("ffmpeg")] if shutil.which("ffmpeg") else REMOTION_CMD + ["ffmpeg"]
+
+
+def render_command(composition, part_path, frames, props=None, concurrency=None, extra_args=(),
+                   remotion=REMOTION_CMD):
+    command = list(remotion) + ["render", composition, part_path, f"--frames={frames[0]}-{frames[1]}",
+                                "--disable-audio"]
+    if concurrency:
+        command.append(f"--concurrency={concurrency}")
+    if props:
+        command.append(f"--props={json.dumps(props, separators=(',', ':'))}")
+    return command + list(extra_args)
+
+
+class ChunkedRender:
+    """Satu video yang dirender per potongan di folder <output>.parts/."""
+
+    def __init__(self, output, composition=DEFAULT_COMPOSITION, cards=None, props=None, timeline=None,
+                 cards_per_chunk=None, chunks=None, concurrency=None, extra_args=(), remotion=REMOTION_CMD):
+        self.output = os.path.abspath(output)
+        self.composition = composition
+        self.props = dict(props or {})
+        if "planPath" not in self.props:
+            # Tanpa plan, Root.tsx mengukur composition dari props.cardsToShow (default
+            # CONFIG.cardsToShow), jadi jumlah kartu harus ikut dikirim sebagai prop
+            prop_cards = self.props.get("cardsToShow")
+            if cards is not None and prop_cards is not None and prop_cards != cards:
+                raise RenderError(f"--cards {cards} conflicts with cardsToShow {prop_cards} in --props")
+            if cards is None:
+                cards = config_cards_to_show() if prop_cards is None else prop_cards
+            else:
+                self.props["cardsToShow"] = cards
+        self.cards = config_cards_to_show() if cards is None else cards
+        self.timeline = timeline or Timeline()
+        self.frames = plan_chunks(self.cards, self.timeline, cards_per_chunk, chunks)
+        self.concurrency = concurrency
+        self.extra_args = list(extra_args)
+        self.remotion = list(remotion)
+        self.parts_dir = self.output + ".parts"
+
+    @property
+    def total_frames(self):
+        return self.timeline.total_frames(self.cards)
+
+    def plan(self):
+        return {
+            "version": PLAN_VERSION,
+            "composition": self.composition,
+            "cards": self.cards,
+            "total_frames": self.total_frames,
+            "timeline": self.timeline.describe(),
+            "frames": [list(frames) for frames in self.frames],
+            "props": self.props,
+            "extra_args": self.extra_args,
+        }
+
+    def part_path(self, index):
+        return os.path.join(self.parts_dir, f"part-{index:04d}.mp4")
+
+    def prepare(self, log=print):
+        """Siapkan folder potongan; potongan dari plan yang berbeda dibuang."""
+        plan_path = os.path.join(self.parts_dir, "plan.json")
+        try:
+            with open(plan_path, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        except (FileNotFoundError, ValueError):
+            previous = None
+        if previous is not None and previous != self.plan():
+            log(f"♻️  Plan changed, discarding old parts in {self.parts_dir}")
+            shutil.rmtree(self.parts_dir)
+        os.makedirs(self.parts_dir, exist_ok=True)
+        with open(plan_path, "w", encoding="utf-8") as f:
+            json.dump(self.plan(), f, indent=2)
+
+    def pending(self):
+        return [i for i in range(len(self.frames)) if not os.path.exists(self.part_path(i))]
+
+    def render_part(self, index, retries=DEFAULT_RETRIES, run=subprocess.run, log=print):
+        """Render satu potongan (dengan retry); file baru dipindah ke nama final setelah sukses."""
+        final = self.part_path(index)
+        partial = os.path.join(self.parts_dir, f"part-{index:04d}.partial.mp4")
+        log_path = os.path.join(self.parts_dir, f"part-{index:04d}.log")
+        command = render_command(self.composition, partial, self.frames[index], self.props,
+                                 self.concurrency, self.extra_args, self.remotion)
+        for attempt in range(retries + 1):
+            started = time.perf_counter()
+            with open(log_path, "a", encoding="utf-8") as log_file:
+                log_file.write(f"$ {' '.join(command)}\n")
+                log_file.flush()
+                result = run(command, cwd=PROJECT_DIR, stdout=log_file, stderr=subprocess.STDOUT)
+            if result.returncode == 0 and os.path.exists(partial):
+                os.replace(partial, final)
+                return time.perf_counter() - started
+            if attempt < retries:
+                delay = RETRY_DELAY * (attempt + 1)
+                log(f"⚠️  part {index} failed (exit {result.returncode}), retry {attempt + 1}/{retries} in {delay:.0f}s")
+                time.sleep(delay)
+        raise RenderError(f"part {index} frames {self.frames[index]} failed after {retries + 1} attempts, see {log_path}")
+
+    def concat(self, run=subprocess.run):
+        """Gabung semua potongan ke output dengan concat demuxer (-c copy, tanpa re-encode)."""
+        list_path = os.path.join(self.parts_dir, "concat.txt")
+        with open(list_path, "w", encoding="utf-8") as f:
+            for i in range(len(self.frames)):
+                f.write(f"file '{os.path.basename(self.part_path(i))}'\n")
+        tmp_output = self.output + ".tmp.mp4"
+        command = ffmpeg_command() + ["-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                                      "-i", list_path, "-c", "copy", "-movflags", "+faststart", tmp_output]
+        result = run(command, cwd=PROJECT_DIR)
+        if result.returncode != 0 or not os.path.exists(tmp_output):
+            raise RenderError(f"ffmpeg concat failed (exit {result.returncode})")
+        os.replace(tmp_output, self.output)
+        return self.output
+
+    def run(self, workers=1, retries=DEFAULT_RETRIES, keep_parts=False, run=subprocess.run, log=print):
+        """Render potongan yang belum ada lalu concat. Return dict statistik."""
+        self.prepare(log)
+        pending = self.pending()
+        log(f"🎬 {self.composition}: {self.cards} cards, {self.total_frames} frames in {len(self.frames)} parts "
+            f"({len(self.frames) - len(pending)} done, {len(pending)} to render, {workers} workers)")
+        started = time.perf_counter()
+        timings = {}
+        failures = []
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending)))) as pool:
+                futures = {pool.submit(self.render_part, i, retries, run, log): i for i in pending}
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        timings[index] = future.result()
+                    except RenderError as e:
+                        failures.append(str(e))
+                        log(f"❌ {e}")
+                        continue
+                    start, end = self.frames[index]
+                    log(f"✅ part {index} frames {start}-{end} in {timings[index]:.0f}s")
+        if failures:
+            raise RenderError(f"{len(failures)} parts failed; rerun to resume")
+        self.concat(run)
+        if not keep_parts:
+            shutil.rmtree(self.parts_dir)
+        return {"output": self.output, "parts": len(self.frames), "rendered": len(pending),
+                "seconds": time.perf_counter() - started, "timings": timings}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a Remotion composition in parallel frame-range chunks")
+    parser.add_argument("--composition", default=DEFAULT_COMPOSITION, help=f"Composition id (default: {DEFAULT_COMPOSITION})")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--cards", type=int, help="Number of cards (default: cardsToShow in src/config.ts)")
+    source.add_argument("--plan", help="Render plan from render_plan.py (sets cards and the planPath prop)")
+    parser.add_argument("--props", help="Input props as JSON string or path to a JSON file")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help=f"Final video (default: {DEFAULT_OUTPUT})")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--chunks", type=int, help="Number of parts (default: --workers)")
+    group.add_argument("--cards-per-chunk", type=int, help="Cards per part")
+    parser.add_argument("--workers", type=int, default=2, help="Parts rendered at the same time")
+    parser.add_argument("--concurrency", type=int,
+                        help="Remotion --concurrency per part (default: CPU count / workers)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help="Retries per failed part")
+    parser.add_argument("--keep-parts", action="store_true", help="Keep the rendered parts after concatenation")
+    parser.add_argument("--dry-run", action="store_true", help="Print the chunk plan and commands only")
+    parser.add_argument("extra", nargs="*", help="Extra arguments for remotion render (after --)")
+    args = parser.parse_args(argv)
+
+    props = None
+    if args.props:
+        if os.path.isfile(args.props):
+            with open(args.props, "r", encoding="utf-8") as f:
+                props = json.load(f)
+        else:
+            props = json.loads(args.props)
+    cards = args.cards
+    if args.plan:
+        try:
+            cards, plan_prop = plan_props(args.plan)
+        except RenderError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+        props = dict(props or {}, **plan_prop)
+    concurrency = args.concurrency or max(1, (os.cpu_count() or 1) // max(1, args.workers))
+    try:
+        job = ChunkedRender(args.output, args.composition, cards, props, None, args.cards_per_chunk,
+                            args.chunks or args.workers, concurrency, args.extra)
+    except RenderError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    if args.dry_run:
+        print(f"🎬 {job.composition}: {job.cards} cards, {job.total_frames} frames, {len(job.frames)} parts")
+        for i, frames in enumerate(job.frames):
+            print(" ".join(render_command(job.composition, job.part_path(i), frames, job.props,
+                                          job.concurrency, job.extra_args, job.remotion)))
+        return 0
+    try:
+        result = job.run(args.workers, args.retries, args.keep_parts)
+    except RenderError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    print(f"✅ {result['output']} ({result['rendered']}/{result['parts']} parts rendered in {result['seconds']:.0f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Buat render plan (record tervalidasi + terurut, cardsToShow, durationInFrames)
+untuk dataset, supaya panjang video selalu sama dengan jumlah kartu tanpa
+mengedit CONFIG.cardsToShow.
+
+Plan ditulis ke render_plans/<kategori>/<nama>.json dan dipakai composition
+lewat prop planPath:
+    npx remotion render DataListCard --props='{"planPath":"render_plans/gaming/onic.json"}'
+atau lewat render_orchestrator.py --plan / render_queue.py.
+
+Contoh (jalankan dari folder public/):
+    python render_plan.py gaming/onic.json
+    python render_plan.py youtube/*.json --cards 100
+    python render_plan.py instagram/ig-vn.json --drop-invalid
+    python render_plan.py youtube/*.json --card CardYouTube
+"""
+import argparse
+import glob
+import sys
+import time
+
+from srt_engine.plan import CARD_FIELDS, DEFAULT_CARD, PLAN_FOLDER, PlanError, build_plan, plan_path, write_plan
+from srt_engine.config import get_duration_in_seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate and sort datasets into render plans for CardList")
+    parser.add_argument("files", nargs="+", help="Dataset JSON files or globs")
+    parser.add_argument("--cards", type=int, help="Maximum cards per video (default: all valid records)")
+    parser.add_argument("--drop-invalid", action="store_true",
+                        help="Skip records that fail the schema instead of rejecting the dataset")
+    parser.add_argument("--card", default=DEFAULT_CARD, choices=sorted(CARD_FIELDS),
+                        help=f"Card component whose fields are kept in the payload (default: {DEFAULT_CARD})")
+    parser.add_argument("--folder", default=PLAN_FOLDER, help=f"Output folder (default: {PLAN_FOLDER})")
+    args = parser.parse_args(argv)
+
+    files = [path for pattern in args.files for path in (sorted(glob.glob(pattern)) or [pattern])]
+    started = time.perf_counter()
+    failed = 0
+    for json_file in files:
+        try:
+            plan = build_plan(json_file, args.cards, drop_invalid=args.drop_invalid, card=args.card)
+        except PlanError as e:
+            print(f"❌ {e}")
+            failed += 1
+            continue
+        output = write_plan(plan, plan_path(json_file, args.folder))
+        dropped = f", {plan['dropped']} invalid dropped" if plan["dropped"] else ""
+        print(f"🗺  {output}: {plan['cardsToShow']} cards, {plan['durationInFrames']} frames "
+              f"({get_duration_in_seconds(plan['durationInFrames']):.1f}s){dropped}")
+    print(f"✅ {len(files) - failed} plans, {failed} failed in {time.perf_counter() - started:.1f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+"""
+Antrean render: satu video + SRT untuk setiap dataset (mis. semua youtube/*.json)
+tanpa mengedit CONFIG.DATA_SOURCE atau import di CardList.tsx.
+
+Setiap job:
+1. buat render plan dataset (render_plan.py: record tervalidasi + terurut,
+   cardsToShow dan durationInFrames) di render_plans/<kategori>/;
+2. generate SRT dataset (srt_engine, sama seperti python -m srt_engine);
+3. render composition (default DataListCard) dengan input prop
+   {"planPath": <plan>} lewat render_orchestrator (potongan paralel + resume);
+video ditulis di sebelah SRT dengan nama yang sama (out/<kategori>/<nama>.mp4 + .srt).
+
+Semua job berbagi satu budget concurrency (--budget, default jumlah CPU):
+maksimal budget // --per-process proses `remotion render` jalan bersamaan,
+dibagi rata antar job yang sedang berjalan. State antrean disimpan di
+out/render_queue.json (status, percobaan, timing per job), jadi antrean bisa
+ditambah kapan saja dan dilanjutkan setelah crash.
+
+Contoh (jalankan dari folder public/):
+    python render_queue.py add youtube/*.json instagram/ig-*_updated.json
+    python render_queue.py run --budget 16 --per-process 4
+    python render_queue.py status
+    python render_queue.py retry        # job gagal kembali ke antrean
+"""
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from render_orchestrator import DEFAULT_COMPOSITION, PROJECT_DIR, REMOTION_CMD, ChunkedRender, RenderError
+from srt_engine.engine import SrtError, build_srt
+from srt_engine.normalize import normalize_records
+from srt_engine.plan import PLAN_FOLDER, PlanError, build_plan, plan_path, select_records, write_plan
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_FOLDER = os.path.join(PROJECT_DIR, "out")
+QUEUE_FILE = os.path.join(OUTPUT_FOLDER, "render_queue.json")
+DEFAULT_PER_PROCESS = 4
+MAX_ATTEMPTS = 2
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+def dataset_prop(dataset):
+    """Path dataset relatif terhadap public/ untuk prop dataSourcePath (staticFile)."""
+    return os.path.relpath(os.path.abspath(dataset), BASE_DIR).replace(os.sep, "/")
+
+
+class RenderQueue:
+    """State antrean di file JSON; setiap perubahan langsung disimpan (atomic)."""
+
+    def __init__(self, path=QUEUE_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.jobs = json.load(f).get("jobs", [])
+        except (FileNotFoundError, ValueError):
+            self.jobs = []
+
+    def save(self):
+        with self.lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"jobs": self.jobs}, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+    def add(self, dataset, composition=DEFAULT_COMPOSITION, output_folder=OUTPUT_FOLDER):
+        """Tambah job (dataset yang sudah ada di antrean dan belum selesai tidak digandakan)."""
+        prop = dataset_prop(dataset)
+        for job in self.jobs:
+            if job["dataset"] == prop and job["composition"] == composition and job["status"] != DONE:
+                return None
+        category = prop.split("/", 1)[0] if "/" in prop else ""
+        job = {
+            "id": max((job["id"] for job in self.jobs), default=0) + 1,
+            "dataset": prop,
+            "composition": composition,
+            "output_folder": os.path.join(output_folder, category),
+            "status": QUEUED,
+            "attempts": 0,
+            "cards": None,
+            "plan": None,
+            "srt": None,
+            "video": None,
+            "error": None,
+            "timings": {},
+            "queued_at": int(time.time()),
+        }
+        self.jobs.append(job)
+        return job
+
+    def update(self, job, **changes):
+        with self.lock:
+            job.update(changes)
+        self.save()
+
+    def recover(self):
+        """Job "running" dari proses yang mati dikembalikan ke antrean."""
+        for job in self.jobs:
+            if job["status"] == RUNNING:
+                job["status"] = QUEUED
+        self.save()
+
+    def pending(self):
+        return [job for job in self.jobs if job["status"] == QUEUED]
+
+
+class ProcessBudget:
+    """Batasi jumlah proses `remotion render` di semua job; dipakai sebagai pengganti subprocess.run."""
+
+    def __init__(self, slots, run):
+        self.semaphore = threading.BoundedSemaphore(max(1, slots))
+        self._run = run
+
+    def __call__(self, command, **kwargs):
+        if command[len(REMOTION_CMD)] != "render":
+            # ffmpeg concat tidak memakai slot render
+            return self._run(command, **kwargs)
+        with self.semaphore:
+            return self._run(command, **kwargs)
+
+
+def run_job(queue, job, slots, per_process, run, retries=1, drop_invalid=False, log=print):
+    """Plan, SRT lalu render satu job; hasil dan timing dicatat ke queue."""
+    started = time.perf_counter()
+    queue.update(job, status=RUNNING, attempts=job["attempts"] + 1, error=None, started_at=int(time.time()))
+    dataset = job["dataset"]
+    json_file = os.path.join(BASE_DIR, dataset)
+    try:
+        plan_started = time.perf_counter()
+        selected = select_records(json_file, drop_invalid=drop_invalid)
+        plan = build_plan(json_file, drop_invalid=drop_invalid, source=dataset, selected=selected)
+        plan_file = write_plan(plan, plan_path(json_file, os.path.join(BASE_DIR, PLAN_FOLDER)))
+        plan_seconds = time.perf_counter() - plan_started
+        srt_started = time.perf_counter()
+        # SRT dari record yang sama dengan kartu video (bukan dataset mentah), supaya
+        # record yang dibuang --drop-invalid tidak menggeser subtitle ke kartu lain
+        result = build_srt(json_file, srt_folder=job["output_folder"], records=normalize_records(selected[1]))
+        if result["cards"] != plan["cardsToShow"]:
+            raise SrtError(f"SRT has {result['cards']} cards but the plan renders {plan['cardsToShow']}")
+        srt_seconds = time.perf_counter() - srt_started
+        video = os.path.splitext(result["output"])[0] + ".mp4"
+        queue.update(job, cards=plan["cardsToShow"], plan=plan_file, srt=result["output"], video=video,
+                     timings=dict(job["timings"], plan=round(plan_seconds, 3), srt=round(srt_seconds, 3)))
+        render = ChunkedRender(
+            video, job["composition"], plan["cardsToShow"],
+            props={"planPath": dataset_prop(plan_file)},
+            chunks=slots, concurrency=per_process,
+        )
+        stats = render.run(workers=slots, retries=retries, run=run or subprocess.run,
+                           log=lambda message: log(f"[{job['id']}] {message}"))
+    except (PlanError, SrtError, RenderError, OSError, ValueError) as e:
+        status = FAILED if job["attempts"] >= MAX_ATTEMPTS else QUEUED
+        queue.update(job, status=status, error=f"{type(e).__name__}: {e}",
+                     timings=dict(job["timings"], total=round(time.perf_counter() - started, 3)))
+        log(f"❌ [{job['id']}] {dataset}: {e}" + (" (requeued)" if status == QUEUED else ""))
+        return False
+    queue.update(job, status=DONE, finished_at=int(time.time()),
+                 timings=dict(job["timings"], render=round(stats["seconds"], 3),
+                              total=round(time.perf_counter() - started, 3)))
+    log(f"✅ [{job['id']}] {dataset}: {job['cards']} cards -> {video} in {job['timings']['total']:.0f}s")
+    return True
+
+
+def run_queue(queue, budget=None, per_process=DEFAULT_PER_PROCESS, run=None, drop_invalid=False, log=print):
+    """Jalankan semua job queued sampai antrean habis. Return (done, failed)."""
+    budget = budget or os.cpu_count() or 1
+    per_process = max(1, min(per_process, budget))
+    slots = max(1, budget // per_process)
+    limited = ProcessBudget(slots, run or subprocess.run)
+    queue.recover()
+    done = failed = 0
+    log(f"🎞  {len(queue.pending())} jobs, budget {budget} ({slots} remotion processes x concurrency {per_process})")
+    while queue.pending():
+        jobs = queue.pending()
+        # Satu thread per job aktif; slot render dibagi lewat ProcessBudget
+        with ThreadPoolExecutor(max_workers=slots) as pool:
+            results = list(pool.map(lambda job: run_job(queue, job, slots, per_process, limited, drop_invalid=drop_invalid, log=log), jobs))
+        done += sum(results)
+        failed += sum(1 for job in jobs if job["status"] == FAILED)
+    return done, failed
+
+
+def print_status(queue):
+    counts = {}
+    for job in queue.jobs:
+        counts[job["status"]] = counts.get(job["status"], 0) + 1
+        timings = job.get("timings") or {}
+        timing = " ".join(f"{key} {value:.0f}s" for key, value in timings.items())
+        print(f"{job['id']:>4} {job['status']:<8} {job['dataset']:<45} cards={job['cards'] or '-':<4} {timing}"
+              + (f"  {job['error']}" if job["error"] else ""))
+    print("📋 " + (", ".join(f"{count} {status}" for status, count in sorted(counts.items())) or "empty queue"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Queue of dataset renders (video + SRT per dataset)")
+    parser.add_argument("--queue", default=QUEUE_FILE, help=f"Queue state file (default: {QUEUE_FILE})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    add = sub.add_parser("add", help="Add datasets to the queue")
+    add.add_argument("datasets", nargs="+", help="Dataset JSON files or globs (relative to public/)")
+    add.add_argument("--composition", default=DEFAULT_COMPOSITION)
+    add.add_argument("--output-folder", default=OUTPUT_FOLDER, help="Videos and SRTs go to <folder>/<category>/")
+    run = sub.add_parser("run", help="Process queued jobs")
+    run.add_argument("--budget", type=int, default=os.cpu_count() or 1,
+                     help="Total remotion concurrency across all jobs (default: CPU count)")
+    run.add_argument("--per-process", type=int, default=DEFAULT_PER_PROCESS,
+                     help="--concurrency for each remotion render process")
+    run.add_argument("--drop-invalid", action="store_true",
+                     help="Skip records that fail the schema instead of failing the job")
+    sub.add_parser("status", help="Show the queue")
+    sub.add_parser("retry", help="Move failed jobs back to the queue")
+    sub.add_parser("clear", help="Drop finished jobs from the queue")
+    args = parser.parse_args(argv)
+
+    queue = RenderQueue(args.queue)
+    if args.command == "add":
+        added = 0
+        for pattern in args.datasets:
+            for dataset in sorted(glob.glob(pattern)) or [pattern]:
+                if not os.path.isfile(dataset):
+                    print(f"File {dataset} tidak ditemukan.", file=sys.stderr)
+                    continue
+                added += queue.add(dataset, args.composition, args.output_folder) is not None
+        queue.save()
+        print(f"➕ {added} jobs added ({len(queue.pending())} queued)")
+    elif args.command == "run":
+        started = time.perf_counter()
+        done, failed = run_queue(queue, args.budget, args.per_process, drop_invalid=args.drop_invalid)
+        print(f"🏁 {done} done, {failed} failed in {time.perf_counter() - started:.0f}s")
+        return 1 if failed else 0
+    elif args.command == "retry":
+        for job in queue.jobs:
+            if job["status"] == FAILED:
+                job.update(status=QUEUED, attempts=0)
+        queue.save()
+        print_status(queue)
+    elif args.command == "clear":
+        queue.jobs = [job for job in queue.jobs if job["status"] != DONE]
+        queue.save()
+        print_status(queue)
+    else:
+        print_status(queue)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Uji paritas urutan: srt_engine.ordering vs comparator TSX (compareRawData di
+src/utils/sortRecords.ts) yang dijalankan di node.
+
+Untuk setiap dataset di public/<kategori>/*.json:
+- plan: record yang lolos rawDataSchema diurutkan engine (order_records) dan
+  oleh comparator TSX; urutannya harus identik;
+- srt: urutan record di subtitle (profile kategori) dibandingkan dengan urutan
+  kartu untuk record yang ada di keduanya. Record yang hanya ada di salah satu
+  (filter profile / alias field) dilaporkan sebagai peringatan.
+
+--fuzz N menambah N dataset acak (followers null bercampur number, tanggal
+invalid, nama beraksen/duplikat) untuk jalur comparator dan collation.
+
+Butuh node di PATH. Render berjalan dengan TZ=UTC, jadi node juga.
+
+Contoh (jalankan dari folder public/):
+    python sort_parity.py
+    python sort_parity.py youtube/*.json --fuzz 200 --seed 7
+"""
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+
+from srt_engine.engine import list_json_files
+from srt_engine.normalize import compile_plan
+from srt_engine.ordering import order_records
+from srt_engine.profiles import CATEGORY_PROFILES, profile_for_path
+from srt_engine.schema import validate_record
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+COMPARATOR_TS = os.path.join(os.path.dirname(BASE_DIR), "src", "utils", "sortRecords.ts")
+INDEX_KEY = "__parity_index"
+
+NODE_SCRIPT = """
+const compare = (a, b) => {
+%s
+};
+const datasets = JSON.parse(require("fs").readFileSync(0, "utf8"));
+const result = {};
+for (const [name, records] of Object.entries(datasets)) {
+  result[name] = records.slice().sort(compare).map((record) => record.%s);
+}
+process.stdout.write(JSON.stringify(result));
+"""
+
+
+def comparator_body(path=COMPARATOR_TS):
+    """Isi compareRawData di antara marker parity:begin dan parity:end."""
+    with open(path, "r", encoding="utf-8") as f:
+        match = re.search(r"//\s*parity:begin\n(.*?)//\s*parity:end", f.read(), re.DOTALL)
+    if not match:
+        raise SystemExit(f"parity:begin/parity:end marker tidak ditemukan di {path}")
+    return match.group(1)
+
+
+def tsx_order(datasets, body):
+    """Dict nama -> list index record setelah di-sort comparator TSX di node."""
+    node = shutil.which("node")
+    if not node:
+        raise SystemExit("node tidak ditemukan di PATH")
+    result = subprocess.run(
+        [node, "-e", NODE_SCRIPT % (body, INDEX_KEY)],
+        input=json.dumps(datasets), capture_output=True, text=True, env=dict(os.environ, TZ="UTC"),
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"node gagal:\n{result.stderr}")
+    return json.loads(result.stdout)
+
+
+def schema_records(raw):
+    """Record yang lolos schema (zod strip), ditandai index aslinya."""
+    records = []
+    for i, item in enumerate(raw if isinstance(raw, list) else []):
+        record, issues = validate_record(item)
+        if not issues:
+            record[INDEX_KEY] = i
+            records.append(record)
+    return records
+
+
+def srt_order(raw, profile):
+    """Index asli record dalam urutan subtitle profile (normalize + filter + sort)."""
+    items = [item for item in raw if isinstance(item, dict)] if isinstance(raw, list) else []
+    keys = set()
+    for item in items:
+        keys.update(item)
+    plan = compile_plan(frozenset(keys))
+    records = []
+    for i, item in enumerate(raw if isinstance(raw, list) else []):
+        if isinstance(item, dict) and plan.accepts(item):
+            record = plan.apply(item)
+            record[INDEX_KEY] = i
+            if profile.accept(record):
+                records.append(record)
+    return [record[INDEX_KEY] for record in profile.sort(records)]
+
+
+def first_difference(a, b):
+    for i, (x, y) in enumerate(zip(a, b)):
+        if x != y:
+            return i
+    return min(len(a), len(b))
+
+
+def fuzz_dataset(rng, size):
+    names = ["Alpha", "alpha", "Álvaro", "alvaro", "Zed", "zed", "Ömer", "O'Neil", "Mary Ann", "MaryAnn",
+             "_tag", "123go", "Éclair", "eclair", "Ñandu", "Bob", "bob", "", None]
+    dates = ["2020-01-05", "2020-1-5", "1/25/2020", "25/01/2020", "2019-05-12T10:00:00Z",
+             "2019-05-12T10:00:00.123456Z", "2023-09-13a", "2018-10-0", "", None]
+    records = []
+    for _ in range(size):
+        record = {}
+        name = rng.choice(names)
+        if name is not None:
+            record["name"] = name
+        date = rng.choice(dates)
+        if date is not None:
+            record["date"] = date
+        roll = rng.random()
+        if roll < 0.6:
+            record["followers_count"] = rng.choice([0, 1, 5, 5, 10, 1000, 2.5])
+        elif roll < 0.8:
+            record["followers_count"] = None
+        records.append(record)
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check srt_engine ordering against the CardList comparator (node)")
+    parser.add_argument("files", nargs="*", help="Datasets or globs (default: every category folder)")
+    parser.add_argument("--fuzz", type=int, default=0, help="Also check N random datasets")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for --fuzz")
+    args = parser.parse_args(argv)
+
+    if args.files:
+        files = [path for pattern in args.files for path in (sorted(glob.glob(pattern)) or [pattern])]
+    else:
+        files = [os.path.join(category, name) for category in CATEGORY_PROFILES if os.path.isdir(category)
+                 for name in list_json_files(category)]
+    raw_data = {}
+    for path in files:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                raw_data[path] = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  {path}: {e}")
+    rng = random.Random(args.seed)
+    for i in range(args.fuzz):
+        raw_data[f"fuzz-{i}"] = fuzz_dataset(rng, rng.randint(2, 80))
+
+    datasets = {name: schema_records(raw) for name, raw in raw_data.items()}
+    expected = tsx_order(datasets, comparator_body())
+    failures = warnings = 0
+    for name, records in datasets.items():
+        order = [record[INDEX_KEY] for record in order_records(records)]
+        if order != expected[name]:
+            failures += 1
+            at = first_difference(order, expected[name])
+            print(f"❌ plan {name}: differs at card {at} "
+                  f"(engine {order[at:at + 3]}, tsx {expected[name][at:at + 3]})")
+        if name.startswith("fuzz-"):
+            continue
+        try:
+            profile = profile_for_path(name)
+        except ValueError:
+            continue
+        subtitles = srt_order(raw_data[name], profile)
+        in_srt = set(subtitles)
+        in_cards = set(expected[name])
+        cards = [index for index in expected[name] if index in in_srt]
+        common = [index for index in subtitles if index in in_cards]
+        if common != cards:
+            failures += 1
+            at = first_difference(common, cards)
+            print(f"❌ srt  {name} ({profile.name}): differs at card {at} "
+                  f"(srt {common[at:at + 3]}, tsx {cards[at:at + 3]})")
+        if in_srt != in_cards:
+            warnings += 1
+            print(f"⚠️  srt  {name} ({profile.name}): {len(in_cards - in_srt)} cards without subtitle, "
+                  f"{len(in_srt - in_cards)} subtitles without card")
+    print(f"{'✅' if not failures else '❌'} {len(datasets)} datasets ({args.fuzz} fuzz): "
+          f"{failures} order mismatches, {warnings} membership warnings")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+SRT engine bersama untuk semua generator subtitle (srt.py, srt_gaming.py,
+srt_hero.py, srt_youtube.py).
+
+Contoh (jalankan dari folder public/):
+    python -m srt_engine --all --workers 8
+    python -m srt_engine gaming/onic.json youtube/indonesia.json
+"""
+from .batch import default_workers, folder_main, print_summary, run_batch, run_category_batch, run_folder_batch
+from .cache import RecordCache
+from .config import (
+    CACHE_FOLDER,
+    DATE_CACHE_FILE,
+    DURASI_PER_CARD_DETIK,
+    ENDING_DURATION,
+    FPS,
+    HEIGHT,
+    INTRO_DELAY_FRAMES,
+    INTRO_DELAY_SECONDS,
+    SRT_FOLDER,
+    WIDTH,
+    calculate_total_duration,
+    calculate_total_video_duration,
+    get_duration_in_seconds,
+)
+from .dates import DEFAULT_DATE, enable_date_cache, js_timestamp, parse_date, save_date_cache
+from .engine import (
+    SrtError,
+    build_cues,
+    build_srt,
+    iter_cues,
+    category_jobs,
+    generate_all,
+    generate_folder,
+    generate_srt,
+    list_json_files,
+    load_prepared_records,
+    load_records,
+    prepare_records,
+    print_configuration,
+)
+from .formats import DEFAULT_FORMATS, FORMATS, output_path, write_formats
+from .manifest import MANIFEST_FILE, BuildManifest, make_fingerprint, stale_reasons, timing_fingerprint
+from .normalize import FIELD_ALIASES, NORMALIZER_VERSION, clean_text, get_field, normalize_record, normalize_records
+from .ordering import CARDLIST_ORDER, collation_key, compare_records, compare_with, order_records, sort_records
+from .plan import (
+    CARD_FIELDS,
+    DEFAULT_CARD,
+    PLAN_FOLDER,
+    PLAN_VERSION,
+    PlanError,
+    build_plan,
+    canonical_record,
+    load_plan,
+    plan_path,
+    select_records,
+    write_plan,
+)
+from .profiles import (
+    CATEGORY_PROFILES,
+    PROFILES,
+    Profile,
+    format_number,
+    get_profile,
+    profile_for_path,
+    register_profile,
+)
+from .schema import RAW_DATA_SCHEMA, SchemaError, validate_records
+from .timeline import ALIGNMENTS, SLOTS, TRIGGER, Timeline, trigger_offset
+from .timing import format_time
+from .writer import STDOUT, format_ms, iter_srt_blocks, seconds_to_ms, write_srt
@@ -0,0 +1,89 @@
+import argparse
+import contextlib
+import sys
+import time
+
+from .batch import default_workers, print_summary, run_batch
+from .cache import DEFAULT_MAX_BYTES, RECORD_CACHE_FOLDER, RecordCache
+from .config import DATE_CACHE_FILE, SRT_FOLDER
+from .manifest import MANIFEST_FILE, BuildManifest
+from .engine import category_jobs, print_configuration
+from .profiles import CATEGORY_PROFILES, PROFILES
+from .formats import DEFAULT_FORMATS, FORMATS
+from .timeline import ALIGNMENTS, SLOTS, Timeline
+from .writer import STDOUT
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m srt_engine", description="Generate SRT subtitles for card videos")
+    parser.add_argument("files", nargs="*", help="JSON files to process (profile inferred from folder name)")
+    parser.add_argument("--profile", choices=sorted(PROFILES), help="Force a profile for all files")
+    parser.add_argument("--all", action="store_true", help="Process every category folder in one pass")
+    parser.add_argument("--categories", nargs="+", choices=sorted(CATEGORY_PROFILES), help="Category folders for --all")
+    parser.add_argument("--base", default=".", help="Folder containing the category folders (default: .)")
+    parser.add_argument("--out", default=SRT_FOLDER, help=f"Output folder, or - to stream the SRT to stdout (default: {SRT_FOLDER})")
+    parser.add_argument("--workers", type=int, default=default_workers(),
+                        help="Process pool size; 1 runs sequentially (default: CPU count)")
+    parser.add_argument("--date-cache", default=DATE_CACHE_FILE,
+                        help=f"On-disk cache for free-form dates (default: {DATE_CACHE_FILE})")
+    parser.add_argument("--no-date-cache", dest="date_cache", action="store_const", const=None,
+                        help="Do not read or write the date cache")
+    parser.add_argument("--cache", default=RECORD_CACHE_FOLDER,
+                        help=f"Normalized-record cache folder (default: {RECORD_CACHE_FOLDER})")
+    parser.add_argument("--no-cache", dest="cache", action="store_const", const=None,
+                        help="Always re-parse JSON files")
+    parser.add_argument("--cache-max-mb", type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                        help="Evict least recently used cache entries above this size")
+    parser.add_argument("--clear-cache", action="store_true", help="Remove all cached records first")
+    parser.add_argument("--invalidate", nargs="+", metavar="JSON", default=[],
+                        help="Remove cached records for these JSON files first")
+    parser.add_argument("--manifest", default=MANIFEST_FILE,
+                        help=f"Build manifest for incremental runs (default: {MANIFEST_FILE})")
+    parser.add_argument("--force", action="store_true", help="Rebuild every output even if up to date")
+    parser.add_argument("--align", choices=ALIGNMENTS, default=SLOTS,
+                        help="Card cue timing: Sequence slots, or the frames where cards animate in (triggerFrame.ts)")
+    parser.add_argument("--formats", nargs="+", choices=sorted(FORMATS), default=list(DEFAULT_FORMATS),
+                        help="Subtitle formats written from the same cues (default: srt)")
+    args = parser.parse_args(argv)
+
+    record_cache = RecordCache(args.cache, int(args.cache_max_mb * 1024 * 1024)) if args.cache else None
+    if record_cache and args.clear_cache:
+        print(f"🧹 Cleared {record_cache.clear()} cached record sets")
+    if record_cache:
+        for json_file in args.invalidate:
+            print(f"🧹 Invalidated {record_cache.invalidate(json_file)} cached record sets for {json_file}")
+    if not args.files and not args.all:
+        if args.clear_cache or args.invalidate:
+            return 0
+        parser.error("give JSON files or --all")
+
+    if args.out == STDOUT:
+        # SRT ke stdout: log pindah ke stderr, file diproses berurutan, manifest tidak dipakai
+        with contextlib.redirect_stdout(sys.stderr):
+            return _run(args, _jobs(args), 1, record_cache, None)
+    return _run(args, _jobs(args), args.workers, record_cache, BuildManifest(args.manifest))
+
+
+def _jobs(args):
+    jobs = category_jobs(args.base, args.categories) if args.all else []
+    jobs.extend((json_file, args.profile) for json_file in args.files)
+    return jobs
+
+
+def _run(args, jobs, workers, record_cache, manifest):
+    print("🚀 Starting SRT generation...")
+    print_configuration()
+    print(f"\n📁 {len(jobs)} JSON files, {workers} workers")
+
+    started = time.perf_counter()
+    results = run_batch(
+        jobs, args.out, workers, args.date_cache, record_cache, manifest, args.force, Timeline(align=args.align),
+        args.formats,
+    )
+    print(f"\n{'='*50}")
+    failed = print_summary(results, time.perf_counter() - started)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
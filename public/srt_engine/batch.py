@@ -0,0 +1,173 @@
+"""
+Batch mode paralel: satu file JSON per job di process pool.
+Error dikumpulkan per file (tidak di-print lalu lanjut), ringkasan selalu
+urut sesuai path input agar hasilnya deterministik berapapun jumlah worker.
+"""
+import argparse
+import os
+import time
+
+from .cache import RecordCache
+from .config import DATE_CACHE_FILE, SRT_FOLDER
+from .dates import enable_date_cache, pop_new_date_entries, save_date_cache
+from .engine import build_srt, category_jobs, list_json_files, print_configuration
+from .formats import DEFAULT_FORMATS
+from .manifest import BuildManifest
+from .profiles import get_profile, profile_for_path
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def _run_job(job):
+    json_file, profile, srt_folder, cache, incremental, previous, timeline, formats = job
+    started = time.perf_counter()
+    try:
+        result = build_srt(json_file, profile, srt_folder, cache=cache, incremental=incremental, previous=previous,
+                           timeline=timeline, formats=formats)
+        result["error"] = None
+    except Exception as e:  # dikumpulkan ke ringkasan, bukan menghentikan batch
+        result = {
+            "json_file": json_file,
+            "profile": profile if isinstance(profile, str) else getattr(profile, "name", None),
+            # Path output yang seharusnya ditulis, supaya entry manifest-nya dibuang
+            "output": _output_path(json_file, profile, srt_folder),
+            "outputs": [],
+            "total": 0,
+            "cards": 0,
+            "cached": False,
+            "skipped": False,
+            "reasons": [],
+            "fingerprint": None,
+            "error": f"{type(e).__name__}: {e}",
+        }
+    result["seconds"] = time.perf_counter() - started
+    # Tanggal bebas yang baru di-resolve dikirim ke parent agar cache ditulis sekali
+    result["new_dates"] = pop_new_date_entries()
+    return result
+
+
+def _output_path(json_file, profile, srt_folder):
+    """Path SRT untuk json_file (seperti build_srt), None jika profile tidak dikenal."""
+    try:
+        profile = get_profile(profile) if profile is not None else profile_for_path(json_file)
+    except ValueError:
+        return None
+    return os.path.join(srt_folder, profile.output_name(json_file))
+
+
+def _previous_entry(manifest, json_file, profile, srt_folder):
+    output = _output_path(json_file, profile, srt_folder)
+    return manifest.get(output) if output else None
+
+
+def run_batch(jobs, srt_folder=SRT_FOLDER, workers=None, date_cache=None, record_cache=None, manifest=None,
+              force=False, timeline=None, formats=DEFAULT_FORMATS):
+    """
+    Jalankan list job (json_file, profile) dan return list hasil, urut sesuai json_file.
+    workers <= 1 menjalankan semuanya di proses ini (berguna untuk debugging).
+    date_cache: path cache tanggal on-disk (lihat dates.enable_date_cache), None = tanpa cache.
+    record_cache: RecordCache untuk file yang tidak berubah, None = tanpa cache.
+    manifest: BuildManifest untuk mode inkremental (output yang up to date dilewati),
+    None = selalu build ulang semua. force=True membangun ulang semua tapi tetap mencatat manifest.
+    timeline: Timeline untuk semua output (default: slot kartu dari config).
+    formats: format subtitle yang ditulis per file (lihat formats.FORMATS).
+    """
+    workers = default_workers() if workers is None else workers
+    incremental = manifest is not None and not force
+    tasks = sorted(
+        (
+            (json_file, profile, srt_folder, record_cache, incremental,
+             _previous_entry(manifest, json_file, profile, srt_folder) if incremental else None, timeline,
+             tuple(formats))
+            for json_file, profile in jobs
+        ),
+        key=lambda t: t[0],
+    )
+    if date_cache:
+        enable_date_cache(date_cache)
+    if workers <= 1 or len(tasks) <= 1:
+        results = [_run_job(task) for task in tasks]
+    else:
+        # Import di sini: multiprocessing cukup berat untuk run satu file
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            initializer=enable_date_cache if date_cache else None,
+            initargs=(date_cache,) if date_cache else (),
+        ) as executor:
+            results = list(executor.map(_run_job, tasks))
+    if date_cache:
+        new_entries = {}
+        for result in results:
+            new_entries.update(result.pop("new_dates"))
+        if new_entries:
+            save_date_cache(new_entries)
+    else:
+        for result in results:
+            result.pop("new_dates")
+    if manifest is not None:
+        for result in results:
+            if result["error"] and result["output"]:
+                manifest.forget(result["output"])
+            elif not result["error"] and not result["skipped"] and result["fingerprint"]:
+                manifest.record(result["output"], result["fingerprint"])
+        manifest.save()
+    return results
+
+
+def run_folder_batch(json_folder, profile=None, srt_folder=SRT_FOLDER, workers=None, date_cache=None,
+                     record_cache=None, manifest=None, force=False, timeline=None, formats=DEFAULT_FORMATS):
+    jobs = [(os.path.join(json_folder, f), profile) for f in list_json_files(json_folder)]
+    return run_batch(jobs, srt_folder, workers, date_cache, record_cache, manifest, force, timeline, formats)
+
+
+def run_category_batch(base_folder=".", categories=None, srt_folder=SRT_FOLDER, workers=None, date_cache=None,
+                       record_cache=None, manifest=None, force=False, timeline=None, formats=DEFAULT_FORMATS):
+    jobs = category_jobs(base_folder, categories)
+    return run_batch(jobs, srt_folder, workers, date_cache, record_cache, manifest, force, timeline, formats)
+
+
+def print_summary(results, elapsed=None):
+    """Print ringkasan per file dan return jumlah file yang gagal."""
+    failed = [r for r in results if r["error"]]
+    skipped = [r for r in results if r["skipped"]]
+    for r in results:
+        if r["error"]:
+            print(f"❌ {r['json_file']}: {r['error']}")
+        elif r["skipped"]:
+            print(f"⏭  {r['json_file']} -> {r['output']} (up to date)")
+        else:
+            source = "cache" if r["cached"] else "parsed"
+            why = f", rebuilt: {', '.join(r['reasons'])}" if r["reasons"] else ""
+            outputs = ", ".join(r["outputs"]) or r["output"]
+            print(f"✅ {r['json_file']} -> {outputs} ({r['cards']} cards, {source}{why}, {r['seconds']:.2f}s)")
+    built = len(results) - len(failed) - len(skipped)
+    line = f"📦 {built} rebuilt, {len(skipped)} up to date, {len(failed)} failed ({len(results)} files)"
+    if elapsed is not None:
+        line += f" in {elapsed:.2f}s"
+    print(line)
+    return len(failed)
+
+
+def folder_main(json_folder, profile, banner="🚀 Starting SRT generation...", argv=None):
+    """
+    Entry point bersama srt.py / srt_hero.py / srt_youtube.py: satu folder, satu
+    profile, mode inkremental. Return exit code (1 jika ada file yang gagal).
+    """
+    parser = argparse.ArgumentParser(description=f"Generate {profile} SRT subtitles for every JSON file in {json_folder}/")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="Process pool size (1 = sequential)")
+    parser.add_argument("--force", action="store_true", help="Rebuild every output even if up to date")
+    args = parser.parse_args(argv)
+    print(banner)
+    print_configuration()
+    started = time.perf_counter()
+    results = run_folder_batch(
+        json_folder, profile, SRT_FOLDER, args.workers, DATE_CACHE_FILE, RecordCache(), BuildManifest(), args.force
+    )
+    print(f"\n{'='*50}")
+    failed = print_summary(results, time.perf_counter() - started)
+    print(f"❌ SRT generation finished with {failed} failed files" if failed else "🎉 SRT generation completed!")
+    return 1 if failed else 0
@@ -0,0 +1,111 @@
+"""
+Cache record hasil normalize + filter + sort, dikunci dengan hash isi file JSON.
+
+Key = sha256(bytes file) + nama profile + NORMALIZER_VERSION, jadi file yang
+tidak berubah langsung memakai hasil sebelumnya tanpa json.loads, resolusi
+alias, clean_text maupun parse tanggal. Entry disimpan sebagai pickle;
+ukuran total folder dibatasi (entry yang paling lama tidak dipakai dihapus dulu).
+"""
+import hashlib
+import os
+import pickle
+
+from .config import CACHE_FOLDER
+from .normalize import NORMALIZER_VERSION
+
+RECORD_CACHE_FOLDER = os.path.join(CACHE_FOLDER, "records")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_SUFFIX = ".pickle"
+
+
+def hash_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+class RecordCache:
+    """Cache on-disk; aman dipakai beberapa proses sekaligus (write atomic, eviction toleran)."""
+
+    def __init__(self, folder=RECORD_CACHE_FOLDER, max_bytes=DEFAULT_MAX_BYTES):
+        self.folder = folder
+        self.max_bytes = max_bytes
+
+    def _path(self, file_hash, profile_name):
+        return os.path.join(self.folder, f"{file_hash}-{profile_name}-v{NORMALIZER_VERSION}{_SUFFIX}")
+
+    def get(self, file_hash, profile_name):
+        """Return (total_raw, records) atau None jika belum ada."""
+        path = self._path(file_hash, profile_name)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        try:
+            os.utime(path)  # tandai baru dipakai untuk eviction LRU
+        except OSError:
+            pass
+        return entry
+
+    def put(self, file_hash, profile_name, total_raw, records):
+        os.makedirs(self.folder, exist_ok=True)
+        path = self._path(file_hash, profile_name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((total_raw, records), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def entries(self):
+        """List (path, size, mtime) semua entry cache."""
+        result = []
+        try:
+            names = os.listdir(self.folder)
+        except FileNotFoundError:
+            return result
+        for name in names:
+            if not name.endswith(_SUFFIX):
+                continue
+            path = os.path.join(self.folder, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            result.append((path, stat.st_size, stat.st_mtime))
+        return result
+
+    def evict(self):
+        """Hapus entry paling lama tidak dipakai sampai total ukuran <= max_bytes."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in sorted(entries, key=lambda e: e[2]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def invalidate(self, json_file):
+        """Hapus semua entry untuk isi file json_file saat ini (semua profile/versi)."""
+        with open(json_file, "rb") as f:
+            prefix = hash_bytes(f.read()) + "-"
+        removed = 0
+        for path, _, _ in self.entries():
+            if os.path.basename(path).startswith(prefix):
+                try:
+                    os.remove(path)
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    def clear(self):
+        removed = 0
+        for path, _, _ in self.entries():
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
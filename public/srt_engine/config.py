@@ -0,0 +1,35 @@
+# Konfigurasi bersama untuk semua generator SRT (mirrors src/config.ts)
+
+SRT_FOLDER = "srt_output"
+CACHE_FOLDER = ".srt_cache"
+DATE_CACHE_FILE = CACHE_FOLDER + "/dates.json"
+
+# Video settings matching config.ts
+FPS = 60
+WIDTH = 2560
+HEIGHT = 1440
+
+# Timing settings matching config.ts
+INTRO_DELAY_FRAMES = 120  # Delay intro dalam frame (2 detik)
+ENDING_DURATION = 5       # Durasi ending dalam detik
+DURASI_PER_CARD_DETIK = 6 # Durasi per kartu dalam detik
+
+# Convert frame delays to seconds
+INTRO_DELAY_SECONDS = INTRO_DELAY_FRAMES / FPS  # 2 seconds
+
+
+def calculate_total_duration(cards_to_show):
+    """Calculate total duration matching config.ts getTotalDuration() function"""
+    return FPS * DURASI_PER_CARD_DETIK * cards_to_show
+
+
+def calculate_total_video_duration(cards_to_show):
+    """Calculate total video duration matching config.ts getTotalVideoDuration() function"""
+    total_duration = calculate_total_duration(cards_to_show)
+    ending_duration_frames = ENDING_DURATION * FPS
+    return INTRO_DELAY_FRAMES + total_duration + ending_duration_frames
+
+
+def get_duration_in_seconds(frames):
+    """Convert frames to seconds matching config.ts getDurationInSeconds() function"""
+    return frames / FPS
@@ -0,0 +1,188 @@
+"""
+Parser tanggal bertingkat untuk semua profile:
+
+1. fast path regex terkompilasi (ISO-8601 termasuk timestamp YouTube
+   "2012-02-20T00:43:50Z", d.m.Y, d/m/Y atau m/d/Y, Y/m/d) tanpa strptime;
+2. cache on-disk (opsional) untuk string bebas yang pernah di-resolve;
+3. dateparser (lambat, mendukung nama bulan Indonesia) sebagai fallback terakhir.
+   dateparser baru di-import saat pertama kali dibutuhkan, karena import-nya
+   memuat tabel locale yang besar.
+
+Hasil disimpan di LRU cache, jadi setiap string unik hanya di-parse sekali per proses.
+"""
+import json
+import os
+import re
+from datetime import datetime
+from functools import lru_cache
+
+DEFAULT_DATE = datetime(1900, 1, 1)
+
+_ISO_RE = re.compile(
+    r"^(\d{4})-(\d{1,2})-(\d{1,2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?)?"
+    r"(?:Z|[+-]\d{2}:?\d{2})?$"
+)
+_DOTTED_RE = re.compile(r"^(\d{1,2})\.(\d{1,2})\.(\d{4})$")
+_SLASHED_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+_YEAR_FIRST_SLASHED_RE = re.compile(r"^(\d{4})/(\d{1,2})/(\d{1,2})$")
+
+# Format yang diterima `new Date(str)` (V8) di CardList.tsx; lihat js_timestamp
+_JS_ISO_RE = re.compile(
+    r"^(\d{4})-(\d{1,2})-(\d{1,2})"
+    r"(?:[T ](\d{1,2}):(\d{2})(?::(\d{2})(?:\.(\d+))?)?)?"
+    r"(Z|[+-]\d{2}:?\d{2})?$"
+)
+_JS_SLASHED_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{2}|\d{4})$")
+_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+_disk_cache_path = None
+_disk_cache = {}
+_new_entries = {}
+
+
+def _fast_parse(date_str):
+    """Parse format umum langsung dari regex; return None jika bukan format yang dikenal."""
+    try:
+        m = _ISO_RE.match(date_str)
+        if m:
+            year, month, day, hour, minute, second = m.groups()
+            return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0))
+        m = _DOTTED_RE.match(date_str)
+        if m:
+            return datetime(int(m.group(3)), int(m.group(2)), int(m.group(1)))
+        m = _SLASHED_RE.match(date_str)
+        if m:
+            first, second, year = int(m.group(1)), int(m.group(2)), int(m.group(3))
+            # d/m/Y diutamakan; m/d/Y (mis. "10/25/2021") hanya jika hari > 12
+            if second > 12 >= first:
+                return datetime(year, first, second)
+            return datetime(year, second, first)
+        m = _YEAR_FIRST_SLASHED_RE.match(date_str)
+        if m:
+            return datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    except ValueError:
+        return None
+    return None
+
+
+def _slow_parse(date_str):
+    if date_str in _disk_cache:
+        cached = _disk_cache[date_str]
+        return datetime.fromisoformat(cached) if cached else None
+    # Coba parsing otomatis (termasuk bulan Indonesia)
+    import dateparser
+
+    dt = dateparser.parse(date_str, languages=["id", "en"])
+    if dt is not None and dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    if _disk_cache_path is not None:
+        entry = dt.isoformat() if dt else None
+        _disk_cache[date_str] = entry
+        _new_entries[date_str] = entry
+    return dt
+
+
+@lru_cache(maxsize=8192)
+def _parse_cached(date_str):
+    date_str = date_str.strip()
+    if not date_str or date_str == "no data":
+        return DEFAULT_DATE
+    return _fast_parse(date_str) or _slow_parse(date_str) or DEFAULT_DATE
+
+
+def parse_date(date_str):
+    if not isinstance(date_str, str) or not date_str:
+        return DEFAULT_DATE
+    return _parse_cached(date_str)
+
+
+def _js_day(year, month, day):
+    """Hari sejak epoch; V8 menerima hari 1..31 untuk bulan apa pun (30 Feb -> 1 Mar)."""
+    if not 1 <= month <= 12 or not 1 <= day <= 31:
+        return None
+    return datetime(year, month, 1).toordinal() - _EPOCH_ORDINAL + day - 1
+
+
+@lru_cache(maxsize=8192)
+def _js_timestamp_cached(date_str):
+    date_str = date_str.strip()
+    m = _JS_ISO_RE.match(date_str)
+    if m:
+        year, month, day, hour, minute, second, fraction, zone = m.groups()
+        days = _js_day(int(year), int(month), int(day))
+        hour, minute, second = int(hour or 0), int(minute or 0), int(second or 0)
+        if days is None or hour > 24 or minute > 59 or second > 59:
+            return None
+        ms = ((days * 24 + hour) * 60 + minute) * 60000 + second * 1000 + int((fraction or "0")[:3].ljust(3, "0"))
+        if zone and zone != "Z":
+            sign = -1 if zone[0] == "+" else 1
+            zone = zone[1:].replace(":", "")
+            ms += sign * (int(zone[:2]) * 60 + int(zone[2:])) * 60000
+        return ms
+    m = _JS_SLASHED_RE.match(date_str)
+    if m:
+        month, day, year = int(m.group(1)), int(m.group(2)), m.group(3)
+        year = int(year) if len(year) == 4 else int(year) + (2000 if int(year) < 50 else 1900)
+        days = _js_day(year, month, day)
+        return None if days is None else days * 86400000
+    return None
+
+
+def js_timestamp(date_str):
+    """
+    Epoch milidetik seperti `new Date(date_str).getTime()` di V8 (Chrome render
+    worker), None untuk Invalid Date (NaN). Berbeda dengan parse_date:
+    "10/3/2018" adalah m/d/Y (3 Oktober) dan tanggal tanpa zona dibaca sebagai
+    waktu lokal, di sini diasumsikan UTC (render di CI berjalan dengan TZ=UTC).
+    Hanya format yang ada di dataset (ISO-8601 dan m/d/Y) yang didukung.
+    """
+    if not isinstance(date_str, str):
+        return None
+    return _js_timestamp_cached(date_str)
+
+
+def enable_date_cache(path):
+    """Aktifkan cache on-disk untuk string tanggal bebas (dateparser) di path (file JSON)."""
+    global _disk_cache_path
+    _disk_cache_path = path
+    _disk_cache.clear()
+    _new_entries.clear()
+    _parse_cached.cache_clear()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            _disk_cache.update(data)
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+
+def pop_new_date_entries():
+    """Ambil (dan kosongkan) entry yang baru di-resolve sejak panggilan terakhir."""
+    entries = dict(_new_entries)
+    _new_entries.clear()
+    return entries
+
+
+def save_date_cache(extra_entries=None):
+    """Tulis cache ke disk (atomic), digabung dengan entry dari worker lain jika ada."""
+    if _disk_cache_path is None:
+        return
+    if extra_entries:
+        _disk_cache.update(extra_entries)
+    _new_entries.clear()
+    os.makedirs(os.path.dirname(_disk_cache_path) or ".", exist_ok=True)
+    tmp_path = _disk_cache_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(_disk_cache, f, ensure_ascii=False, indent=0, sort_keys=True)
+    os.replace(tmp_path, _disk_cache_path)
+
+
+def format_display_date(raw, parsed, fallback=""):
+    """Format tanggal untuk subtitle: "08 August 2025", atau raw jika tidak bisa di-parse."""
+    if not raw or raw in ("1900-01-01", "no data"):
+        return fallback
+    if parsed.year > 1900:
+        return parsed.strftime("%d %B %Y")
+    return raw
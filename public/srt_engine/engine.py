@@ -0,0 +1,244 @@
+import json
+import os
+
+from .config import (
+    DURASI_PER_CARD_DETIK,
+    ENDING_DURATION,
+    FPS,
+    INTRO_DELAY_SECONDS,
+    SRT_FOLDER,
+    calculate_total_duration,
+    calculate_total_video_duration,
+    get_duration_in_seconds,
+)
+from .cache import hash_bytes
+from .manifest import make_fingerprint, stale_reasons
+from .normalize import normalize_records
+from .profiles import CATEGORY_PROFILES, get_profile, profile_for_path
+from .timeline import Timeline
+from .formats import DEFAULT_FORMATS, output_path, write_formats
+from .writer import STDOUT
+
+
+class SrtError(Exception):
+    """File JSON tidak bisa diproses (gagal dibaca, kosong, atau tidak ada record valid)."""
+
+
+def _parse_records(data):
+    raw_records = json.loads(data)
+    if not isinstance(raw_records, list):
+        raw_records = []
+    return len(raw_records), normalize_records(raw_records)
+
+
+def load_records(json_file):
+    """Baca dan normalize satu file JSON. Return (jumlah record mentah, records)."""
+    with open(json_file, "rb") as f:
+        return _parse_records(f.read())
+
+
+def prepare_records(records, profile):
+    """Filter dan urutkan record yang sudah dinormalize sesuai profile."""
+    return profile.sort([r for r in records if profile.accept(r)])
+
+
+def load_prepared_records(json_file, profile, cache=None, data=None, file_hash=None):
+    """
+    Record yang sudah dinormalize, difilter dan diurutkan untuk profile.
+    Dengan cache (RecordCache), file yang isinya tidak berubah tidak di-parse ulang.
+    data/file_hash bisa diberikan jika isi file sudah dibaca.
+    Return (jumlah record mentah, records, cache_hit).
+    """
+    if data is None:
+        with open(json_file, "rb") as f:
+            data = f.read()
+    if cache is not None:
+        file_hash = file_hash or hash_bytes(data)
+        entry = cache.get(file_hash, profile.name)
+        if entry is not None:
+            return entry[0], entry[1], True
+    total_raw, records = _parse_records(data)
+    items = prepare_records(records, profile)
+    if cache is not None:
+        cache.put(file_hash, profile.name, total_raw, items)
+    return total_raw, items, False
+
+
+def iter_cues(records, profile, context, timeline=None):
+    """
+    Generator cue (start_ms, end_ms, lines): judul, satu per kartu, penutup.
+    Window dihitung dalam frame oleh Timeline dan baru dikonversi ke ms di sini.
+    """
+    timeline = timeline or Timeline()
+    for kind, index, start, end in timeline.windows(len(records)):
+        if kind == "card":
+            lines = profile.card_lines(records[index], context)
+        elif kind == "intro":
+            lines = [profile.title(context)]
+        else:
+            lines = [profile.ending_text]
+        yield timeline.frames_to_ms(start), timeline.frames_to_ms(end), lines
+
+
+def build_cues(records, profile, context, timeline=None):
+    """List semua cue dari iter_cues (untuk pemanggil yang butuh random access)."""
+    return list(iter_cues(records, profile, context, timeline))
+
+
+def build_srt(json_file, profile=None, srt_folder=SRT_FOLDER, records=None, cache=None,
+              incremental=False, previous=None, timeline=None, formats=DEFAULT_FORMATS):
+    """
+    Generate SRT untuk satu file JSON tanpa print; raise SrtError jika gagal.
+    srt_folder "-" menulis SRT ke stdout.
+    cache: RecordCache opsional untuk melewati parse/normalize file yang tidak berubah.
+    incremental: bandingkan dengan previous (entry BuildManifest) dan lewati output
+    yang masih up to date.
+    timeline: Timeline untuk window cue (default: slot kartu dari config).
+    formats: format subtitle yang ditulis (srt, vtt, ass, json), semua dari satu list cue.
+    Return dict ringkasan: json_file, profile, output, outputs, total, cards, cached,
+    skipped, reasons, fingerprint.
+    """
+    profile = get_profile(profile) if profile is not None else profile_for_path(json_file)
+    timeline = timeline or Timeline()
+    # srt_folder "-" menulis ke stdout (pipe) alih-alih ke file
+    srt_filename = STDOUT if srt_folder == STDOUT else os.path.join(srt_folder, profile.output_name(json_file))
+    result = {
+        "json_file": json_file,
+        "profile": profile.name,
+        "output": srt_filename,
+        "outputs": [output_path(srt_filename, fmt) for fmt in formats],
+        "total": 0,
+        "cards": 0,
+        "cached": False,
+        "skipped": False,
+        "reasons": [],
+        "fingerprint": None,
+    }
+    if records is None:
+        try:
+            with open(json_file, "rb") as f:
+                data = f.read()
+        except FileNotFoundError as e:
+            raise SrtError(f"Failed to load {json_file}: {e}") from e
+        file_hash = hash_bytes(data)
+        fingerprint = make_fingerprint(file_hash, profile, timeline, formats)
+        result["fingerprint"] = fingerprint
+        if incremental:
+            result["reasons"] = stale_reasons(previous, fingerprint, result["outputs"])
+            if not result["reasons"]:
+                result["skipped"] = True
+                result["cards"] = previous.get("cards", 0)
+                return result
+        try:
+            total_raw, items, cached = load_prepared_records(json_file, profile, cache, data, file_hash)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise SrtError(f"Failed to load {json_file}: {e}") from e
+    else:
+        total_raw, items, cached = len(records), prepare_records(records, profile), False
+
+    if not total_raw:
+        raise SrtError(f"No {profile.item_label} found in {json_file}")
+    if not items:
+        raise SrtError(f"No valid {profile.item_label} found in {json_file}")
+
+    # Automatically read total cards from JSON (matching config.ts cardsToShow logic)
+    context = profile.context(items, json_file)
+    if len(formats) == 1:
+        cues = iter_cues(items, profile, context, timeline)
+    else:
+        # Satu list cue in-memory dipakai ulang oleh setiap format
+        cues = build_cues(items, profile, context, timeline)
+    meta = {
+        "source": json_file,
+        "profile": profile.name,
+        "title": profile.title(context),
+        "cards": len(items),
+        "fps": timeline.fps,
+        "total_frames": timeline.total_frames(len(items)),
+        "align": timeline.align,
+    }
+    write_formats(srt_filename, cues, formats, meta)
+    result.update(total=total_raw, cards=len(items), cached=cached)
+    if result["fingerprint"] is not None:
+        result["fingerprint"]["cards"] = len(items)
+    return result
+
+
+def generate_srt(json_file, profile=None, srt_folder=SRT_FOLDER, records=None, cache=None):
+    """
+    Generate SRT untuk satu file JSON dengan profile tertentu.
+    Jika profile tidak diberikan, dipilih dari nama folder kategori.
+    records (hasil load_records) bisa diberikan agar file tidak dinormalize ulang.
+    """
+    try:
+        result = build_srt(json_file, profile, srt_folder, records, cache)
+    except SrtError as e:
+        print(f"❌ ERROR: {e}")
+        return
+
+    cards_to_show = result["cards"]
+    item_label = get_profile(result["profile"]).item_label
+    total_duration_seconds = get_duration_in_seconds(calculate_total_duration(cards_to_show))
+    total_video_duration_seconds = get_duration_in_seconds(calculate_total_video_duration(cards_to_show))
+
+    print(f"📊 Processed {json_file} (profile: {result['profile']}):")
+    print(f"   - Total {item_label} in JSON: {result['total']}")
+    print(f"   - Cards to show: {cards_to_show} (auto-read from JSON)")
+    print(f"✅ Generated: {result['output']} with {cards_to_show} {item_label}")
+    print(f"   - Content duration: {total_duration_seconds:.1f}s | Total video: {total_video_duration_seconds:.1f}s")
+    return result["output"]
+
+
+def list_json_files(json_folder):
+    """File *.json di level teratas folder (subfolder seperti youtube/100 dilewati)."""
+    return sorted(
+        f for f in os.listdir(json_folder)
+        if f.endswith(".json") and os.path.isfile(os.path.join(json_folder, f))
+    )
+
+
+def print_configuration():
+    print("📋 Configuration:")
+    print(f"   - FPS: {FPS}")
+    print(f"   - Duration per card: {DURASI_PER_CARD_DETIK} seconds")
+    print(f"   - Intro delay: {INTRO_DELAY_SECONDS} seconds")
+    print(f"   - Ending duration: {ENDING_DURATION} seconds")
+
+
+def generate_folder(json_folder, profile=None, srt_folder=SRT_FOLDER):
+    """Generate SRT untuk semua file JSON di satu folder kategori."""
+    json_files = list_json_files(json_folder)
+    print(f"\n📁 Found {len(json_files)} JSON files to process in {json_folder}")
+    outputs = []
+    for file in json_files:
+        print(f"\n{'='*50}")
+        output = generate_srt(os.path.join(json_folder, file), profile, srt_folder)
+        if output:
+            outputs.append(output)
+    return outputs
+
+
+def category_jobs(base_folder=".", categories=None):
+    """
+    List (json_file, profile_name) untuk semua folder kategori yang ada di base_folder.
+    categories: list nama folder (default: semua di CATEGORY_PROFILES).
+    """
+    jobs = []
+    for category in categories or list(CATEGORY_PROFILES):
+        json_folder = os.path.join(base_folder, category)
+        if not os.path.isdir(json_folder):
+            continue
+        for file in list_json_files(json_folder):
+            jobs.append((os.path.join(json_folder, file), CATEGORY_PROFILES[category]))
+    return jobs
+
+
+def generate_all(base_folder=".", categories=None, srt_folder=SRT_FOLDER):
+    """Generate SRT untuk semua kategori dalam satu proses."""
+    outputs = []
+    for json_file, profile in category_jobs(base_folder, categories):
+        print(f"\n{'='*50}")
+        output = generate_srt(json_file, profile, srt_folder)
+        if output:
+            outputs.append(output)
+    return outputs
@@ -0,0 +1,152 @@
+"""
+Format subtitle selain SRT: WebVTT, ASS dan JSON cue sheet.
+
+Semua format dibuat dari list cue yang sama (start_ms, end_ms, lines) sehingga
+data hanya di-load, di-sort dan diformat per kartu sekali; menulis beberapa
+format hanya menambah biaya serialisasi teks.
+
+Urutan cue selalu: judul, satu cue per kartu, penutup.
+"""
+import json
+import os
+
+from . import config
+from .writer import STDOUT, format_ms, iter_srt_blocks, write_text
+
+# Style ASS: judul/penutup, baris nama (baris pertama kartu) dan baris info/statistik
+ASS_STYLES = (
+    # name, fontsize, bold, margin bawah
+    ("Title", 72, -1, 96),
+    ("Name", 64, -1, 96),
+    ("Stats", 44, 0, 96),
+    ("Ending", 64, -1, 96),
+)
+ASS_FONT = "Rubik"  # font yang sama dengan CardList.tsx
+
+
+def format_vtt_ms(ms):
+    return format_ms(ms).replace(",", ".")
+
+
+def format_ass_ms(ms):
+    """Integer milidetik -> "H:MM:SS.cc" (ASS memakai centisecond)."""
+    centis = (ms + 5) // 10
+    seconds, centis = divmod(centis, 100)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02}:{seconds:02}.{centis:02}"
+
+
+def _vtt_escape(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _ass_escape(text):
+    return text.replace("{", "\\{").replace("}", "\\}").replace("\n", " ")
+
+
+def _srt_blocks(cues, meta=None):
+    return iter_srt_blocks(cues)
+
+
+def iter_vtt_blocks(cues, meta=None):
+    yield "WEBVTT\n\n"
+    for index, (start_ms, end_ms, lines) in enumerate(cues, start=1):
+        yield (
+            f"{index}\n{format_vtt_ms(start_ms)} --> {format_vtt_ms(end_ms)}\n"
+            + "\n".join(_vtt_escape(line) for line in lines) + "\n\n"
+        )
+
+
+def _ass_header(meta):
+    styles = "".join(
+        f"Style: {name},{ASS_FONT},{size},&H00FFFFFF,&H00FFFFFF,&H00000000,&H80000000,"
+        f"{bold},0,0,0,100,100,0,0,1,3,1,2,64,64,{margin},1\n"
+        for name, size, bold, margin in ASS_STYLES
+    )
+    return (
+        "[Script Info]\n"
+        f"Title: {meta.get('title', '')}\n"
+        "ScriptType: v4.00+\n"
+        f"PlayResX: {config.WIDTH}\n"
+        f"PlayResY: {config.HEIGHT}\n"
+        "WrapStyle: 0\n"
+        "ScaledBorderAndShadow: yes\n\n"
+        "[V4+ Styles]\n"
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, "
+        "Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
+        "Alignment, MarginL, MarginR, MarginV, Encoding\n"
+        f"{styles}\n"
+        "[Events]\n"
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+    )
+
+
+def iter_ass_blocks(cues, meta=None):
+    """Satu Dialogue per cue; baris nama dan baris statistik diberi style berbeda lewat override {\\r}."""
+    yield _ass_header(meta or {})
+    cues = list(cues)
+    last = len(cues) - 1
+    for index, (start_ms, end_ms, lines) in enumerate(cues):
+        if index == 0 or index == last:
+            style = "Title" if index == 0 else "Ending"
+            text = "\\N".join(_ass_escape(line) for line in lines)
+        else:
+            style = "Name"
+            text = "\\N".join(
+                _ass_escape(line) if i == 0 else "{\\rStats}" + _ass_escape(line)
+                for i, line in enumerate(lines)
+            )
+        yield f"Dialogue: 0,{format_ass_ms(start_ms)},{format_ass_ms(end_ms)},{style},,0,0,0,,{text}\n"
+
+
+def iter_json_blocks(cues, meta=None):
+    """Cue sheet JSON: {"meta": {...}, "cues": [{index, kind, start_ms, end_ms, start, end, lines}]}."""
+    cues = list(cues)
+    last = len(cues) - 1
+    yield '{"meta": ' + json.dumps(meta or {}, ensure_ascii=False) + ', "cues": [\n'
+    for index, (start_ms, end_ms, lines) in enumerate(cues):
+        kind = "intro" if index == 0 else ("ending" if index == last else "card")
+        cue = {
+            "index": index + 1,
+            "kind": kind,
+            "start_ms": start_ms,
+            "end_ms": end_ms,
+            "start": format_ms(start_ms),
+            "end": format_ms(end_ms),
+            "lines": lines,
+        }
+        yield ("  " if index == 0 else ", ") + json.dumps(cue, ensure_ascii=False) + "\n"
+    yield "]}\n"
+
+
+# format -> (ekstensi, generator(cues, meta))
+FORMATS = {
+    "srt": (".srt", _srt_blocks),
+    "vtt": (".vtt", iter_vtt_blocks),
+    "ass": (".ass", iter_ass_blocks),
+    "json": (".json", iter_json_blocks),
+}
+DEFAULT_FORMATS = ("srt",)
+
+
+def output_path(srt_filename, fmt):
+    """Path output untuk format fmt dari path SRT (ekstensi diganti)."""
+    if srt_filename == STDOUT:
+        return STDOUT
+    return os.path.splitext(srt_filename)[0] + FORMATS[fmt][0]
+
+
+def write_formats(srt_filename, cues, formats=DEFAULT_FORMATS, meta=None):
+    """
+    Tulis list cue yang sama ke setiap format; return list path output
+    (urutan sesuai formats).
+    """
+    outputs = []
+    for fmt in formats:
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown subtitle format '{fmt}' (available: {', '.join(FORMATS)})")
+        target = output_path(srt_filename, fmt)
+        write_text(target, FORMATS[fmt][1](cues, meta))
+        outputs.append(target)
+    return outputs
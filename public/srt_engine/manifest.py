@@ -0,0 +1,90 @@
+"""
+Build manifest untuk regenerasi SRT inkremental.
+
+Untuk setiap file output dicatat fingerprint input-nya: hash file JSON,
+deskripsi timeline (FPS, intro/kartu/ending dalam frame dan mode align),
+profile/template yang dipakai, format subtitle dan NORMALIZER_VERSION.
+Output yang fingerprint-nya sama dan file-nya masih ada dilewati.
+"""
+import json
+import os
+
+from .config import CACHE_FOLDER
+from .normalize import NORMALIZER_VERSION
+from .timeline import Timeline
+
+MANIFEST_FILE = os.path.join(CACHE_FOLDER, "manifest.json")
+
+
+def timing_fingerprint(timeline=None):
+    return (timeline or Timeline()).describe()
+
+
+def make_fingerprint(input_hash, profile, timeline=None, formats=("srt",)):
+    return {
+        "input_hash": input_hash,
+        "timing": timing_fingerprint(timeline),
+        "profile": profile.name,
+        "template_version": profile.version,
+        "normalizer_version": NORMALIZER_VERSION,
+        "formats": list(formats),
+    }
+
+
+def stale_reasons(previous, fingerprint, outputs):
+    """
+    List alasan output harus dibuat ulang; list kosong berarti masih up to date.
+    outputs: path output (atau list path, satu per format) yang harus ada.
+    """
+    if previous is None:
+        return ["new output"]
+    reasons = []
+    if isinstance(outputs, str):
+        outputs = [outputs]
+    if not all(os.path.exists(output) for output in outputs):
+        reasons.append("output missing")
+    if previous.get("input_hash") != fingerprint["input_hash"]:
+        reasons.append("input changed")
+    if previous.get("timing") != fingerprint["timing"]:
+        reasons.append("timing changed")
+    if previous.get("profile") != fingerprint["profile"]:
+        reasons.append("profile changed")
+    elif previous.get("template_version") != fingerprint["template_version"]:
+        reasons.append("template changed")
+    if previous.get("normalizer_version") != fingerprint["normalizer_version"]:
+        reasons.append("normalizer changed")
+    # Manifest lama (sebelum multi-format) hanya berisi SRT
+    if previous.get("formats", ["srt"]) != fingerprint["formats"]:
+        reasons.append("formats changed")
+    return reasons
+
+
+class BuildManifest:
+    """Manifest JSON: path output -> fingerprint input terakhir yang berhasil di-build."""
+
+    def __init__(self, path=MANIFEST_FILE):
+        self.path = path
+        self.entries = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.entries = data
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+    def get(self, output):
+        return self.entries.get(os.path.normpath(output))
+
+    def record(self, output, fingerprint):
+        self.entries[os.path.normpath(output)] = fingerprint
+
+    def forget(self, output):
+        self.entries.pop(os.path.normpath(output), None)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,181 @@
+from functools import lru_cache
+
+from .dates import parse_date
+from .ordering import order_fields
+
+# Naikkan setiap kali hasil normalize/sort berubah agar cache record lama tidak dipakai
+NORMALIZER_VERSION = 2
+
+# Mapping alias field agar lebih fleksibel
+FIELD_ALIASES = {
+    "name": ["name", "nama", "player_name"],
+    "full_name": ["full_name", "nama_lengkap", "fullname"],
+    "nation": ["nation", "negara", "country"],
+    "nation_code": ["nation_code", "kode_negara", "country_code"],
+    "date": ["date", "date_of_join", "join_date", "tanggal_masuk"],
+    "date_of_birth": ["date_of_birth", "dob", "tanggal_lahir"],
+    "team": ["team", "tim", "club"],
+    "roles": ["roles", "role", "posisi"],
+    "image": ["image", "img", "foto"],
+    "description": ["description", "deskripsi", "desc"],
+    "league": ["league", "liga"],
+    "logo_league": ["logo_league", "logo_liga"],
+    "tier": ["tier", "tingkatan"],
+    "heros": ["heros", "heroes", "hero"],
+    "category": ["category", "kategori"],
+    "followers_count": ["followers_count", "followers", "subscribers"],
+    "following_count": ["following_count", "following"],
+    "posts_count": ["posts_count", "posts"],
+    "views_count": ["views_count", "views"],
+    "videos_count": ["videos_count", "video_count", "videos"],
+}
+
+TEXT_FIELDS = [
+    "name", "full_name", "nation", "nation_code", "team", "image",
+    "description", "league", "logo_league", "tier", "category",
+]
+LIST_FIELDS = ["roles", "heros"]
+RAW_FIELDS = ["date", "date_of_birth"]
+COUNT_FIELDS = ["followers_count", "following_count", "posts_count", "views_count", "videos_count"]
+
+# Jenis field untuk FieldPlan
+TEXT, LIST, RAW, COUNT = "text", "list", "raw", "count"
+FIELD_KINDS = {
+    **{key: TEXT for key in TEXT_FIELDS},
+    **{key: LIST for key in LIST_FIELDS},
+    **{key: RAW for key in RAW_FIELDS},
+    **{key: COUNT for key in COUNT_FIELDS},
+}
+
+# Field urutan kartu apa adanya (tanpa alias/clean_text), seperti yang dilihat
+# compareRawData setelah zod membuang key yang tidak ada di schema
+SORT_FIELDS = order_fields()
+
+_QUOTES = str.maketrans({"‘": "'", "’": "'", "“": '"', "”": '"'})
+
+
+def get_field(data, key, default=""):
+    for alias in FIELD_ALIASES.get(key, [key]):
+        if alias in data and data[alias]:
+            return data[alias]
+    return default
+
+
+def clean_text(text):
+    if not isinstance(text, str):
+        return str(text)
+    # Remove extra whitespace and normalize quotes
+    text = " ".join(text.split())
+    if not text.isascii():
+        text = text.translate(_QUOTES)
+    # Remove "no data" and similar placeholder text
+    if "no data" in text:
+        text = text.replace("no data", "").strip()
+    return text
+
+
+def clean_list(value):
+    """Bersihkan array roles/heros: buang item kosong dan "no data"."""
+    if not isinstance(value, list):
+        value = [value] if value else []
+    cleaned = []
+    for item in value:
+        if not item:
+            continue
+        item = clean_text(item)
+        if item and item != "no data":
+            cleaned.append(item)
+    return cleaned
+
+
+class FieldPlan:
+    """
+    Mapping source key -> field kanonik yang di-compile sekali dari key set satu file.
+    Untuk setiap field hanya alias yang benar-benar ada di file yang dicek, urut
+    sesuai prioritas FIELD_ALIASES, jadi normalize per record tidak lagi men-scan
+    semua alias dan setiap nilai mentah dibersihkan tepat sekali.
+    """
+
+    def __init__(self, keys):
+        self.keys = frozenset(keys)
+        # Field tanpa alias di file langsung diisi default lewat template
+        self.template = {}
+        fields = {TEXT: [], LIST: [], RAW: [], COUNT: []}
+        for canonical, aliases in FIELD_ALIASES.items():
+            kind = FIELD_KINDS[canonical]
+            sources = tuple(a for a in aliases if a in self.keys)
+            self.template[canonical] = [] if kind is LIST else (None if kind is COUNT else "")
+            if sources:
+                fields[kind].append((canonical, sources))
+        self.text_fields = tuple(fields[TEXT])
+        self.list_fields = tuple(fields[LIST])
+        self.raw_fields = tuple(fields[RAW])
+        self.count_fields = tuple(fields[COUNT])
+        self.required = tuple(
+            a for key in ("name", "full_name") for a in FIELD_ALIASES[key] if a in self.keys
+        )
+
+    def accepts(self, record):
+        """Record valid jika punya name atau full_name (sama seperti get_field lama)."""
+        for source in self.required:
+            if record.get(source):
+                return True
+        return False
+
+    def apply(self, record):
+        normalized = self.template.copy()
+        for canonical, sources in self.text_fields:
+            value = _resolve(record, sources)
+            if value:
+                normalized[canonical] = clean_text(value)
+        for canonical, sources in self.list_fields:
+            value = _resolve(record, sources)
+            if value:
+                normalized[canonical] = clean_list(value)
+        for canonical, sources in self.raw_fields:
+            value = _resolve(record, sources)
+            if value:
+                normalized[canonical] = value
+        for canonical, sources in self.count_fields:
+            value = _resolve(record, sources)
+            if value and isinstance(value, (int, float)):
+                normalized[canonical] = value
+        normalized["_date"] = parse_date(normalized["date"])
+        normalized["_sort"] = {key: record.get(key) for key in SORT_FIELDS}
+        return normalized
+
+
+def _resolve(record, sources):
+    """Nilai truthy pertama dari sources (biasanya hanya satu alias per file)."""
+    if len(sources) == 1:
+        return record.get(sources[0])
+    for source in sources:
+        value = record.get(source)
+        if value:
+            return value
+    return None
+
+
+@lru_cache(maxsize=64)
+def compile_plan(keys):
+    """FieldPlan untuk frozenset key; di-cache karena file sejenis punya key set yang sama."""
+    return FieldPlan(keys)
+
+
+def normalize_record(record):
+    """
+    Normalize satu record mentah ke field kanonik (mengikuti schema.ts rawDataSchema).
+    Tanggal di-parse sekali dan disimpan di "_date" agar format subtitle tidak
+    mem-parse ulang; "_sort" menyimpan nilai mentah field urutan kartu.
+    """
+    return compile_plan(frozenset(record)).apply(record)
+
+
+def normalize_records(raw_records):
+    """Normalize list record mentah; record tanpa name/full_name dibuang."""
+    keys = set()
+    for record in raw_records:
+        if isinstance(record, dict):
+            keys.update(record)
+    plan = compile_plan(frozenset(keys))
+    return [plan.apply(r) for r in raw_records if isinstance(r, dict) and plan.accepts(r)]
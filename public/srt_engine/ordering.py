@@ -0,0 +1,174 @@
+"""
+Spesifikasi urutan kartu yang dipakai bersama oleh semua profile SRT dan render
+plan, supaya subtitle selalu sama urutannya dengan kartu di video.
+
+Urutan ditulis deklaratif sebagai tuple rule (field, jenis, arah), mirror
+compareRawData di src/utils/sortRecords.ts:
+
+    NUMBER  dibandingkan hanya jika kedua nilai number (typeof === 'number');
+    DATE    record yang punya tanggal didahulukan, lalu new Date().getTime();
+    TEXT    localeCompare (perkiraan collation ICU root, lihat collation_key).
+
+order_records menghitung key setiap record sekali (Schwartzian transform:
+tanggal di-parse dan nama di-collate sekali per record) lalu sort sekali. Jika
+data membuat comparator TSX tidak transitif (followers number bercampur null,
+atau tanggal yang hasilnya NaN) key tidak bisa mewakilinya, jadi dipakai
+comparator hasil spec dengan cmp_to_key: sort Python dan Array.sort V8 sama-sama
+TimSort dengan urutan pemanggilan comparator yang sama.
+
+public/sort_parity.py membandingkan hasilnya dengan comparator TSX di node.
+"""
+import unicodedata
+from functools import cmp_to_key
+
+from .dates import js_timestamp
+from .schema import is_number
+
+NUMBER, DATE, TEXT = "number", "date", "text"
+ASC, DESC = "asc", "desc"
+
+# Urutan CardList.tsx: followers terbanyak di akhir, tanggal terbaru di atas, lalu nama
+CARDLIST_ORDER = (
+    ("followers_count", NUMBER, ASC),
+    ("date", DATE, DESC),
+    ("name", TEXT, ASC),
+)
+
+
+def _char_class(ch):
+    """Urutan kelompok karakter collation ICU root: spasi, tanda baca, simbol, angka, huruf."""
+    if ch.isspace():
+        return 0
+    category = unicodedata.category(ch)
+    if category[0] == "P":
+        return 1
+    if category[0] == "S":
+        return 2
+    if category[0] == "N":
+        return 3
+    return 4
+
+
+def collation_key(text):
+    """
+    Perkiraan String.prototype.localeCompare (ICU root, tertiary strength):
+    huruf dasar tanpa aksen dan case dulu, lalu aksen, lalu huruf kecil sebelum besar.
+    """
+    primary, secondary, tertiary = [], [], []
+    for ch in unicodedata.normalize("NFKD", text):
+        if unicodedata.combining(ch):
+            if secondary:
+                secondary[-1] += (ord(ch),)
+            continue
+        primary.append((_char_class(ch), ch.casefold()))
+        secondary.append(())
+        tertiary.append(ch != ch.lower())
+    return tuple(primary), tuple(secondary), tuple(tertiary)
+
+
+def locale_compare(a, b):
+    key_a, key_b = collation_key(a), collation_key(b)
+    return (key_a > key_b) - (key_a < key_b)
+
+
+def _sign(a, b, direction):
+    result = -1 if a < b else 1
+    return -result if direction == DESC else result
+
+
+def _compare_rule(kind, direction, a, b):
+    """Hasil satu rule: -1/0/1 (final) atau None jika rule tidak membedakan."""
+    if kind == NUMBER:
+        if is_number(a) and is_number(b) and a != b:
+            return _sign(a, b, direction)
+        return None
+    if kind == DATE:
+        a_has, b_has = bool(a), bool(b)
+        if a_has and b_has:
+            a_time, b_time = js_timestamp(a), js_timestamp(b)
+            # NaN !== NaN di JS (juga jika keduanya NaN); comparator yang return NaN
+            # dianggap 0 oleh Array.sort
+            if a_time is None or b_time is None:
+                return 0
+            if a_time == b_time:
+                return None
+            return _sign(a_time, b_time, direction)
+        if a_has != b_has:
+            return -1 if a_has else 1
+        return None
+    result = locale_compare(a or "", b or "")
+    return -result if direction == DESC else result
+
+
+def order_fields(spec=CARDLIST_ORDER):
+    return tuple(field for field, _, _ in spec)
+
+
+def compare_with(spec, a, b):
+    """Comparator (cmp) dari spec, sama persis dengan compareRawData untuk CARDLIST_ORDER."""
+    for field, kind, direction in spec:
+        result = _compare_rule(kind, direction, a.get(field), b.get(field))
+        if result is not None:
+            return result
+    return 0
+
+
+def compare_records(a, b):
+    return compare_with(CARDLIST_ORDER, a, b)
+
+
+class _NeedsComparator(Exception):
+    """Kolom tidak bisa dijadikan key tanpa mengubah hasil comparator."""
+
+
+def _key_column(kind, direction, values):
+    if kind == NUMBER:
+        numeric = [is_number(value) for value in values]
+        if not any(numeric):
+            return [0] * len(values)
+        if not all(numeric):
+            raise _NeedsComparator(kind)
+        return [-value if direction == DESC else value for value in values]
+    if kind == DATE:
+        column = []
+        for value in values:
+            if not value:
+                column.append((1, 0))
+                continue
+            time = js_timestamp(value)
+            if time is None:
+                raise _NeedsComparator(kind)
+            column.append((0, -time if direction == DESC else time))
+        return column
+    if direction == DESC:
+        raise _NeedsComparator(kind)
+    return [collation_key(value or "") for value in values]
+
+
+def sort_keys(views, spec=CARDLIST_ORDER):
+    """Key per record untuk spec; raise _NeedsComparator jika data butuh comparator."""
+    columns = [_key_column(kind, direction, [view.get(field) for view in views])
+               for field, kind, direction in spec]
+    return list(zip(*columns)) if columns else [()] * len(views)
+
+
+def order_records(records, spec=CARDLIST_ORDER, view=None):
+    """
+    List baru berisi records terurut sesuai spec (stabil, seperti Array.sort).
+    view(record) -> dict nilai field spec; default record itu sendiri.
+    """
+    records = list(records)
+    views = [view(record) for record in records] if view else records
+    try:
+        keys = sort_keys(views, spec)
+    except _NeedsComparator:
+        order = sorted(range(len(records)),
+                       key=cmp_to_key(lambda i, j: compare_with(spec, views[i], views[j])))
+    else:
+        order = sorted(range(len(records)), key=keys.__getitem__)
+    return [records[i] for i in order]
+
+
+def sort_records(records):
+    """Urutan kartu CardList.tsx (CARDLIST_ORDER)."""
+    return order_records(records, CARDLIST_ORDER)
@@ -0,0 +1,137 @@
+"""
+Render plan: dataset yang sudah divalidasi dan diurutkan persis seperti
+CardList.tsx (ordering.CARDLIST_ORDER), plus jumlah kartu dan durationInFrames composition.
+
+Records di plan adalah payload kanonik: hanya field yang dibaca komponen kartu
+(CARD_FIELDS), nilai kosong dibuang, dan tanggal sudah dikonversi ke epoch
+milidetik di "date_ms" (null jika new Date() memberi NaN). "date" string hanya
+disimpan untuk kartu yang menampilkannya.
+
+Plan ditulis ke render_plans/<kategori>/<nama>.json (di dalam public/ agar bisa
+dibaca lewat staticFile). Composition dengan prop planPath mengambil
+durationInFrames, cardsToShow dan records dari plan di calculateMetadata, jadi
+render worker tidak lagi fetch + validasi + sort sendiri dan panjang video
+selalu sama dengan jumlah kartu.
+"""
+import json
+import os
+
+from .cache import hash_bytes
+from .dates import js_timestamp
+from .ordering import sort_records
+from .schema import SchemaError, validate_records
+from .timeline import Timeline
+
+PLAN_FOLDER = "render_plans"
+# Naikkan jika format plan berubah (dibaca oleh Root.tsx)
+PLAN_VERSION = 2
+
+# Field yang dibaca setiap komponen kartu di src/components
+CARD_FIELDS = {
+    "CardPlayerMLBB": ("name", "full_name", "image", "nation", "nation_code", "team", "roles", "heros",
+                       "logo_league", "date"),
+    "CardTeamMLBB": ("name", "image", "nation", "nation_code", "league", "logo_league", "tier", "date"),
+    "CardYouTube": ("name", "full_name", "image", "nation_code", "followers_count", "views_count", "date"),
+    "CardInstagram": ("name", "full_name", "image", "nation_code", "followers_count", "following_count",
+                      "posts_count"),
+    "CardTikTok": ("name", "full_name", "image", "nation_code", "followers_count", "following_count",
+                   "liked_count"),
+    "CardTwitch": ("name", "full_name", "image", "nation_code", "followers_count", "category"),
+}
+# Kartu yang dirender CardList.tsx (import Carding)
+DEFAULT_CARD = "CardPlayerMLBB"
+# Dibaca di luar kartu: Intro (team) dan key kartu di CardList (name)
+COMMON_FIELDS = ("name", "team")
+
+
+class PlanError(Exception):
+    """Dataset tidak bisa dijadikan render plan (gagal dibaca atau tidak lolos schema)."""
+
+
+def card_fields(card=DEFAULT_CARD):
+    if card not in CARD_FIELDS:
+        raise PlanError(f"Unknown card '{card}' (available: {', '.join(CARD_FIELDS)})")
+    return tuple(dict.fromkeys(COMMON_FIELDS + CARD_FIELDS[card]))
+
+
+def canonical_record(record, fields):
+    """Record payload: field yang dipakai saja, tanpa nilai kosong, plus date_ms (epoch ms)."""
+    output = {}
+    for key in fields:
+        value = record.get(key)
+        if value is not None and value != "" and value != []:
+            output[key] = value
+    if record.get("date"):
+        output["date_ms"] = js_timestamp(record["date"])
+    return output
+
+
+def plan_path(json_file, folder=PLAN_FOLDER):
+    """render_plans/<kategori>/<nama>.json untuk dataset <kategori>/<nama>.json."""
+    category = os.path.basename(os.path.dirname(os.path.abspath(json_file)))
+    return os.path.join(folder, category, os.path.basename(json_file))
+
+
+def select_records(json_file, cards=None, drop_invalid=False):
+    """
+    Record kartu untuk dataset: lolos schema, diurutkan seperti CardList.tsx dan
+    dipotong ke cards. Return (isi file, records, issues). Raise PlanError jika file
+    tidak bisa dibaca, tidak lolos schema, atau tidak ada record valid.
+    """
+    try:
+        with open(json_file, "rb") as f:
+            data = f.read()
+        records, issues = validate_records(json.loads(data), drop_invalid)
+    except (OSError, ValueError) as e:
+        raise PlanError(f"Failed to load {json_file}: {e}") from e
+    except SchemaError as e:
+        raise PlanError(f"{json_file}: {e}") from e
+    records = sort_records(records)
+    if cards is not None:
+        records = records[:max(0, cards)]
+    if not records:
+        raise PlanError(f"No valid records in {json_file}")
+    return data, records, issues
+
+
+def build_plan(json_file, cards=None, timeline=None, drop_invalid=False, source=None, card=DEFAULT_CARD,
+               selected=None):
+    """
+    Plan untuk satu dataset. cards membatasi jumlah kartu (seperti slice(0, cardsToShow));
+    default semua record yang valid. source: path dataset yang dicatat di plan.
+    card: komponen kartu yang menentukan field payload (CARD_FIELDS).
+    selected: hasil select_records yang sudah ada (mis. dipakai juga untuk SRT).
+    Raise PlanError jika file tidak bisa dibaca atau tidak lolos schema.
+    """
+    timeline = timeline or Timeline()
+    fields = card_fields(card)
+    data, records, issues = selected or select_records(json_file, cards, drop_invalid)
+    return {
+        "version": PLAN_VERSION,
+        "source": source or json_file,
+        "sha256": hash_bytes(data),
+        "fps": timeline.fps,
+        "cardsToShow": len(records),
+        "durationInFrames": timeline.total_frames(len(records)),
+        "timeline": timeline.describe(),
+        "dropped": len({path.split(".", 1)[0] for path, _ in issues}),
+        "card": card,
+        "records": [canonical_record(record, fields) for record in records],
+    }
+
+
+def write_plan(plan, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(plan, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_plan(path):
+    with open(path, "r", encoding="utf-8") as f:
+        plan = json.load(f)
+    if not isinstance(plan, dict) or plan.get("version") != PLAN_VERSION:
+        raise PlanError(f"{path} is not a version {PLAN_VERSION} render plan")
+    return plan
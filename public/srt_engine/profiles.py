@@ -0,0 +1,252 @@
+"""
+Profile SRT: setiap kategori data (gaming, hero, YouTube, Instagram/Twitch/TikTok)
+menentukan filter, judul, dan isi subtitle per kartu. Urutan kartu untuk semua
+profile adalah ordering.CARDLIST_ORDER (sama dengan CardList.tsx); normalisasi
+dan timing dikerjakan bersama oleh engine.
+"""
+import os
+from abc import ABC, abstractmethod
+
+from .dates import DEFAULT_DATE, format_display_date
+from .ordering import CARDLIST_ORDER, order_records
+
+
+def format_number(num):
+    if num is None:
+        return ""
+    if num >= 1_000_000_000:
+        return f"{num/1_000_000_000:.1f}B"
+    elif num >= 1_000_000:
+        return f"{num/1_000_000:.1f}M"
+    elif num >= 1_000:
+        return f"{num/1_000:.1f}K"
+    return str(num)
+
+
+def file_stem(json_file):
+    return os.path.basename(json_file).replace(".json", "")
+
+
+class Profile(ABC):
+    """Base profile; subclass wajib mengisi card_lines dan override method lain yang perlu diubah."""
+
+    name = ""
+    # Naikkan jika format subtitle profile berubah agar output lama dibuat ulang
+    version = 1
+    item_label = "players"
+    ending_text = "Terima kasih sudah menonton!"
+    # Subtitle harus berurutan sama dengan kartu yang dirender CardList.tsx
+    order = CARDLIST_ORDER
+
+    def accept(self, record):
+        return record["name"] != "" and record["name"] != "no data"
+
+    def sort(self, records):
+        # Urut dari nilai mentah (record["_sort"]), bukan field hasil alias: kartu
+        # hanya melihat key schema, mis. date_of_join tidak ikut mengurutkan kartu
+        return order_records(records, self.order, view=lambda record: record["_sort"])
+
+    def context(self, records, json_file):
+        return {"team_name": records[0]["team"] if records else "Unknown Team"}
+
+    def title(self, context):
+        return f"Riwayat Pemain {context['team_name']} 2017-2025"
+
+    @abstractmethod
+    def card_lines(self, record, context):
+        """Baris subtitle untuk satu kartu."""
+
+    def output_name(self, json_file):
+        return file_stem(json_file) + "_flexible.srt"
+
+
+def _player_lines(record, date_line, show_league_always):
+    lines = []
+    if record["name"]:
+        if record["nation"]:
+            lines.append(f"{record['name']} ({record['nation']})")
+            if show_league_always or record["league"]:
+                lines.append(f"({record['league']})")
+        else:
+            lines.append(record["name"])
+    info_parts = []
+    if record["full_name"]:
+        info_parts.append(f"Name: {record['full_name']}")
+    if date_line:
+        info_parts.append(date_line)
+    if record["roles"]:
+        info_parts.append(f"Roles: [{', '.join(record['roles'])}]")
+    if record["heros"]:
+        info_parts.append(f"Heros: [{', '.join(record['heros'])}]")
+    if info_parts:
+        lines.append(" | ".join(info_parts))
+    return lines
+
+
+class LeagueProfile(Profile):
+    """Riwayat pemain per liga (srt.py)."""
+
+    name = "league"
+
+    def card_lines(self, record, context):
+        formatted_date = format_display_date(record["date"], record["_date"])
+        date_line = f"Maagang pagpasok sa MPL PH : {context['team_name']}: {formatted_date}" if formatted_date else ""
+        return _player_lines(record, date_line, show_league_always=True)
+
+
+class GamingProfile(Profile):
+    """Riwayat pemain per tim esports (srt_gaming.py)."""
+
+    name = "gaming"
+
+    def context(self, records, json_file):
+        return {"team_name": records[0]["team"] if records else file_stem(json_file)}
+
+    def card_lines(self, record, context):
+        formatted_date = format_display_date(record["date"], record["_date"])
+        date_line = f"Bergabung: {formatted_date}" if formatted_date else ""
+        return _player_lines(record, date_line, show_league_always=False)
+
+
+class HeroProfile(Profile):
+    """Hero pool / roster per role (srt_hero.py)."""
+
+    name = "hero"
+
+    def context(self, records, json_file):
+        return {"team_name": (records[0]["team"] if records else "") or "Unknown Team"}
+
+    def card_lines(self, record, context):
+        formatted_date = format_display_date(record["date"], record["_date"], fallback="Tidak diketahui")
+        roles_str = ", ".join(record["roles"]) or "Tidak diketahui"
+        return [
+            f"{record['name']} ({record['nation'] or 'Unknown'})",
+            f"Nama: {record['full_name'] or 'Unknown'} | Tanggal masuk {context['team_name']}: "
+            f"{formatted_date} | Roles: [{roles_str}]",
+        ]
+
+
+class YouTubeProfile(Profile):
+    """Ranking channel YouTube per negara (srt_youtube.py)."""
+
+    name = "youtube"
+    item_label = "channels"
+    ending_text = "Thanks for watching!"
+
+    def accept(self, record):
+        return True
+
+    def context(self, records, json_file):
+        return {"country_name": file_stem(json_file).capitalize()}
+
+    def title(self, context):
+        return f"100 Most Subscribed YouTube Channels - {context['country_name']}"
+
+    def output_name(self, json_file):
+        return f"{file_stem(json_file).capitalize()}_flexible.srt"
+
+    def stats(self, record):
+        return [
+            f"Subscribers: {format_number(record['followers_count'] or 0)}",
+            f"Views: {format_number(record['views_count'] or 0)}",
+            f"Videos: {format_number(record['videos_count'] or 0)}",
+        ]
+
+    def card_lines(self, record, context):
+        name, full_name = record["name"], record["full_name"]
+        lines = []
+        # First line: Channel name and full name
+        if name and full_name and name.lower() != full_name.lower():
+            lines.append(f"{name} - {full_name}")
+        else:
+            lines.append(name or full_name)
+        # Second line: Stats
+        lines.append(" | ".join(self.stats(record)))
+        # Third line: Join date
+        if record["date"] and record["_date"] != DEFAULT_DATE:
+            lines.append(f"Joined youtube at: {record['_date'].strftime('%d %B %Y')}")
+        return lines
+
+
+class SocialProfile(YouTubeProfile):
+    """Ranking akun Instagram/Twitch/TikTok per negara."""
+
+    item_label = "accounts"
+
+    def __init__(self, name, platform):
+        self.name = name
+        self.platform = platform
+
+    def context(self, records, json_file):
+        label = file_stem(json_file).replace("_updated", "")
+        if label.startswith("ig-"):
+            label = label[3:]
+        return {"country_name": label.upper() if len(label) <= 3 else label.capitalize()}
+
+    def title(self, context):
+        return f"Most Followed {self.platform} Accounts - {context['country_name']}"
+
+    def output_name(self, json_file):
+        return file_stem(json_file) + "_flexible.srt"
+
+    def stats(self, record):
+        stats = [f"Followers: {format_number(record['followers_count'] or 0)}"]
+        if record["following_count"] is not None:
+            stats.append(f"Following: {format_number(record['following_count'])}")
+        if record["posts_count"] is not None:
+            stats.append(f"Posts: {format_number(record['posts_count'])}")
+        return stats
+
+    def card_lines(self, record, context):
+        lines = super().card_lines(record, context)
+        if record["category"]:
+            lines.append(f"Category: {record['category']}")
+        return lines
+
+
+PROFILES = {}
+
+# Folder data di public/ -> nama profile default
+CATEGORY_PROFILES = {
+    "gaming": "gaming",
+    "data": "hero",
+    "youtube": "youtube",
+    "instagram": "instagram",
+    "twitch": "twitch",
+    "tiktok": "tiktok",
+}
+
+
+def register_profile(profile):
+    PROFILES[profile.name] = profile
+    return profile
+
+
+def get_profile(name):
+    if isinstance(name, Profile):
+        return name
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown SRT profile '{name}' (available: {', '.join(sorted(PROFILES))})") from None
+
+
+def profile_for_path(json_file):
+    """Pilih profile dari nama folder kategori (public/<category>/*.json)."""
+    parts = os.path.normpath(os.path.abspath(json_file)).split(os.sep)
+    for part in reversed(parts[:-1]):
+        if part in CATEGORY_PROFILES:
+            return get_profile(CATEGORY_PROFILES[part])
+    raise ValueError(f"Cannot infer SRT profile for {json_file}")
+
+
+for _profile in (
+    LeagueProfile(),
+    GamingProfile(),
+    HeroProfile(),
+    YouTubeProfile(),
+    SocialProfile("instagram", "Instagram"),
+    SocialProfile("twitch", "Twitch"),
+    SocialProfile("tiktok", "TikTok"),
+):
+    register_profile(_profile)
@@ -0,0 +1,118 @@
+"""
+Validasi record dengan aturan yang sama seperti rawDataSchema (src/types/schema.ts).
+
+zod z.object() membuang key yang tidak ada di schema, jadi hasil validate_records
+sama dengan output validateRawDatas(): hanya field schema, tipe sudah dicek.
+Satu record yang tidak valid membuat seluruh parse gagal (seperti zod), kecuali
+drop_invalid=True.
+"""
+
+STRING, NUMBER, STRING_LIST = "string", "number", "string[]"
+
+# (tipe, nullable) per field, urutan sama dengan rawDataSchema
+RAW_DATA_SCHEMA = {
+    "name": (STRING, False),
+    "date": (STRING, False),
+    "full_name": (STRING, True),
+    "heros": (STRING_LIST, False),
+    "image": (STRING, False),
+    "nation": (STRING, False),
+    "nation_code": (STRING, False),
+    "team": (STRING, False),
+    "date_of_birth": (STRING, False),
+    "roles": (STRING_LIST, False),
+    "description": (STRING, False),
+    "league": (STRING, False),
+    "logo_league": (STRING, False),
+    "tier": (STRING, False),
+    "followers_count": (NUMBER, True),
+    "following_count": (NUMBER, True),
+    "posts_count": (NUMBER, True),
+    "views_count": (NUMBER, False),
+    "video_count": (NUMBER, False),
+    "liked_count": (NUMBER, False),
+    "category": (STRING, False),
+}
+
+MAX_REPORTED_ISSUES = 10
+
+
+class SchemaError(Exception):
+    """Data tidak lolos rawDataSchema; issues berisi (path, pesan) seperti ZodError."""
+
+    def __init__(self, issues):
+        self.issues = issues
+        shown = "; ".join(f"{path}: {message}" for path, message in issues[:MAX_REPORTED_ISSUES])
+        more = f" (+{len(issues) - MAX_REPORTED_ISSUES} more)" if len(issues) > MAX_REPORTED_ISSUES else ""
+        super().__init__(f"{len(issues)} schema issues: {shown}{more}")
+
+
+def _type_name(value):
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    return "object"
+
+
+def is_number(value):
+    """typeof value === 'number' (bool JSON bukan number)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _check(value, kind, nullable):
+    if value is None:
+        return None if nullable else f"Expected {kind}, received null"
+    if kind == STRING_LIST:
+        if not isinstance(value, list):
+            return f"Expected array, received {_type_name(value)}"
+        for item in value:
+            if not isinstance(item, str):
+                return f"Expected string, received {_type_name(item)}"
+        return None
+    received = _type_name(value)
+    return None if received == kind else f"Expected {kind}, received {received}"
+
+
+def validate_record(record, path=""):
+    """Return (record hasil strip, list issues)."""
+    if not isinstance(record, dict):
+        return None, [(path, f"Expected object, received {_type_name(record)}")]
+    output = {}
+    issues = []
+    for key, (kind, nullable) in RAW_DATA_SCHEMA.items():
+        if key not in record:
+            continue
+        message = _check(record[key], kind, nullable)
+        if message:
+            issues.append((f"{path}.{key}", message))
+        else:
+            output[key] = record[key]
+    return output, issues
+
+
+def validate_records(data, drop_invalid=False):
+    """
+    rawDatasSchema.parse(data) versi Python. Raise SchemaError jika ada issue;
+    dengan drop_invalid record yang bermasalah dibuang dan issues dikembalikan.
+    Return (records, issues).
+    """
+    if not isinstance(data, list):
+        raise SchemaError([("", f"Expected array, received {_type_name(data)}")])
+    records = []
+    issues = []
+    for i, item in enumerate(data):
+        record, record_issues = validate_record(item, f"[{i}]")
+        if record_issues:
+            issues.extend(record_issues)
+        else:
+            records.append(record)
+    if issues and not drop_invalid:
+        raise SchemaError(issues)
+    return records, issues
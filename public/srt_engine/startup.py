@@ -0,0 +1,110 @@
+"""
+Cek budget waktu import (cold start) untuk srt_engine dan script srt_*.py.
+
+Script ini dipanggil ratusan kali dari shell loop, jadi import harus murah dan
+tanpa side effect. Setiap modul di-import di interpreter baru (cwd = folder
+kosong sementara) lalu dicek:
+- median waktu import <= budget;
+- modul berat (dateparser, multiprocessing) belum ter-load;
+- tidak ada file/folder yang dibuat saat import (mis. srt_output).
+
+Contoh (dari folder public/):
+    python -m srt_engine.startup
+    python -m srt_engine.startup --budget-ms 30 --runs 9
+Exit code 1 jika ada modul yang melanggar budget.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+DEFAULT_BUDGET_MS = 50
+MODULES = ["srt_engine", "srt", "srt_gaming", "srt_hero", "srt_youtube"]
+HEAVY_MODULES = ["dateparser", "multiprocessing", "concurrent.futures.process"]
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+PUBLIC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import(module, runs=5):
+    """Import module di interpreter baru sebanyak runs kali. Return dict hasil."""
+    env = dict(os.environ, PYTHONPATH=PUBLIC_DIR + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    timings, heavy, created = [], set(), set()
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as workdir:
+            output = subprocess.run(
+                [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                cwd=workdir, env=env, capture_output=True, text=True, check=True,
+            ).stdout
+            probe = json.loads(output.strip().splitlines()[-1])
+            timings.append(probe["seconds"] * 1000)
+            heavy.update(probe["heavy"])
+            created.update(os.listdir(workdir))
+    return {
+        "module": module,
+        "median_ms": statistics.median(timings),
+        "max_ms": max(timings),
+        "heavy": sorted(heavy),
+        "created": sorted(created),
+    }
+
+
+def measure_interpreter(runs=5):
+    """Waktu start interpreter kosong, sebagai pembanding."""
+    import time
+
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def check_budget(modules=MODULES, budget_ms=DEFAULT_BUDGET_MS, runs=5):
+    """Ukur semua modul dan return (hasil, list pelanggaran)."""
+    results, violations = [], []
+    for module in modules:
+        result = measure_import(module, runs)
+        results.append(result)
+        if result["median_ms"] > budget_ms:
+            violations.append(f"{module}: import {result['median_ms']:.1f}ms > budget {budget_ms}ms")
+        if result["heavy"]:
+            violations.append(f"{module}: loads heavy modules at import: {', '.join(result['heavy'])}")
+        if result["created"]:
+            violations.append(f"{module}: import side effect created {', '.join(result['created'])}")
+    return results, violations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m srt_engine.startup", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"⏱  Python startup (empty interpreter): {measure_interpreter(args.runs):.1f}ms")
+    results, violations = check_budget(args.modules, args.budget_ms, args.runs)
+    for r in results:
+        print(f"   - {r['module']:<12} median {r['median_ms']:6.1f}ms | max {r['max_ms']:6.1f}ms")
+    if violations:
+        for v in violations:
+            print(f"❌ {v}")
+        return 1
+    print(f"✅ All imports within {args.budget_ms:g}ms budget, no heavy modules, no side effects")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
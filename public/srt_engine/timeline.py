@@ -0,0 +1,121 @@
+"""
+Timeline video dalam integer frame, satu sumber untuk SRT dan render.
+
+Semua batas (intro, kartu, ending) dihitung dalam frame dari konstanta config.ts
+dan jadwal trigger kartu di src/utils/triggerFrame.ts; konversi ke milidetik
+hanya dilakukan saat output, jadi tidak ada akumulasi float untuk 100+ kartu.
+
+align:
+    "slots"   - kartu ke-i mengisi slot Sequence CardList.tsx:
+                introDelay + i * durasiPerCard (default, sama seperti sebelumnya)
+    "trigger" - cue kartu mulai tepat di frame kartu beranimasi masuk
+                (getTriggerFrame) sampai trigger kartu berikutnya
+"""
+from . import config
+
+SLOTS = "slots"
+TRIGGER = "trigger"
+ALIGNMENTS = (SLOTS, TRIGGER)
+
+# Mirror src/utils/triggerFrame.ts (offset frame relatif terhadap introDelay):
+# index 0 -> 0, index 1 -> 60, index 2 -> 200, lalu bertambah per kartu
+# 364 frame untuk index 2..4, 361 untuk 5..10 dan 363 mulai index 11.
+TRIGGER_OFFSETS = (0, 60, 200)
+# CardList.tsx memanggil getTriggerFrame(index) tanpa introDelay -> default 120
+TRIGGER_INTRO_DELAY = 120
+TRIGGER_STEPS = (
+    (2, 5, 364),
+    (5, 11, 361),
+    (11, None, 363),
+)
+
+
+def trigger_offset(index):
+    """Offset frame trigger kartu ke-index relatif terhadap introDelay (getTriggerFrame)."""
+    if index < len(TRIGGER_OFFSETS):
+        return TRIGGER_OFFSETS[index]
+    offset = TRIGGER_OFFSETS[-1]
+    for first, stop, step in TRIGGER_STEPS:
+        last = index if stop is None else min(index, stop)
+        if last > first:
+            offset += (last - first) * step
+    return offset
+
+
+class Timeline:
+    """Jadwal frame satu video; default diambil dari config (mirror src/config.ts)."""
+
+    def __init__(self, fps=None, intro_frames=None, card_frames=None, ending_frames=None, align=SLOTS):
+        if align not in ALIGNMENTS:
+            raise ValueError(f"Unknown timeline alignment '{align}' (available: {', '.join(ALIGNMENTS)})")
+        self.fps = config.FPS if fps is None else fps
+        self.intro_frames = config.INTRO_DELAY_FRAMES if intro_frames is None else intro_frames
+        self.card_frames = config.DURASI_PER_CARD_DETIK * self.fps if card_frames is None else card_frames
+        self.ending_frames = config.ENDING_DURATION * self.fps if ending_frames is None else ending_frames
+        self.align = align
+
+    def describe(self):
+        """Deskripsi deklaratif (dipakai untuk fingerprint manifest)."""
+        return {
+            "FPS": self.fps,
+            "INTRO_DELAY_FRAMES": self.intro_frames,
+            "CARD_FRAMES": self.card_frames,
+            "ENDING_FRAMES": self.ending_frames,
+            "align": self.align,
+        }
+
+    def frames_to_ms(self, frame):
+        """Frame -> milidetik (integer, dibulatkan ke ms terdekat)."""
+        return (frame * 2000 + self.fps) // (2 * self.fps)
+
+    def intro(self):
+        return 0, self.intro_frames
+
+    def card_slot(self, index):
+        """Slot Sequence kartu ke-index (start, end) dalam frame."""
+        start = self.intro_frames + index * self.card_frames
+        return start, start + self.card_frames
+
+    def trigger_frame(self, index):
+        """Frame absolut kartu ke-index mulai beranimasi masuk (getTriggerFrame)."""
+        return TRIGGER_INTRO_DELAY + trigger_offset(index)
+
+    def trigger_schedule(self, cards):
+        """List frame trigger untuk setiap kartu (tidak melewati awal ending)."""
+        ending_start = self.ending(cards)[0]
+        return [min(self.trigger_frame(i), ending_start) for i in range(cards)]
+
+    def card(self, index, cards):
+        """Window cue kartu ke-index dari total cards sesuai align."""
+        if self.align == SLOTS:
+            return self.card_slot(index)
+        ending_start = self.ending(cards)[0]
+        start = min(self.trigger_frame(index), ending_start)
+        end = min(self.trigger_frame(index + 1), ending_start) if index + 1 < cards else ending_start
+        return start, end
+
+    def ending(self, cards):
+        start = self.intro_frames + cards * self.card_frames
+        return start, start + self.ending_frames
+
+    def total_frames(self, cards):
+        """Sama dengan getTotalVideoDuration() / durationInFrames composition."""
+        return self.ending(cards)[1]
+
+    def sections(self, cards):
+        """Batas section (name, start, end) dalam frame: intro, cards, ending."""
+        intro_start, intro_end = self.intro()
+        ending_start, ending_end = self.ending(cards)
+        return [
+            ("intro", intro_start, intro_end),
+            ("cards", intro_end, ending_start),
+            ("ending", ending_start, ending_end),
+        ]
+
+    def windows(self, cards):
+        """Generator (kind, index, start_frame, end_frame) untuk judul, setiap kartu dan penutup."""
+        yield ("intro", None) + self.intro()
+        for i in range(cards):
+            yield ("card", i) + self.card(i, cards)
+        yield ("ending", None) + self.ending(cards)
+
@@ -0,0 +1,29 @@
+from .timeline import Timeline
+from .writer import format_ms, seconds_to_ms
+
+
+def format_time(seconds):
+    return format_ms(seconds_to_ms(seconds))
+
+
+def _seconds(timeline, window):
+    start, end = window
+    return start / timeline.fps, end / timeline.fps
+
+
+def intro_window():
+    """Waktu (detik) judul pembuka: dari awal video sampai intro selesai."""
+    timeline = Timeline()
+    return _seconds(timeline, timeline.intro())
+
+
+def card_window(index):
+    """Waktu (detik) mulai dan selesai kartu ke-index, matching CardList.tsx Sequence."""
+    timeline = Timeline()
+    return _seconds(timeline, timeline.card_slot(index))
+
+
+def ending_window(cards_to_show):
+    """Waktu (detik) subtitle penutup setelah semua kartu tampil."""
+    timeline = Timeline()
+    return _seconds(timeline, timeline.ending(cards_to_show))
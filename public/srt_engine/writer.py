@@ -0,0 +1,64 @@
+"""
+SRT writer streaming: cue diterima sebagai iterator (bisa generator), timestamp
+diformat dari integer milidetik, dan teks ditulis per chunk besar, jadi ranking
+dengan ribuan kartu tetap memakai memori datar.
+
+Cue = (start_ms, end_ms, lines). Target bisa path file, file object, atau "-"
+untuk stdout (agar bisa di-pipe ke tool lain).
+"""
+import os
+import sys
+
+STDOUT = "-"
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def format_ms(ms):
+    """Integer milidetik -> "HH:MM:SS,mmm" tanpa timedelta/float."""
+    seconds, millis = divmod(ms, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02}:{minutes:02}:{seconds:02},{millis:03}"
+
+
+def seconds_to_ms(seconds):
+    return int(round(seconds * 1000))
+
+
+def iter_srt_blocks(cues):
+    """Generator teks SRT per cue (nomor urut mulai 1)."""
+    for index, (start_ms, end_ms, lines) in enumerate(cues, start=1):
+        yield f"{index}\n{format_ms(start_ms)} --> {format_ms(end_ms)}\n" + "\n".join(lines) + "\n\n"
+
+
+def write_chunks(stream, blocks, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Tulis potongan teks ke stream per chunk ~chunk_size karakter. Return jumlah blok."""
+    buffer, size, count = [], 0, 0
+    for block in blocks:
+        buffer.append(block)
+        size += len(block)
+        count += 1
+        if size >= chunk_size:
+            stream.write("".join(buffer))
+            buffer, size = [], 0
+    if buffer:
+        stream.write("".join(buffer))
+    return count
+
+
+def write_srt(target, cues, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Tulis cues ke target (path, file object, atau "-" untuk stdout). Return jumlah cue."""
+    return write_text(target, iter_srt_blocks(cues), chunk_size)
+
+
+def write_text(target, blocks, chunk_size=DEFAULT_CHUNK_SIZE):
+    if target == STDOUT:
+        # sys.__stdout__: tetap stdout asli walaupun log dialihkan ke stderr
+        count = write_chunks(sys.__stdout__, blocks, chunk_size)
+        sys.__stdout__.flush()
+        return count
+    if hasattr(target, "write"):
+        return write_chunks(target, blocks, chunk_size)
+    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+    with open(target, "w", encoding="utf-8") as f:
+        return write_chunks(f, blocks, chunk_size)
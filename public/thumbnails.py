@@ -0,0 +1,171 @@
+"""
+Thumbnail lokal untuk viewer.py (route /thumb/).
+
+Sumber gambar:
+- "/player/<file>.png" dibaca dari public/player, "/avatars/..." dari mirror
+  lokal image_mirror.py;
+- URL http(s) di-download sekali lalu disimpan di cache (viewer tetap jalan offline),
+  tapi hanya URL yang ada di allowed (nilai "image" dataset, lihat viewer.py), jadi
+  /thumb/ tidak bisa dipakai sebagai proxy ke host lain atau jaringan internal.
+
+Thumbnail di-crop persegi dan disimpan di THUMB_FOLDER dengan key sha256(src, size,
+mtime sumber lokal), jadi request berikutnya tinggal membaca file. Pillow opsional:
+tanpa Pillow gambar sumber dikirim apa adanya.
+"""
+import hashlib
+import os
+import urllib.request
+
+from srt_engine.config import CACHE_FOLDER
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PLAYER_FOLDER = os.path.join(BASE_DIR, "player")
+AVATAR_FOLDER = os.path.join(BASE_DIR, "avatars")
+THUMB_FOLDER = os.path.join(BASE_DIR, CACHE_FOLDER, "thumbs")
+REMOTE_FOLDER = os.path.join(THUMB_FOLDER, "remote")
+PLACEHOLDER = os.path.join(BASE_DIR, "default.svg")
+
+DEFAULT_SIZE = 150
+MIN_SIZE, MAX_SIZE = 16, 512
+FETCH_TIMEOUT = 10
+MAX_FETCH_BYTES = 10 * 1024 * 1024
+
+CONTENT_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+    ".svg": "image/svg+xml",
+}
+
+
+class ThumbnailError(Exception):
+    pass
+
+
+class ThumbnailForbidden(ThumbnailError):
+    """src bukan gambar lokal dan bukan URL gambar dari dataset."""
+
+
+def clamp_size(size):
+    try:
+        size = int(size)
+    except (TypeError, ValueError):
+        return DEFAULT_SIZE
+    return max(MIN_SIZE, min(MAX_SIZE, size))
+
+
+def content_type(path):
+    return CONTENT_TYPES.get(os.path.splitext(path)[1].lower(), "application/octet-stream")
+
+
+def _atomic_write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def local_source(src):
+    """
+    Path file untuk src "/player/x.png" atau "/avatars/aa/<hash>.jpg", None jika
+    bukan gambar lokal.
+    """
+    relative = src.lstrip("/")
+    if relative.startswith("player/"):
+        path = os.path.normpath(os.path.join(PLAYER_FOLDER, os.path.basename(src)))
+    elif relative.startswith("avatars/"):
+        path = os.path.normpath(os.path.join(BASE_DIR, relative))
+        if not path.startswith(AVATAR_FOLDER + os.sep):
+            return None
+    else:
+        return None
+    return path if os.path.isfile(path) else None
+
+
+def remote_source(url):
+    """Download url sekali ke REMOTE_FOLDER; return path file cache."""
+    name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    ext = os.path.splitext(url.split("?", 1)[0])[1].lower()
+    path = os.path.join(REMOTE_FOLDER, name + (ext if ext in CONTENT_TYPES else ".img"))
+    if os.path.exists(path):
+        return path
+    request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0 (render-mlbb viewer)"})
+    try:
+        with urllib.request.urlopen(request, timeout=FETCH_TIMEOUT) as response:
+            data = response.read(MAX_FETCH_BYTES + 1)
+    except OSError as e:
+        raise ThumbnailError(f"Gagal download {url}: {e}") from e
+    if len(data) > MAX_FETCH_BYTES:
+        raise ThumbnailError(f"Gambar terlalu besar: {url}")
+    _atomic_write(path, data)
+    return path
+
+
+def source_path(src, allowed=()):
+    """
+    Path file sumber untuk src. URL http(s) hanya di-download jika ada di allowed;
+    src lain raise ThumbnailForbidden. Gambar lokal yang hilang raise ThumbnailError.
+    """
+    path = local_source(src)
+    if path:
+        return path
+    if src.startswith(("http://", "https://")) and src in allowed:
+        return remote_source(src)
+    if src.lstrip("/").startswith(("player/", "avatars/")):
+        raise ThumbnailError(f"Gambar lokal tidak ada: {src}")
+    raise ThumbnailForbidden(f"Sumber gambar tidak diizinkan: {src}")
+
+
+def thumb_key(src, size):
+    """Key cache; untuk gambar lokal mtime ikut dihitung agar file yang diganti dibuat ulang."""
+    local = local_source(src)
+    mtime = os.stat(local).st_mtime_ns if local else 0
+    return hashlib.sha256(f"{src}|{size}|{mtime}".encode("utf-8")).hexdigest()
+
+
+def _resize(source, size, target_base):
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return None
+    with Image.open(source) as image:
+        keep_alpha = image.mode in ("RGBA", "LA", "P")
+        thumb = ImageOps.fit(image.convert("RGBA" if keep_alpha else "RGB"), (size, size))
+        target = target_base + (".png" if keep_alpha else ".jpg")
+        tmp_path = f"{target}.{os.getpid()}.tmp"
+        thumb.save(tmp_path, format="PNG" if keep_alpha else "JPEG", optimize=True, quality=85)
+    os.replace(tmp_path, target)
+    return target
+
+
+def cached_thumbnail(src, size=DEFAULT_SIZE):
+    """Path thumbnail yang sudah ada di cache, atau None."""
+    base = os.path.join(THUMB_FOLDER, thumb_key(src, clamp_size(size)))
+    for ext in (".png", ".jpg"):
+        if os.path.exists(base + ext):
+            return base + ext
+    return None
+
+
+def get_thumbnail(src, size=DEFAULT_SIZE, allowed=()):
+    """
+    Return path thumbnail (dibuat jika belum ada). Tanpa Pillow atau jika gambar
+    tidak bisa dibaca, path sumber yang dikembalikan. allowed: URL remote yang boleh
+    di-download (lihat source_path). Raise ThumbnailError jika sumber tidak ada,
+    ThumbnailForbidden jika src tidak diizinkan.
+    """
+    size = clamp_size(size)
+    cached = cached_thumbnail(src, size)
+    if cached:
+        return cached
+    base = os.path.join(THUMB_FOLDER, thumb_key(src, size))
+    source = source_path(src, allowed)
+    os.makedirs(THUMB_FOLDER, exist_ok=True)
+    try:
+        return _resize(source, size, base) or source
+    except OSError:
+        # Format tidak dikenali Pillow (mis. SVG): kirim sumbernya saja
+        return source
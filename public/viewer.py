@@ -1,12 +1,49 @@
-import os
+import asyncio
+import functools
+import hashlib
+import html
 import json
-from django.http import HttpResponse
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from itertools import islice
+from urllib.parse import urlencode
+
+from django.http import FileResponse, HttpResponseBadRequest, JsonResponse, StreamingHttpResponse
 from django.conf import settings
 from django.urls import path
 from django.core.management import execute_from_command_line
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import condition
+
+from dataset_index import load_dataset, parse_query, search
+from thumbnails import (
+    PLACEHOLDER,
+    ThumbnailError,
+    ThumbnailForbidden,
+    cached_thumbnail,
+    clamp_size,
+    content_type,
+    get_thumbnail,
+    thumb_key,
+)
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_FOLDER = os.path.join(BASE_DIR, "instagram")
+# Folder dataset yang boleh dibuka (relatif terhadap BASE_DIR)
+DATA_FOLDERS = ["instagram", "gaming", "youtube", "twitch", "tiktok"]
+
+PER_PAGE = 50
+MAX_PER_PAGE = 500
+THUMB_SIZE = 150
+# Naikkan jika HTML/JSON yang dihasilkan berubah agar ETag lama tidak dipakai browser
+VIEWER_VERSION = 1
+THUMB_MAX_AGE = 7 * 24 * 3600
+# Thread pool mode async: parse file, build index dan thumbnail jalan di sini
+VIEWER_THREADS = min(32, (os.cpu_count() or 1) + 4)
+STREAM_BATCH = 64
 
 # Konfigurasi Django minimal
 settings.configure(
@@ -20,57 +57,397 @@ settings.configure(
     }],
 )
 
+
+def list_files():
+    """Path dataset relatif (mis. "instagram/ig-id_updated.json") di semua DATA_FOLDERS."""
+    files = []
+    for folder in DATA_FOLDERS:
+        folder_path = os.path.join(BASE_DIR, folder)
+        if os.path.isdir(folder_path):
+            files.extend(f"{folder}/{f}" for f in sorted(os.listdir(folder_path)) if f.endswith(".json"))
+    return files
+
+
+def resolve_file(name):
+    """
+    Nama file dari query string -> path absolut, atau None jika di luar DATA_FOLDERS.
+    Nama tanpa folder dianggap ada di DATA_FOLDER (URL lama ?file=ig-id_updated.json).
+    """
+    if "/" not in name:
+        name = f"{os.path.basename(DATA_FOLDER)}/{name}"
+    file_path = os.path.normpath(os.path.join(BASE_DIR, name))
+    folder = os.path.relpath(os.path.dirname(file_path), BASE_DIR)
+    if folder not in DATA_FOLDERS or not file_path.endswith(".json"):
+        return None
+    return file_path
+
+
+def _data_state(request, file_paths):
+    """
+    (etag, last_modified) untuk response yang dibangun dari file_paths: dihitung dari
+    mtime/size file data + folder dataset (daftar file) + query string. Disimpan di
+    request agar fungsi etag dan last_modified tidak men-stat dua kali.
+    """
+    state = getattr(request, "_viewer_state", None)
+    if state is not None:
+        return state
+    parts = [str(VIEWER_VERSION), request.META.get("QUERY_STRING", "")]
+    latest = 0
+    paths = [os.path.join(BASE_DIR, folder) for folder in DATA_FOLDERS] + [p for p in file_paths if p]
+    for file_path in paths:
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            parts.append(f"{file_path}:missing")
+            continue
+        parts.append(f"{file_path}:{stat.st_mtime_ns}:{stat.st_size}")
+        latest = max(latest, stat.st_mtime)
+    etag = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+    state = request._viewer_state = (etag, datetime.fromtimestamp(int(latest), tz=timezone.utc))
+    return state
+
+
+def _index_paths(request):
+    selected_file = request.GET.get("file", "")
+    return [resolve_file(selected_file)] if selected_file else []
+
+
+def _index_etag(request):
+    return _data_state(request, _index_paths(request))[0]
+
+
+def _index_last_modified(request):
+    return _data_state(request, _index_paths(request))[1]
+
+
+def _int_param(request, name, default, minimum=1, maximum=None):
+    try:
+        value = int(request.GET.get(name, default))
+    except ValueError:
+        value = default
+    value = max(minimum, value)
+    return min(value, maximum) if maximum else value
+
+
+@gzip_page
+@condition(etag_func=_index_etag, last_modified_func=_index_last_modified)
 def index(request):
-    files = [f for f in os.listdir(DATA_FOLDER) if f.endswith(".json")]
-    selected_file = request.GET.get("file")
-    data, error = None, None
+    files = list_files()
+    selected_file = request.GET.get("file", "")
+    page = _int_param(request, "page", 1)
+    per_page = _int_param(request, "per_page", PER_PAGE, maximum=MAX_PER_PAGE)
+    # Kolom dari checkbox (?col=a&col=b) atau link halaman (?cols=a,b)
+    selected_columns = request.GET.getlist("col") or [c for c in request.GET.get("cols", "").split(",") if c]
+    entry, error = None, None
 
     if selected_file:
-        file_path = os.path.join(DATA_FOLDER, selected_file)
+        file_path = resolve_file(selected_file)
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if file_path is None:
+                raise FileNotFoundError(f"File tidak diizinkan: {selected_file}")
+            entry = load_dataset(file_path)
         except Exception as e:
             error = str(e)
 
-    html = f"""
+    # Response streaming: halaman dikirim per baris tabel, tidak dirangkai jadi satu string
+    return StreamingHttpResponse(
+        render_page(files, selected_file, entry, error, page, per_page, selected_columns),
+        content_type="text/html; charset=utf-8",
+    )
+
+
+def render_page(files, selected_file, entry, error, page, per_page, selected_columns):
+    options = "".join(
+        f'<option value="{html.escape(f)}" {"selected" if f == selected_file else ""}>{html.escape(f)}</option>'
+        for f in files
+    )
+    yield f"""
     <h1>📂 JSON Viewer</h1>
     <form method="get">
         <label>Pilih File JSON:</label>
         <select name="file" onchange="this.form.submit()">
             <option value="">-- pilih file --</option>
-            {''.join(
-                f'<option value="{f}" {"selected" if f == selected_file else ""}>{f}</option>'
-                for f in files
-            )}
+            {options}
         </select>
+        <input type="hidden" name="per_page" value="{per_page}">
     </form>
-    {render_table(data, error)}
     """
-    return HttpResponse(html)
+    yield from render_table(entry, error, selected_file, page, per_page, selected_columns)
+
+
+def _page_link(selected_file, page, per_page, columns, label):
+    query = {"file": selected_file, "page": page, "per_page": per_page}
+    if columns:
+        query["cols"] = ",".join(columns)
+    return f"<a href='?{html.escape(urlencode(query))}'>{label}</a>"
+
+
+def render_cell(key, val):
+    if key == "image" and isinstance(val, str) and val:
+        thumb = "/thumb/?" + urlencode({"src": val, "size": THUMB_SIZE})
+        return f"<td><img src='{html.escape(thumb)}' width='{THUMB_SIZE}' height='{THUMB_SIZE}' loading='lazy'></td>"
+    if isinstance(val, (dict, list)):
+        val = json.dumps(val, ensure_ascii=False)
+    return f"<td>{html.escape(str(val))}</td>"
+
 
-def render_table(data, error):
+def render_table(entry, error, selected_file, page, per_page, selected_columns):
     if error:
-        return f"<p style='color:red;'>❌ Error: {error}</p>"
-    if not data:
-        return ""
-    if isinstance(data, list) and isinstance(data[0], dict):
-        # Header
-        header = "".join(f"<th>{h}</th>" for h in data[0].keys())
-        rows = ""
-        for row in data:
-            cells = ""
-            for key, val in row.items():
-                if key == "image" and isinstance(val, str):
-                    cells += f"<td><img src='https://ce880219c.cloudimg.io/v7/{val}' width='150' height='150'></td>"
-                else:
-                    cells += f"<td>{val}</td>"
-            rows += f"<tr>{cells}</tr>"
-        return f"<p>✅ File valid JSON</p><table border='1' cellspacing='0' cellpadding='5'><tr>{header}</tr>{rows}</table>"
-    return f"<pre>{json.dumps(data, indent=2, ensure_ascii=False)}</pre>"
-
-urlpatterns = [path("", index)]
+        yield f"<p style='color:red;'>❌ Error: {html.escape(error)}</p>"
+        return
+    if not entry or not entry["data"]:
+        return
+    data = entry["data"]
+    if not (isinstance(data, list) and isinstance(data[0], dict)):
+        yield f"<pre>{html.escape(json.dumps(data, indent=2, ensure_ascii=False))}</pre>"
+        return
+
+    columns = [c for c in selected_columns if c in entry["columns"]] or entry["columns"]
+    total = len(data)
+    pages = max(1, -(-total // per_page))
+    page = min(page, pages)
+    start = (page - 1) * per_page
+
+    # Pilihan kolom (checkbox) + navigasi halaman
+    checkboxes = "".join(
+        f"<label><input type='checkbox' name='col' value='{html.escape(c)}' "
+        f"{'checked' if c in columns else ''}> {html.escape(c)}</label> "
+        for c in entry["columns"]
+    )
+    nav = []
+    if page > 1:
+        nav.append(_page_link(selected_file, page - 1, per_page, selected_columns, "← Prev"))
+    nav.append(f"Halaman {page}/{pages} ({total} baris)")
+    if page < pages:
+        nav.append(_page_link(selected_file, page + 1, per_page, selected_columns, "Next →"))
+    yield (
+        "<p>✅ File valid JSON</p>"
+        "<form method='get'>"
+        f"<input type='hidden' name='file' value='{html.escape(selected_file)}'>"
+        f"<input type='hidden' name='per_page' value='{per_page}'>"
+        f"{checkboxes}"
+        "<button type='submit'>Tampilkan kolom</button></form>"
+        f"<p>{' | '.join(nav)}</p>"
+    )
+
+    yield "<table border='1' cellspacing='0' cellpadding='5'><tr>"
+    yield "".join(f"<th>{html.escape(c)}</th>" for c in columns) + "</tr>"
+    for row in data[start:start + per_page]:
+        if isinstance(row, dict):
+            yield "<tr>" + "".join(render_cell(c, row.get(c, "")) for c in columns) + "</tr>\n"
+    yield f"</table><p>{' | '.join(nav)}</p>"
+
+
+def api_files(request):
+    return JsonResponse({"files": list_files()})
+
+
+def _query_files(request):
+    """Dataset yang dicari: ?files=a.json,b.json, ?folder=gaming,youtube, atau semua."""
+    files = list_files()
+    if request.GET.get("files"):
+        names = [f for f in request.GET["files"].split(",") if f]
+        return [(name, resolve_file(name)) for name in names]
+    if request.GET.get("folder"):
+        folders = set(request.GET["folder"].split(","))
+        files = [f for f in files if f.split("/", 1)[0] in folders]
+    return [(f, resolve_file(f)) for f in files]
+
+
+def _search_paths(request):
+    return [file_path for _, file_path in _query_files(request)]
+
+
+def _search_etag(request):
+    return _data_state(request, _search_paths(request))[0]
+
+
+def _search_last_modified(request):
+    return _data_state(request, _search_paths(request))[1]
+
+
+@gzip_page
+@condition(etag_func=_search_etag, last_modified_func=_search_last_modified)
+def api_search(request):
+    """
+    JSON search/filter/sort lintas dataset, dilayani dari index per file.
+    Contoh: /api/search?folder=gaming&team=rrq&date_after=2022&sort=-date
+            /api/search?sort=-followers_count&limit=20
+            /api/search?roles=jungle
+    """
+    started = time.perf_counter()
+    try:
+        query = parse_query(request.GET)
+        datasets = []
+        for name, file_path in _query_files(request):
+            if file_path is None:
+                raise ValueError(f"File tidak diizinkan: {name}")
+            datasets.append((name, load_dataset(file_path)))
+    except (ValueError, OSError) as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    total, results = search(datasets, query)
+    return JsonResponse({
+        "total": total,
+        "offset": query["offset"],
+        "count": len(results),
+        "took_ms": round((time.perf_counter() - started) * 1000, 2),
+        "results": results,
+    }, json_dumps_params={"ensure_ascii": False})
+
+
+# (state mtime/size dataset, frozenset URL image) untuk allowlist /thumb/
+_dataset_images = (None, frozenset())
+_dataset_images_lock = threading.Lock()
+
+
+def dataset_images():
+    """
+    Semua nilai "image" di dataset DATA_FOLDERS: hanya URL ini yang boleh di-download
+    oleh /thumb/. Dihitung ulang hanya jika ada file dataset yang berubah.
+    """
+    global _dataset_images
+    state = []
+    for name in list_files():
+        try:
+            stat = os.stat(os.path.join(BASE_DIR, name))
+        except FileNotFoundError:
+            continue
+        state.append((name, stat.st_mtime_ns, stat.st_size))
+    state = tuple(state)
+    with _dataset_images_lock:
+        if _dataset_images[0] == state:
+            return _dataset_images[1]
+    images = set()
+    for name, _, _ in state:
+        try:
+            data = load_dataset(os.path.join(BASE_DIR, name))["data"]
+        except (OSError, ValueError):
+            continue
+        if isinstance(data, list):
+            images.update(row["image"] for row in data
+                          if isinstance(row, dict) and isinstance(row.get("image"), str) and row["image"])
+    images = frozenset(images)
+    with _dataset_images_lock:
+        _dataset_images = (state, images)
+    return images
+
+
+def _thumb_etag(request):
+    # Hanya thumbnail yang sudah di-cache yang diberi ETag; placeholder tidak boleh ikut tersimpan
+    src, size = request.GET.get("src", ""), clamp_size(request.GET.get("size"))
+    return thumb_key(src, size) if cached_thumbnail(src, size) else None
+
+
+@condition(etag_func=_thumb_etag)
+def thumb(request):
+    """
+    Thumbnail persegi dari cache lokal: /thumb/?src=<image>&size=150.
+    src harus gambar lokal (/player, /avatars) atau URL "image" dari dataset (400 jika
+    bukan). Sumber yang tidak tersedia (offline, URL mati) diganti placeholder default.svg.
+    """
+    src = request.GET.get("src", "")
+    try:
+        thumb_path = get_thumbnail(src, request.GET.get("size"), allowed=dataset_images())
+    except ThumbnailForbidden as e:
+        return HttpResponseBadRequest(str(e))
+    except ThumbnailError:
+        response = FileResponse(open(PLACEHOLDER, "rb"), content_type="image/svg+xml")
+        response["Cache-Control"] = "no-cache"
+        return response
+    response = FileResponse(open(thumb_path, "rb"), content_type=content_type(thumb_path))
+    response["Cache-Control"] = f"public, max-age={THUMB_MAX_AGE}"
+    return response
+
+
+urlpatterns = [
+    path("", index),
+    path("api/files", api_files),
+    path("api/search", api_search),
+    path("thumb/", thumb),
+]
+
+
+# --- Mode async (ASGI) ---------------------------------------------------------
+# View di atas tetap sync; di mode ASGI setiap view dijalankan di thread pool
+# sendiri (bukan thread tunggal sync_to_async), dan isi response streaming juga
+# diambil dari pool per batch, jadi beberapa editor yang membuka dataset berbeda
+# tidak saling menunggu.
+
+_executor = None
+
+
+def _pool():
+    global _executor
+    if _executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        _executor = ThreadPoolExecutor(max_workers=VIEWER_THREADS, thread_name_prefix="viewer")
+    return _executor
+
+
+def _next_batch(iterator):
+    return list(islice(iterator, STREAM_BATCH))
+
+
+async def _iterate_in_pool(content):
+    loop = asyncio.get_running_loop()
+    iterator = iter(content)
+    while True:
+        batch = await loop.run_in_executor(_pool(), _next_batch, iterator)
+        if not batch:
+            return
+        yield b"".join(chunk.encode("utf-8") if isinstance(chunk, str) else chunk for chunk in batch)
+
+
+def offload(view):
+    """Bungkus view sync menjadi view async yang dijalankan di thread pool viewer."""
+    @functools.wraps(view)
+    async def async_view(request, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(_pool(), functools.partial(view, request, *args, **kwargs))
+        if response.streaming:
+            response.streaming_content = _iterate_in_pool(response.streaming_content)
+        return response
+    return async_view
+
+
+async_urlpatterns = [
+    path("", offload(index)),
+    path("api/files", offload(api_files)),
+    path("api/search", offload(api_search)),
+    path("thumb/", offload(thumb)),
+]
+
+
+def asgi_application():
+    """Factory ASGI: uvicorn --factory viewer:asgi_application"""
+    global urlpatterns
+    urlpatterns = async_urlpatterns
+    from django.core.asgi import get_asgi_application
+
+    return get_asgi_application()
+
+
+def serve_async(argv):
+    import argparse
+
+    global VIEWER_THREADS
+    parser = argparse.ArgumentParser(prog="python viewer.py serve-async", description="Run the viewer on ASGI")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--threads", type=int, default=VIEWER_THREADS, help="Thread pool for file/thumbnail work")
+    args = parser.parse_args(argv)
+    VIEWER_THREADS = args.threads
+    try:
+        import uvicorn
+    except ImportError:
+        sys.exit("uvicorn belum terpasang: pip install uvicorn (atau jalankan viewer:asgi_application dengan server ASGI lain)")
+    uvicorn.run(asgi_application(), host=args.host, port=args.port, log_level="warning")
+
 
 if __name__ == "__main__":
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", __name__)
-    execute_from_command_line()
+    if sys.argv[1:2] == ["serve-async"]:
+        serve_async(sys.argv[2:])
+    else:
+        execute_from_command_line()
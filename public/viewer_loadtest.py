@@ -0,0 +1,109 @@
+"""
+Load test sederhana untuk viewer.py: beberapa client paralel memukul campuran
+halaman dataset, search API dan thumbnail, lalu melaporkan requests/s dan
+latency (p50/p95/max). Hanya memakai standard library.
+
+Contoh (server jalan di terminal lain):
+    python viewer.py runserver 8000                # mode sync
+    python viewer.py serve-async --port 8001       # mode ASGI
+    python viewer_loadtest.py --url http://127.0.0.1:8001 --concurrency 8 --requests 400
+"""
+import argparse
+import http.client
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_PATHS = [
+    "/?file=instagram/ig-id_updated.json",
+    "/?file=instagram/ig-global_updated.json&page=2",
+    "/?file=youtube/global.json&per_page=100",
+    "/?file=gaming/rrq_hoshi.json",
+    "/api/search?sort=-followers_count&limit=20",
+    "/api/search?folder=gaming&team=rrq&date_after=2022&sort=-date",
+    "/api/search?roles=jungle",
+    "/thumb/?src=/player/AE_Bale.png&size=150",
+]
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _client(base, paths, counter, lock, latencies, errors, headers):
+    parts = urlsplit(base)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+    while True:
+        with lock:
+            if counter[0] <= 0:
+                break
+            counter[0] -= 1
+            n = counter[0]
+        path = paths[n % len(paths)]
+        started = time.perf_counter()
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            if response.status >= 400:
+                errors.append(f"{response.status} {path}")
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(f"{type(e).__name__} {path}")
+            conn.close()
+            conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - started)
+    conn.close()
+
+
+def run_load_test(base, paths=DEFAULT_PATHS, concurrency=8, requests=400, gzip=True):
+    """Return dict hasil: requests, errors, seconds, rps, p50_ms, p95_ms, max_ms."""
+    counter, lock = [requests], threading.Lock()
+    latencies, errors = [], []
+    headers = {"Accept-Encoding": "gzip"} if gzip else {}
+    threads = [
+        threading.Thread(target=_client, args=(base, paths, counter, lock, latencies, errors, headers))
+        for _ in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": elapsed,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "max_ms": max(latencies) * 1000 if latencies else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test viewer.py (requests/s dan p95 latency)")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Base URL server viewer")
+    parser.add_argument("--concurrency", type=int, default=8, help="Jumlah client paralel")
+    parser.add_argument("--requests", type=int, default=400, help="Total request")
+    parser.add_argument("--path", action="append", dest="paths", help="Path yang dipukul (boleh berulang)")
+    parser.add_argument("--no-gzip", action="store_true", help="Jangan kirim Accept-Encoding: gzip")
+    args = parser.parse_args()
+
+    result = run_load_test(args.url, args.paths or DEFAULT_PATHS, args.concurrency, args.requests, not args.no_gzip)
+    print(f"🚀 {args.url} | {args.concurrency} clients")
+    print(f"   - Requests: {result['requests']} in {result['seconds']:.2f}s ({result['rps']:.1f} req/s)")
+    print(f"   - Latency: p50 {result['p50_ms']:.1f}ms | p95 {result['p95_ms']:.1f}ms | max {result['max_ms']:.1f}ms")
+    if result["errors"]:
+        print(f"❌ {len(result['errors'])} errors, contoh: {result['errors'][:3]}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
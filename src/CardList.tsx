@@ -13,6 +13,7 @@ import {
 import React, { useMemo, useEffect, useState } from "react";
 import { loadFont as loadRubik } from "@remotion/google-fonts/Rubik";
 import { rawData, validateRawDatas } from "./types/schema";
+import { compareRawData } from "./utils/sortRecords";
 import { Carding } from "./components/CardPlayerMLBB";
 import { CONFIG, getBackgroundColor, getActiveDataSource } from "./config";
 import { getTriggerFrame } from "./utils/triggerFrame";
@@ -95,13 +96,17 @@ const getStaticCardPosition = (index: number, screenWidth: number) => {
   return startPosition + index * 650;
 };
 
-type PlayerListProps = {
+export type PlayerListProps = {
   cardsToShow: number;
   durasiPerCardDetik: number;
   introDelay: number;
   endingDuration: number;
   backgroundColor?: string;
   dataSourcePath?: string;
+  // Render plan (public/render_plans/...), dibaca di calculateMetadata Root.tsx
+  planPath?: string;
+  // Records yang sudah divalidasi dan diurutkan (dari render plan)
+  records?: rawData[];
 };
 
 /**
@@ -110,6 +115,7 @@ type PlayerListProps = {
  * @param durasiPerCardDetik - Durasi tampilan per kartu dalam detik
  * @param introDelay - Delay sebelum intro dimulai
  * @param endingDuration - Durasi ending sequence
+ * @param records - Data dari render plan; jika ada, fetch + validasi + sort dilewati
  */
 export const CardList: React.FC<PlayerListProps> = ({ 
   cardsToShow = CONFIG.cardsToShow, 
@@ -118,6 +124,7 @@ export const CardList: React.FC<PlayerListProps> = ({
   endingDuration = CONFIG.endingDuration * CONFIG.FPS, // Convert seconds to frames
   backgroundColor = getBackgroundColor(),
   dataSourcePath,
+  records,
 }) => {
   const frame = useCurrentFrame();
   const { fps, width, height, } = useVideoConfig();
@@ -127,9 +134,13 @@ export const CardList: React.FC<PlayerListProps> = ({
 
   /**
    * Effect untuk memproses dan memvalidasi data pemain
-   * Mengurutkan berdasarkan: followers_count (terbanyak di akhir), date (terlama di atas), name (opsi lain jika keduanya sama)
+   * Mengurutkan dengan compareRawData: followers_count (terbanyak di akhir), date (terbaru di atas), name
    */
   useEffect(() => {
+    if (records) {
+      continueRender(handle);
+      return;
+    }
     const processData = async () => {
       try {
         // Load JSON from public using configurable data source
@@ -139,31 +150,7 @@ export const CardList: React.FC<PlayerListProps> = ({
         const response = await fetch(jsonPath);
         const json = await response.json();
         const data = validateRawDatas(json)
-        .sort((a: rawData, b: rawData) => {
-          // 1) Utamakan followers_count (semakin besar semakin di akhir agar "terbanyak di akhir" seperti semula)
-          const aFollowers = typeof a.followers_count === 'number' ? a.followers_count : null;
-          const bFollowers = typeof b.followers_count === 'number' ? b.followers_count : null;
-          if (aFollowers !== null && bFollowers !== null && aFollowers !== bFollowers) {
-            return aFollowers - bFollowers; // ascending → terbanyak di akhir
-          }
-
-          // 2) Jika followers_count tidak membedakan (sama atau salah satu/both tidak ada), pakai date ascending (terlama di atas)
-          const aHasDate = Boolean(a.date);
-          const bHasDate = Boolean(b.date);
-          if (aHasDate && bHasDate) {
-            const aTime = new Date(a.date as string).getTime();
-            const bTime = new Date(b.date as string).getTime();
-            if (aTime !== bTime) return bTime - aTime;
-          } else if (aHasDate !== bHasDate) {
-            // Yang punya date didahulukan
-            return aHasDate ? -1 : 1;
-          }
-
-          // 3) Fallback: urutkan berdasarkan name
-          const aName = a.name || '';
-          const bName = b.name || '';
-          return aName.localeCompare(bName);
-        });
+        .sort(compareRawData);
         setValidatedData(data);
         if (CONFIG.showDebugInfo) {
           console.log("Active data source:", sourcePath);
@@ -176,7 +163,7 @@ export const CardList: React.FC<PlayerListProps> = ({
       }
     };
     processData();
-  }, [handle]);
+  }, [handle, dataSourcePath, records]);
 
   // Perhitungan durasi dan timing untuk animasi
   const durationPerCard = durasiPerCardDetik * fps; // Durasi per kartu dalam frame
@@ -191,7 +178,7 @@ export const CardList: React.FC<PlayerListProps> = ({
   const endingStartFrame = introDelay + totalDuration;
 
   // Memoize data untuk performa, hanya ambil jumlah kartu yang diperlukan
-  const memoizedData = useMemo(() => validatedData.slice(0, cardsToShow), [validatedData, cardsToShow]);
+  const memoizedData = useMemo(() => (records ?? validatedData).slice(0, cardsToShow), [records, validatedData, cardsToShow]);
 
   /**
    * Perhitungan posisi scroll horizontal untuk efek sliding kartu
@@ -1,8 +1,37 @@
-import { Composition } from "remotion";
-import { CardList } from "./CardList";
-import { CONFIG, getTotalDuration, getTotalVideoDuration, getDurationInSeconds } from "./config";
+import { CalculateMetadataFunction, Composition, staticFile } from "remotion";
+import { CardList, PlayerListProps } from "./CardList";
+import { RENDER_PLAN_VERSION, RenderPlan } from "./types/schema";
+import { CONFIG, getTotalDuration, getTotalVideoDuration, getDurationInSeconds, getVideoDurationForProps } from "./config";
 import './index.css'; 
 
+// durationInFrames mengikuti input props (mis. cardsToShow dari public/render_queue.py).
+// Dengan planPath (public/render_plan.py) jumlah kartu, durasi dan records diambil
+// dari plan, jadi render worker tidak perlu fetch + validasi + sort sendiri.
+const calculateMetadata: CalculateMetadataFunction<PlayerListProps> = async ({ props }) => {
+  if (props.planPath) {
+    const response = await fetch(staticFile(props.planPath));
+    const plan: RenderPlan = await response.json();
+    if (plan.version !== RENDER_PLAN_VERSION) {
+      throw new Error(`Render plan ${props.planPath} versi ${plan.version}, jalankan ulang public/render_plan.py`);
+    }
+    if (plan.fps !== CONFIG.FPS) {
+      throw new Error(`Render plan ${props.planPath} dibuat untuk ${plan.fps} fps, composition ${CONFIG.FPS} fps`);
+    }
+    return {
+      durationInFrames: plan.durationInFrames,
+      props: { ...props, cardsToShow: plan.cardsToShow, records: plan.records },
+    };
+  }
+  return {
+    durationInFrames: Math.round(getVideoDurationForProps({
+      cardsToShow: props.cardsToShow,
+      durasiPerCardDetik: props.durasiPerCardDetik,
+      introDelay: props.introDelay,
+      endingDuration: props.endingDuration,
+    })),
+  };
+};
+
 export const RemotionRoot: React.FC = () => {
   const totalDuration = getTotalDuration();
   const TOTAL_DURATION = getTotalVideoDuration();
@@ -22,6 +51,7 @@ export const RemotionRoot: React.FC = () => {
         id="DataListCard"
         component={CardList}
         durationInFrames={Math.round(TOTAL_DURATION)}
+        calculateMetadata={calculateMetadata}
         fps={CONFIG.FPS}
         width={CONFIG.WIDTH}
         height={CONFIG.HEIGHT}
@@ -38,6 +68,7 @@ export const RemotionRoot: React.FC = () => {
         id="MLBBPlayers"
         component={CardList}
         durationInFrames={Math.round(TOTAL_DURATION)}
+        calculateMetadata={calculateMetadata}
         fps={CONFIG.FPS}
         width={CONFIG.WIDTH}
         height={CONFIG.HEIGHT}
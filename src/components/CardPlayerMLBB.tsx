@@ -13,6 +13,7 @@ import { useVideoConfig, staticFile, Img, useCurrentFrame, interpolate } from "r
 import { FadeInOnFrame } from "../plugin/FadeInOnFrame";
 import { ScrollText } from "../plugin/ScrollText";
 import { TypingOnFrame } from "../plugin/TypingOnFrame";
+import { fallbackToNextSource, usePlayerImageSources } from "../utils/playerImage";
 
 // Load fonts - using default loading to avoid TypeScript errors
 const { fontFamily: robotoFont } = loadRoboto();
@@ -36,6 +37,8 @@ export const Carding: React.FC<CardingProps> = ({ person, style, triggerFrame })
     if (url.startsWith('http://') || url.startsWith('https://')) return url;
     return staticFile(url);
   };
+  // Varian seukuran kartu dari public/optimize_player.py, PNG asli sebagai fallback
+  const playerImageSources = usePlayerImageSources(person.image, "player", getSrc(person.image));
 
   return (
     <div
@@ -125,7 +128,7 @@ export const Carding: React.FC<CardingProps> = ({ person, style, triggerFrame })
               
               return (
                 <Img
-                  src={getSrc(person.image)}
+                  src={playerImageSources[0]}
                   alt={person.name}
                   className="w-full h-full object-contain"
                   style={{
@@ -135,10 +138,7 @@ export const Carding: React.FC<CardingProps> = ({ person, style, triggerFrame })
                     opacity,
                     zIndex: 1
                   }}
-                  onError={(e) => {
-                    const target = e.target as HTMLImageElement;
-                    target.src = staticFile('default.svg');
-                  }}
+                  onError={fallbackToNextSource(playerImageSources)}
                 />
               );
             })()}
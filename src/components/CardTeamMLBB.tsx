@@ -12,6 +12,7 @@ import { useVideoConfig, Img } from "remotion";
 import { FadeInOnFrame } from "../plugin/FadeInOnFrame";
 import { TypingOnFrame } from "../plugin/TypingOnFrame";
 import { getImageSource } from "../utils/imageProxy";
+import { fallbackToNextSource, usePlayerImageSources } from "../utils/playerImage";
 
 // Load fonts
 const { fontFamily: robotoFont } = loadRoboto();
@@ -30,6 +31,8 @@ export const Carding: React.FC<CardingProps> = ({ person, style, triggerFrame })
   const Name = person.name || "";
 
   const fadeInDuration = 20;
+  // Varian seukuran kartu dari public/optimize_player.py, gambar asli sebagai fallback
+  const teamImageSources = usePlayerImageSources(person.image, "team", getImageSource(person.image || ""));
 
   return (
     <div
@@ -59,7 +62,7 @@ export const Carding: React.FC<CardingProps> = ({ person, style, triggerFrame })
           {/* Image */}
           <div className="absolute top-0 left-0 h-150 flex items-center justify-center overflow-hidden" style={{ position: 'relative', padding: '1.5em' }}>
             <Img
-              src={getImageSource(person.image || "")}
+              src={teamImageSources[0]}
               alt={person.name}
               className="w-full h-full object-contain bg-white rounded-lg"
               style={{
@@ -71,6 +74,7 @@ export const Carding: React.FC<CardingProps> = ({ person, style, triggerFrame })
                 maxWidth: '99%',
                 objectFit: 'contain',
               }}
+              onError={fallbackToNextSource(teamImageSources)}
             />
           </div>
 
@@ -104,6 +104,17 @@ export const getTotalVideoDuration = () => {
   return CONFIG.introDelay + totalDuration + endingDurationFrames;
 };
 
+// Durasi dari props composition (endingDuration dalam frame), dipakai calculateMetadata
+// di Root.tsx agar input props --props={"cardsToShow": ...} ikut mengubah panjang video
+export const getVideoDurationForProps = (props: {
+  cardsToShow: number;
+  durasiPerCardDetik: number;
+  introDelay: number;
+  endingDuration: number;
+}) => {
+  return props.introDelay + CONFIG.FPS * props.durasiPerCardDetik * props.cardsToShow + props.endingDuration;
+};
+
 export const getDurationInSeconds = (frames: number) => {
   return frames / CONFIG.FPS;
 };
@@ -32,12 +32,29 @@ export type rawData = z.infer<typeof rawDataSchema>;
 // Schema untuk array data pemain bola
 export const rawDatasSchema = z.array(rawDataSchema);
 
+// Versi format plan yang didukung (PLAN_VERSION di public/srt_engine/plan.py)
+export const RENDER_PLAN_VERSION = 2;
+
+// Record payload plan: hanya field yang dipakai kartu, tanggal juga sebagai epoch ms
+export type RenderRecord = rawData & { date_ms?: number | null };
+
+// Render plan dari public/render_plan.py: records sudah divalidasi dan diurutkan
+export type RenderPlan = {
+  version: number;
+  source: string;
+  fps: number;
+  card: string;
+  cardsToShow: number;
+  durationInFrames: number;
+  records: RenderRecord[];
+};
+
 // Fungsi untuk memvalidasi data dengan debugging
 export const validateRawDatas = (data: unknown) => {
   try {
-    console.log("Validating data:", data);
     const validatedData = rawDatasSchema.parse(data);
-    console.log("Validation successful:", validatedData);
+    // Hanya jumlah record; log seluruh dataset memperlambat setiap render worker
+    console.log(`Validation successful: ${validatedData.length} records`);
     return validatedData;
   } catch (error) {
     console.error("Validation error:", error);
@@ -29,6 +29,8 @@ export function withCloudImgCrop(url: string) {
 
 export function getImageSource(url: string | undefined) {
   if (!url) return staticFile('default.svg');
+  // Path lokal di public/ (mis. mirror /avatars/... dari image_mirror.py)
+  if (url.startsWith('/')) return staticFile(url);
   
   // Normalize URL - tambahkan https:// jika tidak ada protocol
   let normalizedUrl = url;
@@ -51,6 +53,13 @@ export function getImageSource(url: string | undefined) {
 // Fallback function untuk image yang gagal load
 export function getImageSourceWithFallback(url: string | undefined) {
   if (!url) return staticFile('default.svg');
+  if (url.startsWith('/')) {
+    return {
+      primary: staticFile(url),
+      fallback: staticFile(url),
+      isYouTube: false
+    };
+  }
   
   // Normalize URL - tambahkan https:// jika tidak ada protocol
   let normalizedUrl = url;
@@ -0,0 +1,86 @@
+import React, { useEffect, useState } from "react";
+import { continueRender, delayRender, staticFile } from "remotion";
+
+/**
+ * Varian gambar player/*.png seukuran area gambar kartu, dibuat oleh
+ * public/optimize_player.py (WebP + PNG fallback). Manifest memetakan path
+ * "image" di dataset ("/player/AE_Bale.png") ke varian per layout kartu.
+ * Tanpa manifest (optimizer belum dijalankan) kartu memakai gambar aslinya.
+ */
+export const PLAYER_MANIFEST = "player/optimized/manifest.json";
+
+export type PlayerCardLayout = "player" | "team";
+
+type PlayerVariant = {
+  width: number;
+  height: number;
+  webp?: string;
+  png?: string;
+  avif?: string;
+};
+
+type PlayerManifest = {
+  images?: Record<string, { variants?: Partial<Record<PlayerCardLayout, PlayerVariant>> }>;
+};
+
+// undefined = belum di-load, null = manifest tidak ada / gagal dibaca
+let manifest: PlayerManifest | null | undefined;
+let loading: Promise<PlayerManifest | null> | null = null;
+
+const loadPlayerManifest = (): Promise<PlayerManifest | null> => {
+  if (!loading) {
+    loading = fetch(staticFile(PLAYER_MANIFEST))
+      .then((response) => (response.ok ? response.json() : null))
+      .catch(() => null)
+      .then((data: PlayerManifest | null) => {
+        manifest = data;
+        return data;
+      });
+  }
+  return loading;
+};
+
+/**
+ * Urutan src untuk gambar kartu: varian WebP, varian PNG, lalu original (src
+ * yang sudah di-resolve komponen). Hanya gambar lokal /player/... yang punya varian.
+ */
+export const playerImageSources = (
+  image: string | undefined,
+  layout: PlayerCardLayout,
+  original: string,
+  loaded: PlayerManifest | null | undefined = manifest,
+): string[] => {
+  if (!image || image.startsWith("http://") || image.startsWith("https://")) return [original];
+  const variant = loaded?.images?.["/" + image.replace(/^\/+/, "")]?.variants?.[layout];
+  const variants = [variant?.webp, variant?.png].filter((src): src is string => Boolean(src));
+  return [...variants.map((src) => staticFile(src)), original];
+};
+
+/** playerImageSources yang menunggu (delayRender) manifest di-load sekali untuk semua kartu. */
+export const usePlayerImageSources = (
+  image: string | undefined,
+  layout: PlayerCardLayout,
+  original: string,
+): string[] => {
+  const [loaded, setLoaded] = useState(manifest);
+  const [handle] = useState(() => (manifest === undefined ? delayRender(`Loading ${PLAYER_MANIFEST}`) : null));
+
+  useEffect(() => {
+    if (handle === null) return;
+    loadPlayerManifest().then((data) => {
+      setLoaded(data);
+      continueRender(handle);
+    });
+  }, [handle]);
+
+  return playerImageSources(image, layout, original, loaded);
+};
+
+/** onError untuk <Img>: pindah ke src berikutnya (WebP -> PNG -> original -> default.svg). */
+export const fallbackToNextSource = (sources: string[]) => (e: React.SyntheticEvent<HTMLImageElement>) => {
+  const target = e.currentTarget;
+  const next = Number(target.dataset.fallback ?? "0") + 1;
+  if (next > sources.length) return;
+  target.dataset.fallback = String(next);
+  target.src = sources[next] ?? staticFile("default.svg");
+};
@@ -0,0 +1,38 @@
+import { rawData } from "../types/schema";
+
+/**
+ * Comparator urutan kartu CardList: followers_count ascending (terbanyak di akhir),
+ * lalu yang punya date didahulukan dengan date terbaru di atas, lalu name.
+ *
+ * Urutan yang sama dipakai subtitle dan render plan (CARDLIST_ORDER di
+ * public/srt_engine/ordering.py). public/sort_parity.py menjalankan isi fungsi di
+ * antara marker parity:begin/end apa adanya di node, jadi tulis bagian itu tanpa
+ * sintaks khusus TypeScript.
+ */
+export const compareRawData = (a: rawData, b: rawData): number => {
+  // parity:begin
+  // 1) Utamakan followers_count (semakin besar semakin di akhir agar "terbanyak di akhir")
+  const aFollowers = typeof a.followers_count === 'number' ? a.followers_count : null;
+  const bFollowers = typeof b.followers_count === 'number' ? b.followers_count : null;
+  if (aFollowers !== null && bFollowers !== null && aFollowers !== bFollowers) {
+    return aFollowers - bFollowers; // ascending → terbanyak di akhir
+  }
+
+  // 2) Jika followers_count tidak membedakan (sama atau salah satu/both tidak ada), pakai date (terbaru di atas)
+  const aHasDate = Boolean(a.date);
+  const bHasDate = Boolean(b.date);
+  if (aHasDate && bHasDate) {
+    const aTime = new Date(String(a.date)).getTime();
+    const bTime = new Date(String(b.date)).getTime();
+    if (aTime !== bTime) return bTime - aTime;
+  } else if (aHasDate !== bHasDate) {
+    // Yang punya date didahulukan
+    return aHasDate ? -1 : 1;
+  }
+
+  // 3) Fallback: urutkan berdasarkan name
+  const aName = a.name || '';
+  const bName = b.name || '';
+  return aName.localeCompare(bName);
+  // parity:end
+};